@@ -251,30 +251,19 @@ class AIWorkflowProfileAdmin(admin.ModelAdmin):
             return "-"
 
         from openedx_ai_extensions.workflows.template_utils import (  # pylint: disable=import-outside-toplevel
-            get_template_directories,
-            is_safe_template_path,
+            find_template_file,
         )
 
-        if not is_safe_template_path(obj.base_filepath):
+        # Resolve the file once instead of validating and then re-walking the template dirs
+        full_path = find_template_file(obj.base_filepath)
+        if full_path is None:
             return format_html(
                 '<div class="ai-admin-preview ai-admin-preview--error">'
                 "<strong>Error:</strong> Invalid or unsafe template path"
                 "</div>"
             )
 
-        file_content = None
-        for base_dir in get_template_directories():
-            full_path = base_dir / obj.base_filepath
-            if full_path.exists():
-                file_content = full_path.read_text(encoding="utf-8")
-                break
-
-        if file_content is None:
-            return format_html(
-                '<div class="ai-admin-preview ai-admin-preview--error">'
-                "<strong>Error:</strong> Template file not found"
-                "</div>"
-            )
+        file_content = full_path.read_text(encoding="utf-8")
 
         preview_id = f"base-template-{obj.pk or 'new'}"
 
@@ -153,27 +153,24 @@ class PromptTemplateUpdateSerializer(serializers.ModelSerializer):
         return super().validate(attrs)
 
 
-class AIWorkflowProfileSerializer(serializers.Serializer):
+def serialize_profile(scope):
     """
-    Serializer for AIWorkflowProfile data
-    Simple serializer to pass profile config from backend to frontend
-    Exposes only the UIComponents dict from the profile
-    """
-
-    course_id = serializers.CharField(allow_null=True, required=False)
-    ui_components = serializers.SerializerMethodField()
+    Serialize the UI-facing data of a resolved AIWorkflowScope.
 
-    def get_ui_components(self, obj):
-        """Extract UIComponents from actuator_config"""
-        return obj.profile.get_ui_components()
+    A plain function rather than a DRF Serializer: the payload is two read-only
+    fields, so field binding and reflection would dominate the cost.
 
-    def create(self, validated_data):
-        """Read-only serializer — creation not supported."""
-        raise NotImplementedError("AIWorkflowProfileSerializer is read-only")
+    Args:
+        scope: AIWorkflowScope returned by ``AIWorkflowScope.get_profile``.
 
-    def update(self, instance, validated_data):
-        """Read-only serializer — update not supported."""
-        raise NotImplementedError("AIWorkflowProfileSerializer is read-only")
+    Returns:
+        dict: ``course_id`` (string or None) and the profile's ``ui_components``.
+    """
+    course_id = scope.course_id
+    return {
+        "course_id": None if course_id is None else str(course_id),
+        "ui_components": scope.profile.get_ui_components(),
+    }
 
 
 class AIWorkflowScopeSerializer(serializers.Serializer):
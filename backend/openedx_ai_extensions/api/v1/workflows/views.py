@@ -3,13 +3,16 @@ AI Workflows API Views
 Refactored to use Django models and workflow orchestrators
 """
 
+import hashlib
 import json
 import logging
 from datetime import datetime, timezone
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.http import JsonResponse, StreamingHttpResponse
 from django.utils.decorators import method_decorator
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -23,13 +26,28 @@ from openedx_ai_extensions.workflows.models import AIWorkflowScope
 
 from .serializers import (
     AIWorkflowProfileListSerializer,
-    AIWorkflowProfileSerializer,
     PromptTemplateSerializer,
     PromptTemplateUpdateSerializer,
+    serialize_profile,
 )
 
 logger = logging.getLogger(__name__)
 
+# Resolved UI configs are also dropped whenever a profile or scope changes
+# (see ``receivers``); the timeout bounds staleness from template file edits.
+_UI_CONFIG_CACHE_TIMEOUT = 600
+
+
+def _ui_config_etag(response_data):
+    """
+    Return a quoted ETag for a UI config payload.
+
+    Computed from the payload without its timestamp, so it changes only when
+    the resolved configuration does.
+    """
+    payload_json = json.dumps(response_data, sort_keys=True, default=str)
+    return quote_etag(hashlib.sha256(payload_json.encode("utf-8")).hexdigest())
+
 
 class AIGenericWorkflowView(APIView):
     """
@@ -91,26 +109,31 @@ class AIWorkflowProfileView(APIView):
         Retrieve workflow configuration for a given action and context
         """
 
-        # Get workflow configuration profile
         context = get_context_from_request(request)
-        profile = AIWorkflowScope.get_profile(**context)
-
-        if not profile:
-            # No profile found - return empty response so UI doesn't show components
-            return Response(
-                {
-                    "status": "no_config",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                status=status.HTTP_200_OK,
-            )
-
-        serializer = AIWorkflowProfileSerializer(profile)
-
-        response_data = serializer.data
-        response_data["timestamp"] = datetime.now().isoformat()
-
-        return Response(response_data, status=status.HTTP_200_OK)
+        cache_key = AIWorkflowScope.ui_config_cache_key(context)
+        cached = cache.get(cache_key)
+
+        if cached is None:
+            # Get workflow configuration profile
+            profile = AIWorkflowScope.get_profile(**context)
+            if profile:
+                response_data = serialize_profile(profile)
+            else:
+                # No profile found - return empty response so UI doesn't show components
+                response_data = {"status": "no_config"}
+            etag = _ui_config_etag(response_data)
+            cache.set(cache_key, (response_data, etag), _UI_CONFIG_CACHE_TIMEOUT)
+        else:
+            response_data, etag = cached
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        return Response(
+            {**response_data, "timestamp": datetime.now().isoformat()},
+            status=status.HTTP_200_OK,
+            headers={"ETag": etag},
+        )
 
 
 class AIWorkflowProfilesListView(APIView):
@@ -0,0 +1,30 @@
+"""
+Refresh the stored effective configuration of AI workflow profiles.
+"""
+from django.core.management.base import BaseCommand
+
+from openedx_ai_extensions.workflows.models import AIWorkflowProfile
+
+
+class Command(BaseCommand):
+    """
+    Recompile every profile whose stored configuration is missing or stale.
+
+    Profiles are compiled on save and after ``migrate``, but a template file
+    whose contents change on disk only changes the fingerprint. Until the
+    next compile, such profiles compute their merged config in memory on
+    every load.
+    """
+
+    help = "Recompile AI workflow profiles whose stored effective configuration is missing or stale."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompile every profile, even if its stored configuration is up to date.",
+        )
+
+    def handle(self, *args, **options):
+        compiled_count, profile_count = AIWorkflowProfile.compile_stale(force=options["all"])
+        self.stdout.write(f"Compiled {compiled_count} of {profile_count} workflow profiles.")
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.20 on 2026-10-17 13:15
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_ai_extensions', '0008_aiworkflowsession_timestamps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AIWorkflowProfileCompiled',
+            fields=[
+                ('profile', models.OneToOneField(help_text='AI workflow profile this compiled configuration belongs to', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='compiled', serialize=False, to='openedx_ai_extensions.aiworkflowprofile')),
+                ('sha1', models.CharField(help_text='Fingerprint of base_filepath, content_patch and template contents', max_length=40)),
+                ('merged_json', models.JSONField(blank=True, help_text='Effective configuration (base template merged with content_patch)', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
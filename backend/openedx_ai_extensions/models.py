@@ -3,12 +3,19 @@ Database models for openedx_ai_extensions.
 """
 import logging
 import re
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+from django.core.cache import cache
 from django.db import models
 
 logger = logging.getLogger(__name__)
 
+# UUID pattern: 32 hex digits with or without dashes
+_UUID_PATTERN = re.compile(r'^[a-f\d]{8}-?([a-f\d]{4}-?){3}[a-f\d]{12}$', re.IGNORECASE)
+
+_PROMPT_CACHE_PREFIX = "openedx_ai_extensions:prompt_template:"
+_PROMPT_CACHE_TIMEOUT = 300
+
 
 class PromptTemplate(models.Model):
     """
@@ -60,6 +67,8 @@ class PromptTemplate(models.Model):
         Load prompt text by slug or UUID.
 
         Uses regex to detect UUID format and query accordingly for efficiency.
+        Found bodies are cached so that building a processor does not query
+        the database on every request.
 
         Args:
             template_identifier: Either a slug (str) or UUID string
@@ -70,12 +79,28 @@ class PromptTemplate(models.Model):
         if not template_identifier:
             return None
 
-        # UUID pattern: 32 hex digits with or without dashes
-        uuid_pattern = re.compile(
-            r'^[a-f\d]{8}-?([a-f\d]{4}-?){3}[a-f\d]{12}$',
-            re.IGNORECASE
-        )
-        if uuid_pattern.match(str(template_identifier)):
+        cache_key = cls._prompt_cache_key(template_identifier)
+        body = cache.get(cache_key)
+        if body is None:
+            body = cls._query_prompt(template_identifier)
+            if body is not None:
+                cache.set(cache_key, body, _PROMPT_CACHE_TIMEOUT)
+        return body
+
+    @classmethod
+    def _prompt_cache_key(cls, template_identifier):
+        """Return the cache key for a slug or UUID, normalizing UUID spellings."""
+        identifier = str(template_identifier)
+        if _UUID_PATTERN.match(identifier):
+            identifier = str(UUID(identifier))
+        return f"{_PROMPT_CACHE_PREFIX}{identifier}"
+
+    @classmethod
+    def _query_prompt(cls, template_identifier):
+        """
+        Query the prompt body by slug or UUID, bypassing the cache.
+        """
+        if _UUID_PATTERN.match(str(template_identifier)):
             try:
                 template = cls.objects.get(id=template_identifier)
                 logger.info(f"Loaded prompt template by UUID: {template_identifier}")
@@ -98,3 +123,12 @@ class PromptTemplate(models.Model):
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.warning(f"Error loading PromptTemplate by slug '{template_identifier}': {e}")
             return None
+
+    def invalidate_prompt_cache(self):
+        """
+        Drop the cached body for this template under both its slug and UUID.
+        """
+        cache.delete_many([
+            self._prompt_cache_key(self.slug),
+            self._prompt_cache_key(self.id),
+        ])
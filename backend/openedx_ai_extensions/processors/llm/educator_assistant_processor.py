@@ -4,15 +4,21 @@ LLM Processing using LiteLLM for multiple providers
 
 import json
 import logging
+import re
 from pathlib import Path
 
 from litellm import completion
 
 from openedx_ai_extensions.processors.llm.litellm_base_processor import LitellmProcessor
 from openedx_ai_extensions.processors.llm.providers import adapt_to_provider
+from openedx_ai_extensions.utils import serialize_context
 
 logger = logging.getLogger(__name__)
 
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{[A-Z_]+\}\}")
+# Top-level "- Section" headings of the prompt templates
+_SECTION_PATTERN = re.compile(r"^- ", re.MULTILINE)
+
 
 class EducatorAssistantProcessor(LitellmProcessor):
     """Handles AI/LLM processing operations"""
@@ -29,7 +35,7 @@ class EducatorAssistantProcessor(LitellmProcessor):
         function = getattr(self, function_name)
         return function(*args, **kwargs)
 
-    def _call_completion_api(self, system_role):
+    def _call_completion_api(self, system_role, user_content=None):
         """
         General method to call LiteLLM completion API
         Handles configuration and returns standardized response
@@ -40,11 +46,13 @@ class EducatorAssistantProcessor(LitellmProcessor):
                 {"role": "system", "content": self.custom_prompt or system_role},
             ],
         }
+        if user_content and not self.custom_prompt:
+            completion_params["messages"].append({"role": "user", "content": user_content})
 
         completion_params = adapt_to_provider(
             provider=self.provider,
             params=completion_params,
-            has_user_input=False,
+            has_user_input=len(completion_params["messages"]) > 1,
             user_session=self.user_session,
         )
 
@@ -62,6 +70,36 @@ class EducatorAssistantProcessor(LitellmProcessor):
             "status": "success",
         }
 
+    def _render_prompt(self, prompt, input_data):
+        """
+        Fill the prompt placeholders from input_data.
+
+        The template is split at the section holding the first placeholder. The
+        instructions before it are identical on every call, so they are sent as
+        the system message and form a prefix the provider can cache; the rendered
+        remainder (course content, author instructions) is sent as the user message.
+
+        Returns:
+            tuple: (instructions, request). instructions holds the whole rendered
+            prompt and request is empty when the template has no such section.
+        """
+        input_data['context'] = serialize_context(self.context)
+
+        split_at = 0
+        placeholder_match = _PLACEHOLDER_PATTERN.search(prompt)
+        if placeholder_match:
+            for section_match in _SECTION_PATTERN.finditer(prompt, 0, placeholder_match.start()):
+                split_at = section_match.start()
+        instructions, request = prompt[:split_at], prompt[split_at:]
+
+        for key, value in input_data.items():
+            placeholder = f"{{{{{key.upper()}}}}}"
+            request = request.replace(placeholder, str(value))
+
+        if not instructions:
+            return request, ""
+        return instructions, request
+
     def generate_quiz_questions(self, input_data):
         """Generate quiz questions based on the content provided"""
 
@@ -73,12 +111,8 @@ class EducatorAssistantProcessor(LitellmProcessor):
         with open(prompt_file_path, "r") as f:
             prompt = f.read()
 
-        input_data['context'] = self.context
-        for key, value in input_data.items():
-            placeholder = f"{{{{{key.upper()}}}}}"
-            prompt = prompt.replace(placeholder, str(value))
-
-        result = self._call_completion_api(prompt)
+        instructions, request = self._render_prompt(prompt, input_data)
+        result = self._call_completion_api(instructions, request)
 
         response = json.loads(result['response'])
 
@@ -99,12 +133,8 @@ class EducatorAssistantProcessor(LitellmProcessor):
         with open(prompt_file_path, "r") as f:
             prompt = f.read()
 
-        input_data['context'] = self.context
-        for key, value in input_data.items():
-            placeholder = f"{{{{{key.upper()}}}}}"
-            prompt = prompt.replace(placeholder, str(value))
-
-        result = self._call_completion_api(prompt)
+        instructions, request = self._render_prompt(prompt, input_data)
+        result = self._call_completion_api(instructions, request)
 
         response = json.loads(result['response'])
         return {
@@ -24,6 +24,9 @@ logger = logging.getLogger(__name__)
 
 _PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
 
+# Processor functions that send the stored conversation history to the LLM.
+_CHAT_HISTORY_FUNCTIONS = frozenset({"chat_with_context"})
+
 
 def load_prompt(name: str) -> str:
     """Load a system prompt from openedx_ai_extensions/prompts/<name>.txt."""
@@ -62,13 +65,22 @@ class LLMProcessor(LitellmProcessor):
         self.input_data = kwargs.get("input_data", None)
         self.chat_history = kwargs.get("chat_history", None)
 
-        function_name = self.config.get("function", None)
-        # jsonmerge still returns "function": null", so check for that too
-        if not function_name:
-            function_name = "call_with_custom_prompt"
-        function = getattr(self, function_name)
+        function = getattr(self, self._get_function_name())
         return function()
 
+    def _get_function_name(self):
+        """Return the configured processor function, defaulting to call_with_custom_prompt."""
+        # jsonmerge still returns "function": null", so check for that too
+        return self.config.get("function", None) or "call_with_custom_prompt"
+
+    def uses_chat_history(self):
+        """
+        Return True if the configured function sends prior conversation turns to the LLM.
+
+        Callers use this to skip loading the stored history when it would be ignored.
+        """
+        return self._get_function_name() in _CHAT_HISTORY_FUNCTIONS
+
     def _handle_streaming_completion(self, response):
         """Stream with chunk buffering (more natural UI speed)."""
         try:
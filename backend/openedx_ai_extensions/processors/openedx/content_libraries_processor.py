@@ -41,10 +41,12 @@ class ContentLibraryProcessor:
               "can_stand_alone": True,
             }
 
+            problem = None
             try:
                 problem = self.create_block(block_data)
-                if problem:
-                    self.modify_block_olx(usage_key=problem.usage_key, data=problem_info['data'])
+                if not problem:
+                    continue
+                self.modify_block_olx(usage_key=problem.usage_key, data=problem_info['data'])
 
                 opaque_keys.append(problem.usage_key)
             except Exception as e:  # pylint: disable=broad-exception-caught
@@ -6,6 +6,7 @@ import json
 import logging
 
 from django.conf import settings
+from django.db import transaction
 from submissions import api as submissions_api
 
 logger = logging.getLogger(__name__)
@@ -75,11 +76,21 @@ class SubmissionProcessor:
                    and has_more is a boolean indicating if more messages are available
         """
         submissions = submissions_api.get_submissions(self.student_item_dict)
-        all_messages = []
 
-        # Extract all messages from all submissions
-        # get_submissions returns newest first, so we need to reverse to get chronological order
-        for submission in reversed(submissions):
+        # When the result is bounded by max_context_messages, only the newest
+        # current_messages_count + max_context_messages messages can be returned.
+        # Parsing stops once one message past that window has been seen, which is
+        # enough to know has_more, so older submissions are never decoded.
+        if use_max_context:
+            message_limit = max(current_messages_count, 0) + self.max_context_messages
+        else:
+            message_limit = None
+
+        # get_submissions returns newest first; chunks are collected in that order
+        # and reversed once at the end to get chronological order
+        newest_first_chunks = []
+        collected_count = 0
+        for submission in submissions:
             submission_messages = json.loads(submission["answer"])
             timestamp = str(submission.get("created_at") or submission.get("submitted_at") or "")
             if submission_messages and isinstance(submission_messages, list):
@@ -99,8 +110,16 @@ class SubmissionProcessor:
                     msg["timestamp"] = timestamp
                     if include_submission_id:
                         msg["submission_id"] = submission_uuid
-                # Extend to maintain chronological order (oldest to newest)
-                all_messages.extend(submission_messages_copy)
+                newest_first_chunks.append(submission_messages_copy)
+                collected_count += len(submission_messages_copy)
+                if message_limit is not None and collected_count > message_limit:
+                    break
+
+        # Oldest to newest; when parsing stopped early this is only the newest
+        # tail of the history, which still holds every message that can be returned
+        all_messages = [
+            msg for chunk in reversed(newest_first_chunks) for msg in chunk
+        ]
 
         if current_messages_count > 0:
             # If current_messages_count provided, return the next batch of older messages
@@ -221,13 +240,17 @@ class SubmissionProcessor:
 
         ``attempt_number`` is intentionally omitted so the Submissions API
         auto-increments it for the given ``student_item``.
+
+        The submission rows and the session pointer to them are written in
+        one transaction, so they commit together once.
         """
-        submission = submissions_api.create_submission(
-            student_item_dict=self.student_item_dict,
-            answer=json.dumps(data),
-        )
-        self.user_session.local_submission_id = submission["uuid"]
-        self.user_session.save()
+        with transaction.atomic():
+            submission = submissions_api.create_submission(
+                student_item_dict=self.student_item_dict,
+                answer=json.dumps(data),
+            )
+            self.user_session.local_submission_id = submission["uuid"]
+            self.user_session.save()
 
     def get_submission(self):
         """
@@ -1,78 +1,119 @@
 """
 Utility for converting a problem definition dictionary into OLX (XML) format.
+
+The OLX is assembled directly into a list of string parts. Values are inserted
+verbatim: question text, choices and hints are HTML fragments produced by the
+LLM and must not be escaped.
 """
-from jinja2 import Template
-
-olx_template = Template("""
-  <problem display_name="{{ p.display_name }}">
-    <div>{{ p.question_html }}</div>
-
-    {% if p.problem_type in ['multiplechoiceresponse', 'choiceresponse'] %}
-    <{{ p.problem_type }}>
-        <{% if p.problem_type == 'multiplechoiceresponse' %}choicegroup{% else %}checkboxgroup{% endif %}>
-            {% for choice in p.choices %}
-            <choice correct="{{ 'true' if choice.is_correct else 'false' }}">
-                <div>{{ choice.text }}</div>
-                {% if choice.feedback %}
-                <choicehint>
-                    <div>{{ choice.feedback }}</div>
-                </choicehint>
-                {% endif %}
-            </choice>
-            {% endfor %}
-        </{% if p.problem_type == 'multiplechoiceresponse' %}choicegroup{% else %}checkboxgroup{% endif %}>
-    </{{ p.problem_type }}>
-
-    {% elif p.problem_type == 'optionresponse' %}
-    <optionresponse>
-        <optioninput>
-            {% for choice in p.choices %}
-            <option correct="{{ 'true' if choice.is_correct else 'false' }}">
-                {{ choice.text }}
-                <optionhint>
-                    <div>{{ choice.feedback }}</div>
-                </optionhint>
-            </option>
-            {% endfor %}
-        </optioninput>
-    </optionresponse>
-
-    {% elif p.problem_type == 'numericalresponse' %}
-    <numericalresponse answer="{{ p.answer_value }}">
-        {% if p.tolerance and p.tolerance != '<UNKNOWN>' %}
-        <responseparam type="tolerance" default="{{ p.tolerance }}" />
-        {% endif %}
-        <formulaequationinput />
-    </numericalresponse>
-
-    {% elif p.problem_type == 'stringresponse' %}
-    <stringresponse answer="{{ p.answer_value }}" type="ci">
-        <label>{{ p.question_html }}</label>
-        <textline size="20" />
-    </stringresponse>
-    {% endif %}
-
-    <solution>
-        <div class="detailed-solution">
-            <p>Explanation</p>
-            <p>{{ p.explanation }}</p>
-        </div>
-    </solution>
-
-    {% if p.demand_hints %}
-    <demandhint>
-        {% for hint in p.demand_hints %}
-        <hint>
-            <div>{{ hint }}</div>
-        </hint>
-        {% endfor %}
-    </demandhint>
-    {% endif %}
-  </problem>
-  """)
+
+# Group element wrapping the choices of each choice-based problem type
+_CHOICE_GROUP_TAGS = {
+    "multiplechoiceresponse": "choicegroup",
+    "choiceresponse": "checkboxgroup",
+}
+
+
+def _text(data, key):
+    """Return data[key] as text, or an empty string when the key is missing."""
+    return str(data.get(key, ""))
+
+
+def _correct(choice):
+    """Return the OLX ``correct`` attribute value for a choice."""
+    return "true" if choice.get("is_correct") else "false"
+
+
+def _write_choices(parts, problem):
+    """Append a multiple-choice or checkbox response block to ``parts``."""
+    problem_type = problem["problem_type"]
+    group_tag = _CHOICE_GROUP_TAGS[problem_type]
+    parts.append(f"    <{problem_type}>\n        <{group_tag}>\n")
+    for choice in problem.get("choices", ()):
+        parts.append(
+            f'            <choice correct="{_correct(choice)}">\n'
+            f"                <div>{_text(choice, 'text')}</div>\n"
+        )
+        if choice.get("feedback"):
+            parts.append(
+                "                <choicehint>\n"
+                f"                    <div>{_text(choice, 'feedback')}</div>\n"
+                "                </choicehint>\n"
+            )
+        parts.append("            </choice>\n")
+    parts.append(f"        </{group_tag}>\n    </{problem_type}>\n")
+
+
+def _write_options(parts, problem):
+    """Append a dropdown (optionresponse) block to ``parts``."""
+    parts.append("    <optionresponse>\n        <optioninput>\n")
+    for choice in problem.get("choices", ()):
+        parts.append(
+            f'            <option correct="{_correct(choice)}">\n'
+            f"                {_text(choice, 'text')}\n"
+            "                <optionhint>\n"
+            f"                    <div>{_text(choice, 'feedback')}</div>\n"
+            "                </optionhint>\n"
+            "            </option>\n"
+        )
+    parts.append("        </optioninput>\n    </optionresponse>\n")
+
+
+def _write_numerical(parts, problem):
+    """Append a numerical response block to ``parts``."""
+    parts.append(f'    <numericalresponse answer="{_text(problem, "answer_value")}">\n')
+    tolerance = problem.get("tolerance")
+    if tolerance and tolerance != "<UNKNOWN>":
+        parts.append(f'        <responseparam type="tolerance" default="{tolerance}" />\n')
+    parts.append("        <formulaequationinput />\n    </numericalresponse>\n")
+
+
+def _write_string(parts, problem):
+    """Append a text-input response block to ``parts``."""
+    parts.append(
+        f'    <stringresponse answer="{_text(problem, "answer_value")}" type="ci">\n'
+        f"        <label>{_text(problem, 'question_html')}</label>\n"
+        '        <textline size="20" />\n'
+        "    </stringresponse>\n"
+    )
+
+
+# Response-block writer for each supported problem_type. Unknown types
+# render no response block.
+_RESPONSE_WRITERS = {
+    "multiplechoiceresponse": _write_choices,
+    "choiceresponse": _write_choices,
+    "optionresponse": _write_options,
+    "numericalresponse": _write_numerical,
+    "stringresponse": _write_string,
+}
 
 
 def json_to_olx(problem_dict):
-    # Render the template with the dictionary
-    rendered = olx_template.render(p=problem_dict)
-    return {"category": "problem", "data": rendered}
+    """Render a problem definition dictionary as an OLX ``<problem>`` string."""
+    parts = [
+        f'<problem display_name="{_text(problem_dict, "display_name")}">\n'
+        f"    <div>{_text(problem_dict, 'question_html')}</div>\n"
+    ]
+
+    write_response = _RESPONSE_WRITERS.get(problem_dict.get("problem_type"))
+    if write_response is not None:
+        write_response(parts, problem_dict)
+
+    parts.append(
+        "    <solution>\n"
+        '        <div class="detailed-solution">\n'
+        "            <p>Explanation</p>\n"
+        f"            <p>{_text(problem_dict, 'explanation')}</p>\n"
+        "        </div>\n"
+        "    </solution>\n"
+    )
+
+    demand_hints = problem_dict.get("demand_hints")
+    if demand_hints:
+        parts.append("    <demandhint>\n")
+        for hint in demand_hints:
+            parts.append(f"        <hint>\n            <div>{hint}</div>\n        </hint>\n")
+        parts.append("    </demandhint>\n")
+
+    parts.append("</problem>\n")
+    return {"category": "problem", "data": "".join(parts)}
@@ -6,10 +6,12 @@ This is the entry point that bridges the event bus → orchestrator.
 import logging
 
 from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
 
 from openedx_ai_extensions.events.signals import AI_ORCHESTRATION_REQUESTED
-from openedx_ai_extensions.workflows.models import AIWorkflowScope
+from openedx_ai_extensions.models import PromptTemplate
+from openedx_ai_extensions.workflows.models import AIWorkflowProfile, AIWorkflowScope
 
 log = logging.getLogger(__name__)
 
@@ -53,3 +55,54 @@ def handle_ai_orchestration_requested(_sender, ai_orchestration_request, **kwarg
     except Exception:
         log.exception("Error running orchestrator for workflow")
         raise
+
+
+@receiver(post_save, sender=AIWorkflowProfile)
+def handle_ai_workflow_profile_saved(sender, instance, raw=False, **kwargs):  # pylint: disable=unused-argument
+    """
+    Recompute the stored effective configuration whenever a profile is saved.
+
+    Skipped for raw saves (fixture loading); those rows stay uncompiled
+    until the next save, ``migrate`` or ``compile_workflow_profiles`` run.
+    """
+    if raw:
+        return
+    instance.compile()
+
+
+@receiver(post_migrate)
+def handle_post_migrate(sender, apps, **kwargs):
+    """
+    Compile workflow profiles whose stored configuration is missing or stale.
+
+    Covers profiles that predate the compiled side table and templates whose
+    contents changed in a deploy, which always runs ``migrate``.
+    """
+    if sender.name != "openedx_ai_extensions":
+        return
+    try:
+        apps.get_model("openedx_ai_extensions", "AIWorkflowProfileCompiled")
+    except LookupError:
+        # Migrated to a state before the side table exists
+        return
+    AIWorkflowProfile.compile_stale()
+
+
+@receiver(post_save, sender=AIWorkflowProfile)
+@receiver(post_delete, sender=AIWorkflowProfile)
+@receiver(post_save, sender=AIWorkflowScope)
+@receiver(post_delete, sender=AIWorkflowScope)
+def handle_ai_workflow_config_changed(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drop cached UI configs whenever a profile or scope is saved or deleted.
+    """
+    AIWorkflowScope.invalidate_ui_config_cache()
+
+
+@receiver(post_save, sender=PromptTemplate)
+@receiver(post_delete, sender=PromptTemplate)
+def handle_prompt_template_changed(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drop the cached prompt body whenever a template is saved or deleted.
+    """
+    instance.invalidate_prompt_cache()
@@ -79,6 +79,21 @@ def plugin_settings(settings):
     if not hasattr(settings, "AI_EXTENSIONS_MAX_CONTEXT_MESSAGES"):
         settings.AI_EXTENSIONS_MAX_CONTEXT_MESSAGES = 3
 
+    # Fetch course content on a background thread while the orchestrator sets
+    # up its LLM processor and loads chat history, instead of one after the
+    # other. The fetch then runs outside the request thread, so it cannot use
+    # request-scoped caches.
+    if not hasattr(settings, "AI_EXTENSIONS_PREFETCH_CONTENT"):
+        settings.AI_EXTENSIONS_PREFETCH_CONTENT = False
+
+    # -------------------------
+    # Mock orchestrators
+    # -------------------------
+    # Seconds MockStreamResponse waits before each chunk to mimic a live stream.
+    # Set to 0 to stream instantly (e.g. in CI).
+    if not hasattr(settings, "AI_EXTENSIONS_MOCK_STREAM_DELAY"):
+        settings.AI_EXTENSIONS_MOCK_STREAM_DELAY = 0.01
+
     # -------------------------
     # Caching
     # -------------------------
@@ -118,6 +133,12 @@ def plugin_settings(settings):
     if not hasattr(settings, 'EVENT_TRACKING_BACKENDS_ALLOWED_CALIPER_EVENTS'):
         settings.EVENT_TRACKING_BACKENDS_ALLOWED_CALIPER_EVENTS = []
 
+    # Emit workflow events from a background thread so tracker backends do not
+    # add latency to the response. The request's tracker context is copied onto
+    # the event; processors that read the current request directly will not see it.
+    if not hasattr(settings, "AI_EXTENSIONS_ASYNC_EVENT_EMISSION"):
+        settings.AI_EXTENSIONS_ASYNC_EVENT_EMISSION = False
+
     # Add all AI workflow events to the xAPI allowlist
     settings.EVENT_TRACKING_BACKENDS_ALLOWED_XAPI_EVENTS += ALL_EVENTS
 
@@ -2,6 +2,7 @@
 Utility functions for Open edX AI Extensions.
 """
 
+import json
 from types import GeneratorType
 
 # Standardized error message for mid-stream failures.
@@ -24,6 +25,19 @@ def normalize_input_to_text(input_data) -> str:
     return str(input_data)
 
 
+def serialize_context(content) -> str:
+    """
+    Serialise fetched course content into the text sent to the LLM as context.
+
+    Dicts and lists are rendered as compact JSON, which is cheaper to build
+    than their Python repr and uses fewer tokens. Non-JSON values such as
+    opaque keys fall back to ``str``. Strings pass through unchanged.
+    """
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
 def is_generator(result):
     """
     Check if the given object is a generator.
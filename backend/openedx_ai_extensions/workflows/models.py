@@ -1,6 +1,8 @@
 """
 AI Workflow models for managing flexible AI workflow execution
 """
+import hashlib
+import json
 import logging
 import re
 from typing import Any, Optional
@@ -8,6 +10,7 @@ from uuid import uuid4
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Q
@@ -16,6 +19,7 @@ from opaque_keys.edx.django.models import CourseKeyField, UsageKeyField
 
 from openedx_ai_extensions.workflows.orchestrators import BaseOrchestrator
 from openedx_ai_extensions.workflows.template_utils import (
+    get_config_fingerprint,
     get_effective_config,
     parse_json5_string,
     validate_workflow_config,
@@ -24,6 +28,9 @@ from openedx_ai_extensions.workflows.template_utils import (
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+_UI_CONFIG_CACHE_PREFIX = "openedx_ai_extensions:ui_config:"
+_UI_CONFIG_CACHE_VERSION_KEY = f"{_UI_CONFIG_CACHE_PREFIX}version"
+
 
 class AIWorkflowProfile(models.Model):
     """
@@ -85,13 +92,75 @@ class AIWorkflowProfile(models.Model):
         """
         Get the effective configuration by merging base template with overrides.
 
-        Cached per instance to avoid repeated disk reads and merging.
+        Served from the precomputed ``AIWorkflowProfileCompiled`` row when its
+        fingerprint still matches, so the request path does not read the
+        template, parse JSON5 or merge. Cached per instance on top of that.
+
+        A missing or stale row is never rewritten here, to keep reads free of
+        database writes; the merged config is computed in memory instead.
+        Rows are refreshed on save, after ``migrate`` and by the
+        ``compile_workflow_profiles`` management command.
 
         Returns:
             Merged configuration dict
         """
+        if self._state.adding:
+            return get_effective_config(self.base_filepath, self.content_patch_dict)
+
+        try:
+            compiled = self.compiled
+        except AIWorkflowProfileCompiled.DoesNotExist:
+            compiled = None
+
+        if compiled is not None and compiled.sha1 == get_config_fingerprint(self.base_filepath, self.content_patch):
+            return compiled.merged_json
         return get_effective_config(self.base_filepath, self.content_patch_dict)
 
+    def compile(self, fingerprint: Optional[str] = None) -> "AIWorkflowProfileCompiled":
+        """
+        Recompute the effective configuration and store it in the side table.
+
+        Args:
+            fingerprint: Already computed ``get_config_fingerprint`` value for
+                this profile, if the caller has one
+
+        Returns:
+            The up-to-date AIWorkflowProfileCompiled instance
+        """
+        if fingerprint is None:
+            fingerprint = get_config_fingerprint(self.base_filepath, self.content_patch)
+        compiled, _ = AIWorkflowProfileCompiled.objects.update_or_create(
+            profile=self,
+            defaults={
+                "sha1": fingerprint,
+                "merged_json": get_effective_config(self.base_filepath, self.content_patch_dict),
+            },
+        )
+        self.compiled = compiled  # pylint: disable=attribute-defined-outside-init
+        return compiled
+
+    @classmethod
+    def compile_stale(cls, force: bool = False) -> tuple[int, int]:
+        """
+        Recompile every profile whose stored configuration is missing or stale.
+
+        Args:
+            force: Recompile every profile, even if its stored configuration
+                is up to date
+
+        Returns:
+            Tuple of (compiled_count, profile_count)
+        """
+        profiles = cls.objects.select_related("compiled")
+        compiled_count = 0
+        for profile in profiles:
+            fingerprint = get_config_fingerprint(profile.base_filepath, profile.content_patch)
+            compiled = getattr(profile, "compiled", None)
+            if force or compiled is None or compiled.sha1 != fingerprint:
+                profile.compile(fingerprint)
+                compiled_count += 1
+        return compiled_count, len(profiles)
+
     def get_config(self) -> dict:
         """
         Get the effective configuration (backward compatibility).
@@ -149,6 +218,40 @@ class AIWorkflowProfile(models.Model):
         super().save(*args, **kwargs)
 
 
+class AIWorkflowProfileCompiled(models.Model):
+    """
+    Precomputed effective configuration of an AIWorkflowProfile.
+
+    Refreshed on every profile save and after every ``migrate`` (see
+    ``receivers``), and by the ``compile_workflow_profiles`` management
+    command. Stale rows are detected through the fingerprint and bypassed
+    until then.
+
+    .. no_pii:
+    """
+
+    profile = models.OneToOneField(
+        AIWorkflowProfile,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="compiled",
+        help_text="AI workflow profile this compiled configuration belongs to",
+    )
+    sha1 = models.CharField(
+        max_length=40,
+        help_text="Fingerprint of base_filepath, content_patch and template contents",
+    )
+    merged_json = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Effective configuration (base template merged with content_patch)",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Compiled config for {self.profile_id}"
+
+
 class AIWorkflowScope(models.Model):
     """
     .. no_pii:
@@ -281,7 +384,7 @@ class AIWorkflowScope(models.Model):
             Q(ui_slot_selector_id=ui_slot_selector_id) | Q(ui_slot_selector_id=""),
             enabled=True,
             service_variant=service_variant,
-        ).order_by("-specificity_index")
+        ).select_related("profile__compiled").order_by("-specificity_index")
 
         # Phase 2 — Python regex loop
         for scope in candidates:
@@ -301,6 +404,30 @@ class AIWorkflowScope(models.Model):
 
         return None
 
+    @classmethod
+    def ui_config_cache_key(cls, context):
+        """
+        Return the cache key for the UI config resolved from ``context``.
+
+        The key embeds a version token that ``invalidate_ui_config_cache`` replaces,
+        so one call drops every cached entry without enumerating keys. The
+        service variant is part of the key because LMS and CMS may share a cache.
+        """
+        version = cache.get_or_set(_UI_CONFIG_CACHE_VERSION_KEY, lambda: uuid4().hex, None)
+        context_json = json.dumps(
+            {**context, "service_variant": getattr(settings, "SERVICE_VARIANT", "lms")},
+            sort_keys=True,
+        )
+        digest = hashlib.sha256(context_json.encode("utf-8")).hexdigest()
+        return f"{_UI_CONFIG_CACHE_PREFIX}{version}:{digest}"
+
+    @classmethod
+    def invalidate_ui_config_cache(cls):
+        """
+        Drop every cached UI config by replacing the cache version token.
+        """
+        cache.set(_UI_CONFIG_CACHE_VERSION_KEY, uuid4().hex, None)
+
     @classmethod
     def list_profiles_for_context(
         cls, course_id=None, location_id=None, ui_slot_selector_id=None, service_variant=None
@@ -344,12 +471,12 @@ class AIWorkflowScope(models.Model):
                 course_filter,
                 Q(ui_slot_selector_id=ui_slot_selector_id) | Q(ui_slot_selector_id=""),
                 **base_filter,
-            ).select_related("profile").order_by("-specificity_index")
+            ).select_related("profile__compiled").order_by("-specificity_index")
         else:
             candidates = cls.objects.filter(
                 course_filter,
                 **base_filter,
-            ).select_related("profile").order_by("-specificity_index")
+            ).select_related("profile__compiled").order_by("-specificity_index")
 
         # profile_id → (profile, [matching scopes]) preserving insertion order
         seen: dict = {}
@@ -1,13 +1,160 @@
 """
 Base orchestrator class for AI workflow execution.
 """
+import atexit
+import functools
 import importlib
 import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from django.conf import settings
+from django.db import connection
 from eventtracking import tracker
 
 logger = logging.getLogger(__name__)
 
+_MOCK_ORCHESTRATOR_MODULE = "openedx_ai_extensions.workflows.orchestrators.mock_orchestrator"
+_DIRECT_ORCHESTRATOR_MODULE = "openedx_ai_extensions.workflows.orchestrators.direct_orchestrator"
+_THREADED_ORCHESTRATOR_MODULE = "openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator"
+
+# Short orchestrator names mapped to their (module_path, class_name)
+LOCAL_PATH_MAPPING = {
+    "MockResponse": (_MOCK_ORCHESTRATOR_MODULE, "MockResponse"),
+    "MockStreamResponse": (_MOCK_ORCHESTRATOR_MODULE, "MockStreamResponse"),
+    "DirectLLMResponse": (_DIRECT_ORCHESTRATOR_MODULE, "DirectLLMResponse"),
+    "EducatorAssistantOrchestrator": (_DIRECT_ORCHESTRATOR_MODULE, "EducatorAssistantOrchestrator"),
+    "ThreadedLLMResponse": (_THREADED_ORCHESTRATOR_MODULE, "ThreadedLLMResponse"),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_orchestrator_class(orchestrator_name):
+    """
+    Import and validate the orchestrator class configured as orchestrator_name.
+
+    Resolution is deterministic per name, so successful lookups are cached for
+    the life of the process. Failures raise and are therefore never cached.
+    """
+    try:
+        module_path, class_name = (
+            LOCAL_PATH_MAPPING.get(orchestrator_name)
+            or orchestrator_name.rsplit('.', 1)
+        )
+
+        module = importlib.import_module(module_path)
+        orchestrator_class = getattr(module, class_name)
+
+    except ValueError as exc:
+        raise AttributeError(f"Invalid orchestrator name format: {orchestrator_name}") from exc
+    except ImportError as exc:
+        raise ImportError(
+            f"Could not import module '{module_path}' for orchestrator '{orchestrator_name}'"
+        ) from exc
+    except AttributeError as exc:
+        raise AttributeError(
+            f"Orchestrator class '{class_name}' not found in module '{module_path}'"
+        ) from exc
+
+    if not issubclass(orchestrator_class, BaseOrchestrator):
+        raise TypeError(
+            f"{class_name} is not a subclass of BaseOrchestrator"
+        )
+
+    return orchestrator_class
+
+
+# Background emission of workflow events (AI_EXTENSIONS_ASYNC_EVENT_EMISSION).
+# Items are (event_name, event_data, tracking_context) tuples.
+_EVENT_QUEUE = queue.SimpleQueue()
+_EVENT_WORKER = None
+_EVENT_WORKER_LOCK = threading.Lock()
+_STOP_EVENT_WORKER = object()
+
+
+def _drain_event_queue():
+    """
+    Emit queued workflow events until the stop sentinel is received.
+    """
+    while True:
+        item = _EVENT_QUEUE.get()
+        if item is _STOP_EVENT_WORKER:
+            return
+        event_name, event_data, tracking_context = item
+        try:
+            with tracker.get_tracker().context("ai_workflow", tracking_context):
+                tracker.emit(event_name, event_data)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to emit workflow event %s", event_name)
+
+
+def _ensure_event_worker():
+    """
+    Start the event worker thread for this process if it is not running.
+    """
+    global _EVENT_WORKER  # pylint: disable=global-statement
+    with _EVENT_WORKER_LOCK:
+        if _EVENT_WORKER is None or not _EVENT_WORKER.is_alive():
+            _EVENT_WORKER = threading.Thread(
+                target=_drain_event_queue, name="ai-workflow-events", daemon=True
+            )
+            _EVENT_WORKER.start()
+
+
+def _stop_event_worker(timeout=5):
+    """
+    Flush pending workflow events and stop the worker thread.
+    """
+    with _EVENT_WORKER_LOCK:
+        worker = _EVENT_WORKER
+    if worker is not None and worker.is_alive():
+        _EVENT_QUEUE.put(_STOP_EVENT_WORKER)
+        worker.join(timeout)
+
+
+atexit.register(_stop_event_worker)
+
+# Shared pool for background content fetches (AI_EXTENSIONS_PREFETCH_CONTENT)
+_PREFETCH_MAX_WORKERS = 4
+_PREFETCH_EXECUTOR = None
+_PREFETCH_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_prefetch_executor():
+    """Return the process-wide content prefetch pool, creating it on first use."""
+    global _PREFETCH_EXECUTOR  # pylint: disable=global-statement
+    with _PREFETCH_EXECUTOR_LOCK:
+        if _PREFETCH_EXECUTOR is None:
+            _PREFETCH_EXECUTOR = ThreadPoolExecutor(
+                max_workers=_PREFETCH_MAX_WORKERS, thread_name_prefix="ai-content-prefetch"
+            )
+    return _PREFETCH_EXECUTOR
+
+
+def _run_prefetch(func):
+    """Run ``func`` on a pool thread, closing that thread's DB connection afterwards."""
+    try:
+        return func()
+    finally:
+        connection.close()
+
+
+def completed_response(response):
+    """
+    Build the standard result dict for a successfully completed orchestrator call.
+    """
+    return {"response": response, "status": "completed"}
+
+
+def error_response(result, source):
+    """
+    Return the error result for a failed ``source`` processor call, or None if it succeeded.
+    """
+    if result and "error" in result:
+        return {"error": result["error"], "status": f"{source} error"}
+    return None
+
 
 class BaseOrchestrator:
     """Base class for workflow orchestrators."""
@@ -18,6 +165,9 @@ class BaseOrchestrator:
         self.profile = workflow.profile
         self.location_id = context.get("location_id", None)
         self.course_id = context.get("course_id", None)
+        # String forms used by every emitted event, computed once per orchestrator
+        self._course_id_str = str(self.course_id) if self.course_id else ""
+        self._location_id_str = str(self.location_id) if self.location_id else ""
         self.llm_processor = None
 
     def _convert_usage_to_json_serializable(self, usage) -> dict:
@@ -56,6 +206,25 @@ class BaseOrchestrator:
                 serializable_usage[key] = str(value)
         return serializable_usage
 
+    def _prefetch(self, func):
+        """
+        Start ``func`` and return a Future for its result.
+
+        With ``AI_EXTENSIONS_PREFETCH_CONTENT`` enabled the call runs on a shared
+        thread pool, so independent I/O (e.g. the OpenEdX content fetch) overlaps
+        with work done on the request thread. Otherwise it runs inline and the
+        returned Future is already resolved.
+        """
+        if getattr(settings, "AI_EXTENSIONS_PREFETCH_CONTENT", False):
+            return _get_prefetch_executor().submit(_run_prefetch, func)
+
+        future = Future()
+        try:
+            future.set_result(func())
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            future.set_exception(exc)
+        return future
+
     def _emit_workflow_event(self, event_name: str) -> None:
         """
         Emit an xAPI event for this workflow.
@@ -63,6 +232,9 @@ class BaseOrchestrator:
         Usage data is automatically fetched from ``self.llm_processor.get_usage()``
         when a processor has been set on the orchestrator.
 
+        When ``AI_EXTENSIONS_ASYNC_EVENT_EMISSION`` is enabled the event is
+        queued and emitted by a background thread instead of inline.
+
         Args:
             event_name: The event name constant (e.g., EVENT_NAME_WORKFLOW_COMPLETED)
         """
@@ -72,9 +244,9 @@ class BaseOrchestrator:
         event_data = {
             "workflow_id": str(self.workflow.id),
             "action": self.workflow.action,
-            "course_id": str(self.course_id) if self.course_id else "",
+            "course_id": self._course_id_str,
             "profile_name": self.profile.slug,
-            "location_id": str(self.location_id) if self.location_id else "",
+            "location_id": self._location_id_str,
         }
         if self.user and hasattr(self.user, "id") and self.user.id:
             event_data["user_id"] = self.user.id
@@ -82,8 +254,16 @@ class BaseOrchestrator:
             event_data["usage"] = self._convert_usage_to_json_serializable(usage)
 
         tracking_context = {}
-        if self.course_id:
-            tracking_context["course_id"] = str(self.course_id)
+        if self._course_id_str:
+            tracking_context["course_id"] = self._course_id_str
+
+        if getattr(settings, "AI_EXTENSIONS_ASYNC_EVENT_EMISSION", False):
+            # The tracker context is thread-local, so snapshot the request's
+            # context here and re-enter it on the worker thread.
+            tracking_context = {**tracker.get_tracker().resolve_context(), **tracking_context}
+            _ensure_event_worker()
+            _EVENT_QUEUE.put_nowait((event_name, event_data, tracking_context))
+            return
 
         if tracking_context:
             with tracker.get_tracker().context("ai_workflow", tracking_context):
@@ -116,41 +296,7 @@ class BaseOrchestrator:
             AttributeError: If the configured orchestrator class cannot be found.
             TypeError: If the resolved class is not a subclass of BaseOrchestrator.
         """
-        orchestrator_name = workflow.profile.orchestrator_class
-
-        LOCAL_PATH_MAPPING = {
-            "MockResponse": "openedx_ai_extensions.workflows.orchestrators.mock_orchestrator",
-            "MockStreamResponse": "openedx_ai_extensions.workflows.orchestrators.mock_orchestrator",
-            "DirectLLMResponse": "openedx_ai_extensions.workflows.orchestrators.direct_orchestrator",
-            "EducatorAssistantOrchestrator": "openedx_ai_extensions.workflows.orchestrators.direct_orchestrator",
-            "ThreadedLLMResponse": "openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator",
-        }
-
-        try:
-            if orchestrator_name in LOCAL_PATH_MAPPING:
-                module_path = LOCAL_PATH_MAPPING[orchestrator_name]
-                class_name = orchestrator_name
-            else:
-                module_path, class_name = orchestrator_name.rsplit('.', 1)
-
-            module = importlib.import_module(module_path)
-            orchestrator_class = getattr(module, class_name)
-
-        except ValueError as exc:
-            raise AttributeError(f"Invalid orchestrator name format: {orchestrator_name}") from exc
-        except ImportError as exc:
-            raise ImportError(
-                f"Could not import module '{module_path}' for orchestrator '{orchestrator_name}'"
-            ) from exc
-        except AttributeError as exc:
-            raise AttributeError(
-                f"Orchestrator class '{class_name}' not found in module '{module_path}'"
-            ) from exc
-
-        if not issubclass(orchestrator_class, BaseOrchestrator):
-            raise TypeError(
-                f"{class_name} is not a subclass of BaseOrchestrator"
-            )
+        orchestrator_class = _resolve_orchestrator_class(workflow.profile.orchestrator_class)
 
         return orchestrator_class(
             workflow=workflow,
@@ -1,10 +1,16 @@
 """
 Orchestrators for handling different AI workflow patterns in Open edX.
 """
+import copy
+import hashlib
 import json
 import logging
+import time
+from functools import lru_cache
 from pathlib import Path
 
+from django.core.cache import cache
+
 from openedx_ai_extensions.processors import (
     ContentLibraryProcessor,
     EducatorAssistantProcessor,
@@ -12,14 +18,131 @@ from openedx_ai_extensions.processors import (
     OpenEdXProcessor,
 )
 from openedx_ai_extensions.processors.openedx.utils.json_to_olx import json_to_olx
-from openedx_ai_extensions.utils import is_generator
+from openedx_ai_extensions.utils import is_generator, serialize_context
 from openedx_ai_extensions.xapi.constants import EVENT_NAME_WORKFLOW_COMPLETED
 
-from .base_orchestrator import BaseOrchestrator
+from .base_orchestrator import BaseOrchestrator, completed_response, error_response
 from .session_based_orchestrator import SessionBasedOrchestrator
 
 logger = logging.getLogger(__name__)
 
+_LLM_CACHE_PREFIX = "openedx_ai_extensions:direct_llm_response"
+
+_QUIZ_SCHEMA_PATH = (
+    Path(__file__).resolve().parent.parent.parent
+    / "response_schemas"
+    / "educator_quiz_questions.json"
+)
+
+
+@lru_cache(maxsize=1)
+def _load_quiz_response_format():
+    """
+    Load and parse the educator quiz response schema.
+
+    The schema ships with the package and never changes at runtime, so it is
+    read from disk only once per process.
+    """
+    with open(_QUIZ_SCHEMA_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _quiz_response_format():
+    """Return a private copy of the quiz schema, safe to hand to the LLM client."""
+    return copy.deepcopy(_load_quiz_response_format())
+
+
+def _normalize_cache_input(value):
+    """
+    Return ``value`` with leading and trailing whitespace stripped from every string.
+
+    Case and inner spacing are kept: they can change the meaning of code,
+    identifiers or formatted text, and the cache is shared across users.
+    """
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return {key: _normalize_cache_input(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_cache_input(item) for item in value]
+    return value
+
+
+def _llm_cache_key(processor_config, llm_input_content, input_data):
+    """
+    Build the response cache key for a DirectLLMResponse call.
+
+    The key covers the full processor config, the fetched course content and
+    the normalized user input, so any change to the prompt inputs other than
+    surrounding whitespace results in a miss.
+    """
+    config_hash = json.dumps(processor_config, sort_keys=True, default=str)
+    user_input = json.dumps(_normalize_cache_input(input_data), sort_keys=True, default=str)
+    digest = hashlib.sha256(
+        "|".join((config_hash, llm_input_content, user_input)).encode("utf-8")
+    ).hexdigest()
+    return f"{_LLM_CACHE_PREFIX}:{digest}"
+
+
+def _llm_cache_get(key):
+    """Return the cached LLM result for ``key``, or None on a miss."""
+    return cache.get(key)
+
+
+def _llm_cache_set(key, result, ttl):
+    """Store a non-streaming LLM result under ``key`` for ``ttl`` seconds."""
+    cache.set(key, result, ttl)
+
+
+# Single-flight coalescing of identical cacheable requests: the first request
+# takes a short-lived lock and calls the LLM; concurrent followers wait for
+# its result to land in the response cache instead of calling the LLM too.
+_COALESCE_LOCK_TIMEOUT = 30
+_COALESCE_WAIT_SECONDS = 20
+_COALESCE_POLL_INTERVAL = 0.05
+
+
+def _coalesce_lock_key(key):
+    """Return the lock key guarding the computation of the response cached at ``key``."""
+    return f"{key}:lock"
+
+
+def _acquire_coalesce_lock(key):
+    """Try to become the single request computing ``key``; return True on success."""
+    return cache.add(_coalesce_lock_key(key), 1, _COALESCE_LOCK_TIMEOUT)
+
+
+def _release_coalesce_lock(key):
+    """Release the lock taken by ``_acquire_coalesce_lock``."""
+    cache.delete(_coalesce_lock_key(key))
+
+
+def _wait_for_cached_response(key):
+    """
+    Poll the response cache while another request computes ``key``.
+
+    Returns the cached result, or None if the lock holder finished without
+    caching one (e.g. an LLM error) or the wait timed out.
+    """
+    deadline = time.monotonic() + _COALESCE_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(_COALESCE_POLL_INTERVAL)
+        result = _llm_cache_get(key)
+        if result is not None:
+            return result
+        if cache.get(_coalesce_lock_key(key)) is None:
+            return _llm_cache_get(key)
+    return None
+
+
+def _safe_json_to_olx(problem):
+    """Return the OLX item for ``problem``, or None if it cannot be converted."""
+    try:
+        return json_to_olx(problem)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Error converting problem to OLX")
+        return None
+
 
 class DirectLLMResponse(BaseOrchestrator):
     """
@@ -32,13 +155,25 @@ class DirectLLMResponse(BaseOrchestrator):
         try:
             yield from generator
         except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.error(f"Error in stream wrapper: {e}")
+            logger.error("Error in stream wrapper: %s", e)
             yield f"\n[Error processing stream: {e}]".encode("utf-8")
         finally:
             try:
                 self._emit_workflow_event(EVENT_NAME_WORKFLOW_COMPLETED)
             except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.error(f"Failed to emit workflow event after stream: {e}")
+                logger.error("Failed to emit workflow event after stream: %s", e)
+
+    def _get_response_cache_ttl(self):
+        """
+        Return the response cache TTL in seconds, or 0 when caching is off.
+
+        Enabled per profile with ``LLMProcessor.response_cache_ttl``. Streaming
+        profiles are never cached because their result is a generator.
+        """
+        llm_config = self.profile.processor_config.get("LLMProcessor", {}) or {}
+        if llm_config.get("stream", False):
+            return 0
+        return llm_config.get("response_cache_ttl", 0) or 0
 
     def run(self, input_data):
         """
@@ -53,20 +188,45 @@ class DirectLLMResponse(BaseOrchestrator):
             course_id=self.course_id,
             user=self.user,
         )
-        content_result = openedx_processor.process()
+        content_future = self._prefetch(openedx_processor.process)
+
+        # Set up the LLM processor while the content is being fetched
+        self.llm_processor = LLMProcessor(self.profile.processor_config)
+        content_result = content_future.result()
 
         # Early return on error during content fetching
-        if content_result and 'error' in content_result:
-            return {
-                'error': content_result['error'],
-                'status': 'OpenEdXProcessor error'
-            }
+        if (error := error_response(content_result, "OpenEdXProcessor")) is not None:
+            return error
 
         # Convert fetched content to a string format suitable for the LLM
-        llm_input_content = str(content_result)
+        llm_input_content = serialize_context(content_result)
+
+        # --- 2. Serve identical requests from the response cache ---
+        cache_ttl = self._get_response_cache_ttl()
+        if not cache_ttl:
+            return self._process_with_llm(llm_input_content, input_data)
+
+        cache_key = _llm_cache_key(self.profile.processor_config, llm_input_content, input_data)
+        cached_response = _llm_cache_get(cache_key)
+        if cached_response is None and not _acquire_coalesce_lock(cache_key):
+            # An identical request is already calling the LLM; reuse its result
+            cached_response = _wait_for_cached_response(cache_key)
+            if cached_response is None:
+                return self._process_with_llm(llm_input_content, input_data, cache_key, cache_ttl)
+        if cached_response is not None:
+            self._emit_workflow_event(EVENT_NAME_WORKFLOW_COMPLETED)
+            return cached_response
 
-        # --- 2. Process with LLM processor ---
-        self.llm_processor = LLMProcessor(self.profile.processor_config)
+        try:
+            return self._process_with_llm(llm_input_content, input_data, cache_key, cache_ttl)
+        finally:
+            _release_coalesce_lock(cache_key)
+
+    def _process_with_llm(self, llm_input_content, input_data, cache_key=None, cache_ttl=0):
+        """
+        Call the LLM processor and shape its result, caching it under ``cache_key`` if given.
+        """
+        # --- 3. Process with LLM processor ---
         llm_result = self.llm_processor.process(context=llm_input_content, input_data=input_data)
 
         # --- 4. Handle Streaming Response (Generator) ---
@@ -74,22 +234,17 @@ class DirectLLMResponse(BaseOrchestrator):
             return self._stream_and_emit(llm_result)
 
         # --- 5. Handle LLM Error (Non-Streaming) ---
-        if llm_result and 'error' in llm_result:
-            # Early return on error during non-streaming LLM processing
-            return {
-                'error': llm_result['error'],
-                'status': 'LLMProcessor error'
-            }
+        if (error := error_response(llm_result, "LLMProcessor")) is not None:
+            return error
 
         # 6. Emit completed event for one-shot workflow
         self._emit_workflow_event(EVENT_NAME_WORKFLOW_COMPLETED)
 
         # --- 7. Return Structured Non-Streaming Result ---
         # If execution reaches this point, we have a successful, non-streaming result (Dict).
-        response_data = {
-            'response': llm_result.get('response', 'No response available'),
-            'status': 'completed',
-        }
+        response_data = completed_response(llm_result.get('response', 'No response available'))
+        if cache_key:
+            _llm_cache_set(cache_key, response_data, cache_ttl)
         return response_data
 
 
@@ -106,19 +261,10 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
 
     def _attach_olx(self, problem):
         """Return a copy of problem with an 'olx' key containing its OLX string."""
-        try:
-            return {**problem, 'olx': json_to_olx(problem)}
-        except Exception as e:  # pylint: disable=broad-except
-            logger.warning(f"Could not generate OLX for problem: {e}")
+        olx = _safe_json_to_olx(problem)
+        if olx is None:
             return problem
-
-    @property
-    def _schema_path(self):
-        return (
-            Path(__file__).resolve().parent.parent.parent
-            / "response_schemas"
-            / "educator_quiz_questions.json"
-        )
+        return {**problem, 'olx': olx}
 
     def _run_openedx_processor(self):
         """Run the OpenEdX processor to fetch course content."""
@@ -130,15 +276,21 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
         )
         return openedx_processor.process()
 
+    def _build_llm_processor(self, content_result=None):
+        """Build the LLM processor that generates quiz questions."""
+        self.llm_processor = EducatorAssistantProcessor(
+            config=self.profile.processor_config,
+            user=self.user,
+            context=content_result,
+            extra_params={"response_format": _quiz_response_format()}
+        )
+
     def _run_llm_processor(self, content_result, input_data):
         """Run the LLM processor to generate quiz questions."""
-        with open(self._schema_path, 'r', encoding='utf-8') as f:
-            self.llm_processor = EducatorAssistantProcessor(
-                config=self.profile.processor_config,
-                user=self.user,
-                context=content_result,
-                extra_params={"response_format": json.load(f)}
-            )
+        if self.llm_processor is None:
+            self._build_llm_processor(content_result)
+        else:
+            self.llm_processor.context = content_result
         result = self.llm_processor.process(input_data=input_data)
         # EducatorAssistantProcessor returns usage in the result dict rather than
         # accumulating it on self.usage, so we sync it here for auto-lookup.
@@ -153,7 +305,8 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
         - If questions were generated but not yet saved: return them for review.
         - Otherwise: return None.
         """
-        metadata = self.session.metadata or {}
+        session = self._get_existing_session()
+        metadata = (session.metadata if session is not None else None) or {}
         if "collection_url" in metadata:
             return {"response": metadata["collection_url"]}
         if "question_slots" in metadata:
@@ -165,6 +318,17 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
             }
         return {"response": None}
 
+    def _complete_with_metadata(self, metadata):
+        """
+        Store the session metadata, then emit the completed event.
+
+        The metadata is written with a queryset update, which issues a single
+        UPDATE without dispatching the model's save signals.
+        """
+        self.session.metadata = metadata
+        self._save_session_metadata()
+        self._emit_workflow_event(EVENT_NAME_WORKFLOW_COMPLETED)
+
     def run(self, input_data):
         """
         Generate quiz questions.
@@ -172,13 +336,16 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
         If library_id is present in input_data, immediately commit to library (legacy path).
         Otherwise store questions in session metadata for iterative review.
         """
-        content_result = self._run_openedx_processor()
-        if 'error' in content_result:
-            return {'error': content_result['error'], 'status': 'OpenEdXProcessor error'}
+        content_future = self._prefetch(self._run_openedx_processor)
+        # Load the response schema and set up the LLM processor while the content is being fetched
+        self._build_llm_processor()
+        content_result = content_future.result()
+        if (error := error_response(content_result, "OpenEdXProcessor")) is not None:
+            return error
 
         llm_result = self._run_llm_processor(content_result, input_data)
-        if 'error' in llm_result:
-            return {'error': llm_result['error'], 'status': 'LLMProcessor error'}
+        if (error := error_response(llm_result, "LLMProcessor")) is not None:
+            return error
 
         # Iterative path: store questions for review
         response_payload = llm_result.get("response", {}) or {}
@@ -194,18 +361,12 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
         metadata = self.session.metadata or {}
         metadata['question_slots'] = question_slots
         metadata['collection_name'] = collection_name
-        self.session.metadata = metadata
-        self.session.save(update_fields=["metadata"])
+        self._complete_with_metadata(metadata)
 
-        self._emit_workflow_event(EVENT_NAME_WORKFLOW_COMPLETED)
-
-        return {
-            'status': 'completed',
-            'response': {
-                'question_slots': question_slots,
-                'collection_name': collection_name,
-            }
-        }
+        return completed_response({
+            'question_slots': question_slots,
+            'collection_name': collection_name,
+        })
 
     def regenerate_question(self, input_data):
         """
@@ -217,8 +378,8 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
         question_index = input_data.get('question_index')
 
         content_result = self._run_openedx_processor()
-        if 'error' in content_result:
-            return {'error': content_result['error'], 'status': 'OpenEdXProcessor error'}
+        if (error := error_response(content_result, "OpenEdXProcessor")) is not None:
+            return error
 
         metadata = self.session.metadata or {}
         question_slots = metadata.get('question_slots', [])
@@ -230,17 +391,16 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
         input_data['existing_question'] = slot['versions'][slot['selected']]
 
         # Use the dedicated refinement prompt and processor
-        with open(self._schema_path, 'r', encoding='utf-8') as f:
-            llm_processor = EducatorAssistantProcessor(
-                config=self.profile.processor_config,
-                user=self.user,
-                context=content_result,
-                extra_params={"response_format": json.load(f)}
-            )
+        llm_processor = EducatorAssistantProcessor(
+            config=self.profile.processor_config,
+            user=self.user,
+            context=content_result,
+            extra_params={"response_format": _quiz_response_format()}
+        )
 
         llm_result = llm_processor.refine_quiz_question(input_data=input_data)
-        if 'error' in llm_result:
-            return {'error': llm_result['error'], 'status': 'LLMProcessor error'}
+        if (error := error_response(llm_result, "LLMProcessor")) is not None:
+            return error
 
         problems = (llm_result.get("response") or {}).get("problems") or []
         if not problems:
@@ -254,15 +414,12 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
 
         metadata['question_slots'] = question_slots
         self.session.metadata = metadata
-        self.session.save(update_fields=["metadata"])
-        return {
-            'status': 'completed',
-            'response': {
-                'question': new_question,
-                'history': slot['versions'],
-                'selected': slot['selected'],
-            },
-        }
+        self._save_session_metadata()
+        return completed_response({
+            'question': new_question,
+            'history': slot['versions'],
+            'selected': slot['selected'],
+        })
 
     def save(self, input_data):
         """
@@ -280,14 +437,7 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
             or 'AI Generated Questions'
         )
 
-        items = []
-        for problem in questions:
-            try:
-                olx_content = json_to_olx(problem)
-                items.append(olx_content)
-            except Exception as e:  # pylint: disable=broad-except
-                logger.exception(f"Error converting problem to OLX: {e}")
-                continue
+        items = [olx for problem in questions if (olx := _safe_json_to_olx(problem)) is not None]
 
         library_processor = ContentLibraryProcessor(
             library_key=lib_key_str,
@@ -304,10 +454,5 @@ class EducatorAssistantOrchestrator(SessionBasedOrchestrator):
         metadata['collection_url'] = collection_url
         metadata['library_id'] = lib_key_str
         metadata['collection_id'] = collection_key
-        self.session.metadata = metadata
-        self.session.save(update_fields=["metadata"])
-        self._emit_workflow_event(EVENT_NAME_WORKFLOW_COMPLETED)
-        return {
-            'status': 'completed',
-            'response': collection_url,
-        }
+        self._complete_with_metadata(metadata)
+        return completed_response(collection_url)
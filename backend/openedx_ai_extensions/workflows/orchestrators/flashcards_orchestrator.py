@@ -6,8 +6,10 @@ import random
 from pathlib import Path
 
 from openedx_ai_extensions.processors import LLMProcessor, OpenEdXProcessor
+from openedx_ai_extensions.utils import serialize_context
 from openedx_ai_extensions.xapi.constants import EVENT_NAME_WORKFLOW_COMPLETED
 
+from .base_orchestrator import completed_response, error_response
 from .session_based_orchestrator import ScopedSessionOrchestrator
 
 
@@ -62,14 +64,11 @@ class FlashCardsOrchestrator(ScopedSessionOrchestrator):
         content_result = openedx_processor.process()
 
         # Early return on error during content fetching
-        if content_result and 'error' in content_result:
-            return {
-                'error': content_result['error'],
-                'status': 'OpenEdXProcessor error'
-            }
+        if (error := error_response(content_result, "OpenEdXProcessor")) is not None:
+            return error
 
         # Convert fetched content to a string format suitable for the LLM
-        llm_input_content = str(content_result)
+        llm_input_content = serialize_context(content_result)
 
         if input_data.get('num_cards', None) is None:
             # Generate random number of cards between 1 and 25 if num_cards is not provided or is None
@@ -101,11 +100,8 @@ class FlashCardsOrchestrator(ScopedSessionOrchestrator):
             input_data=input_data,
         )
 
-        if llm_result and 'error' in llm_result:
-            return {
-                'error': llm_result['error'],
-                'status': 'LLMProcessor error'
-            }
+        if (error := error_response(llm_result, "LLMProcessor")) is not None:
+            return error
 
         self._emit_workflow_event(EVENT_NAME_WORKFLOW_COMPLETED)
 
@@ -117,13 +113,9 @@ class FlashCardsOrchestrator(ScopedSessionOrchestrator):
             existing_cards.extend(cards)
         else:
             self.session.metadata['cards'] = cards
-        self.session.save(update_fields=['metadata'])
+        self._save_session_metadata()
 
-        response_data = {
-            'response': cards,
-            'status': 'completed',
-        }
-        return response_data
+        return completed_response(cards)
 
     def save(self, input_data):
         """
@@ -138,7 +130,7 @@ class FlashCardsOrchestrator(ScopedSessionOrchestrator):
             else:
                 cards = card_stack
         self.session.metadata['cards'] = cards
-        self.session.save(update_fields=['metadata'])
+        self._save_session_metadata()
         num_cards = len(cards) if cards else 0
         return {
             'status': 'saved',
@@ -152,7 +144,8 @@ class FlashCardsOrchestrator(ScopedSessionOrchestrator):
         - If flashcards were generated but not yet saved: return them for review.
         - Otherwise: return None.
         """
-        metadata = self.session.metadata or {}
+        session = self._get_existing_session()
+        metadata = (session.metadata if session is not None else None) or {}
         if "cards" in metadata:
             return {
                 'cards': metadata['cards'],
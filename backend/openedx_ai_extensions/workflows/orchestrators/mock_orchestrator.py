@@ -4,12 +4,26 @@ Mock orchestrator for testing and development.
 import logging
 import time
 
+from django.conf import settings
+
 from openedx_ai_extensions.xapi.constants import EVENT_NAME_WORKFLOW_COMPLETED
 
-from .base_orchestrator import BaseOrchestrator
+from .base_orchestrator import BaseOrchestrator, completed_response
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded once; the text is ASCII so fixed-size byte slices never split a character.
+_MOCK_STREAM_BYTES = (
+    "This streaming function emits incremental chunks of data as they become available, "
+    "rather than waiting for the full response to be computed. It is designed for low-latency, "
+    "real-time consumption, allowing callers to process partial results immediately. Each yielded "
+    "event represents a discrete update in the stream and may contain content, metadata, "
+    "or control signals.The stream remains open until completion or error, at which point "
+    "it is gracefully closed. Consumers are expected to iterate over the stream sequentially "
+    "and handle partial data, retries, or early termination as needed."
+).encode("ascii")
+_MOCK_STREAM_CHUNK_SIZE = 15
+
 
 class MockResponse(BaseOrchestrator):
     """
@@ -21,10 +35,9 @@ class MockResponse(BaseOrchestrator):
         # Emit completed event for one-shot workflow
         self._emit_workflow_event(EVENT_NAME_WORKFLOW_COMPLETED)
 
-        return {
-            "response": f"Mock response for {self.workflow.action} at {time.strftime('%Y-%m-%d %H:%M:%S')}",
-            "status": "completed",
-        }
+        return completed_response(
+            f"Mock response for {self.workflow.action} at {time.strftime('%Y-%m-%d %H:%M:%S')}"
+        )
 
 
 class MockStreamResponse(BaseOrchestrator):
@@ -37,19 +50,12 @@ class MockStreamResponse(BaseOrchestrator):
         # Emit completed event for one-shot workflow
         self._emit_workflow_event(EVENT_NAME_WORKFLOW_COMPLETED)
 
+        delay = getattr(settings, "AI_EXTENSIONS_MOCK_STREAM_DELAY", 0.01)
+
         def stream_generator():
-            mock_response = (
-                "This streaming function emits incremental chunks of data as they become available, "
-                "rather than waiting for the full response to be computed. It is designed for low-latency, "
-                "real-time consumption, allowing callers to process partial results immediately. Each yielded "
-                "event represents a discrete update in the stream and may contain content, metadata, "
-                "or control signals.The stream remains open until completion or error, at which point "
-                "it is gracefully closed. Consumers are expected to iterate over the stream sequentially "
-                "and handle partial data, retries, or early termination as needed."
-            )
-            chunk_size = 15
-            for i in range(0, len(mock_response), chunk_size):
-                time.sleep(0.01)
-                yield mock_response[i:i + chunk_size].encode("utf-8")
+            for i in range(0, len(_MOCK_STREAM_BYTES), _MOCK_STREAM_CHUNK_SIZE):
+                if delay:
+                    time.sleep(delay)
+                yield _MOCK_STREAM_BYTES[i:i + _MOCK_STREAM_CHUNK_SIZE]
 
         return stream_generator()
@@ -1,10 +1,13 @@
 """
 Session-based orchestrator.
 """
+import json
 import logging
 
 from celery import shared_task
 from celery.exceptions import SoftTimeLimitExceeded
+from django.db import NotSupportedError
+from django.db.models import F, Func, JSONField, Model
 
 from openedx_ai_extensions.processors import SubmissionProcessor
 from openedx_ai_extensions.workflows.models import AIWorkflowSession
@@ -13,11 +16,69 @@ from .base_orchestrator import BaseOrchestrator
 
 logger = logging.getLogger(__name__)
 
+# Orchestrator methods the async task may call; run_async only enqueues "run"
+_ASYNC_ACTIONS = frozenset({"run"})
 
+
+class _SetJSONKeys(Func):  # pylint: disable=abstract-method
+    """
+    Replace top-level keys of a JSON column inside the UPDATE statement.
+
+    The merge happens in the database, so the row does not need to be read
+    first and concurrent writers touching other keys are not overwritten.
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, field_name, values):
+        self.values = values
+        super().__init__(F(field_name))
+
+    def _json_set(self, compiler, function, empty_object, value_sql):
+        """Compile a JSON_SET-style call setting each key of ``self.values``."""
+        column_sql, params = compiler.compile(self.get_source_expressions()[0])
+        params = list(params)
+        args = [f"COALESCE({column_sql}, {empty_object})"]
+        for key, value in self.values.items():
+            args.append(f"%s, {value_sql}")
+            params += [f"$.{key}", json.dumps(value)]
+        return f"{function}({', '.join(args)})", params
+
+    def as_sql(self, compiler, connection, *args, **extra_context):
+        raise NotSupportedError(f"JSON key updates are not supported on {connection.vendor}")
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self._json_set(compiler, "json_set", "'{}'", "json(%s)")
+
+    def as_mysql(self, compiler, connection, **extra_context):  # pylint: disable=unused-argument
+        return self._json_set(compiler, "JSON_SET", "JSON_OBJECT()", "JSON_EXTRACT(%s, '$')")
+
+    def as_postgresql(self, compiler, connection, **extra_context):  # pylint: disable=unused-argument
+        column_sql, params = compiler.compile(self.get_source_expressions()[0])
+        return (
+            f"(COALESCE({column_sql}, '{{}}'::jsonb) || %s::jsonb)",
+            [*params, json.dumps(self.values)],
+        )
+
+
+def _patch_session_metadata(session_id, **values):
+    """
+    Set ``values`` in the metadata of session ``session_id`` with a single UPDATE.
+    """
+    AIWorkflowSession.objects.filter(id=session_id).update(
+        metadata=_SetJSONKeys("metadata", values)
+    )
+
+
+# The hard limit SIGKILLs the worker, so leave the soft-limit handler a full
+# minute to record the timeout in session metadata before that happens.
+# Outcomes are published through session metadata, never read from the
+# result backend, so results are not stored there.
 @shared_task(
     name="openedx_ai_extensions.workflows.execute_orchestrator",
     bind=True,
-    time_limit=300,
+    ignore_result=True,
+    time_limit=330,
     soft_time_limit=270
 )
 def _execute_orchestrator_async(task_self, session_id, action, params=None):
@@ -31,15 +92,23 @@ def _execute_orchestrator_async(task_self, session_id, action, params=None):
         params: Dictionary of parameters to pass to the action method
 
     Returns:
-        Result from the orchestrator action method
+        Result from the orchestrator action method, or None if ``action``
+        may not be executed asynchronously
     """
 
     task_id = task_self.request.id
     params = params or {}
 
+    if action not in _ASYNC_ACTIONS:
+        logger.error("Task %s: Action '%s' cannot be executed asynchronously", task_id, action)
+        return None
+
     try:
-        # 1. Get the session from the database
-        session = AIWorkflowSession.objects.select_related('scope', 'profile', 'user').get(id=session_id)
+        # 1. Get the session from the database, joining everything the
+        # orchestrator dereferences (the factory reads scope.profile.config,
+        # served from the compiled row) so no further lookups are needed to
+        # build it
+        session = AIWorkflowSession.objects.select_related('scope__profile__compiled', 'user').get(id=session_id)
 
         # 2. Build context from session
         metadata = session.metadata or {}
@@ -50,7 +119,7 @@ def _execute_orchestrator_async(task_self, session_id, action, params=None):
         }
 
         # 3. Resolve and instantiate orchestrator via centralized factory
-        orchestrator_name = session.profile.orchestrator_class
+        orchestrator_name = session.scope.profile.orchestrator_class
         try:
             orchestrator = BaseOrchestrator.get_orchestrator(
                 workflow=session.scope,
@@ -59,72 +128,137 @@ def _execute_orchestrator_async(task_self, session_id, action, params=None):
             )
         except (AttributeError, TypeError) as exc:
             logger.error(
-                f"Task {task_id}: Failed to resolve orchestrator: {exc}",
+                "Task %s: Failed to resolve orchestrator: %s", task_id, exc,
                 exc_info=True,
             )
             raise
 
-        # 4. Set the runtime action so xAPI events carry the correct action name
+        # 4. Set the runtime action so xAPI events carry the correct action name,
+        # and hand over the already-loaded session so it is not looked up again
         orchestrator.workflow.action = action
+        orchestrator.session = session
 
         # 5. Validate action exists
-        if not hasattr(orchestrator, action):
+        orchestrator_method = getattr(orchestrator, action, None)
+        if orchestrator_method is None:
             error_msg = f"Orchestrator '{orchestrator_name}' does not have method '{action}'"
-            logger.error(f"Task {task_id}: {error_msg}")
+            logger.error("Task %s: %s", task_id, error_msg)
             raise AttributeError(error_msg)
 
         # 6. Call the action method with params
-        orchestrator_method = getattr(orchestrator, action)
-        logger.info(f"Task {task_id}: Executing {orchestrator_name}.{action} for session {session_id}")
+        logger.info("Task %s: Executing %s.%s for session %s", task_id, orchestrator_name, action, session_id)
         result = orchestrator_method(**params)
 
         # 7. Update session metadata with result
-        # Re-fetch from DB to pick up any metadata changes the orchestrator method
-        # saved during execution (e.g. question_slots, collection_name), so we
-        # don't overwrite them with the stale in-memory copy.
-        session.refresh_from_db(fields=['metadata'])
-        session.metadata['task_result'] = result
-        session.metadata['task_status'] = 'completed'
-        session.save(update_fields=['metadata'])
-
-        logger.info(f"Task {task_id}: Completed successfully")
+        # Only the task keys are written, server-side, so metadata the
+        # orchestrator method saved during execution (e.g. question_slots,
+        # collection_name) is kept without re-reading the row.
+        _patch_session_metadata(session_id, task_result=result, task_status='completed')
+
+        logger.info("Task %s: Completed successfully", task_id)
         return result
 
     except SoftTimeLimitExceeded:
-        logger.error(f"Task {task_id}: Soft time limit exceeded for session {session_id}")
-        session.metadata['task_status'] = 'timeout'
-        session.metadata['task_error'] = 'Task exceeded time limit'
-        session.save(update_fields=['metadata'])
+        logger.error("Task %s: Soft time limit exceeded for session %s", task_id, session_id)
+        _patch_session_metadata(session_id, task_status='timeout', task_error='Task exceeded time limit')
         raise
 
     except AIWorkflowSession.DoesNotExist:
-        logger.error(f"Task {task_id}: Session {session_id} not found")
+        logger.error("Task %s: Session %s not found", task_id, session_id)
         raise
 
     except Exception as e:
-        logger.error(f"Task {task_id}: Error executing {action} for session {session_id}: {str(e)}")
-        session.metadata['task_status'] = 'error'
-        session.metadata['task_error'] = str(e)
-        session.save(update_fields=['metadata'])
+        logger.error("Task %s: Error executing %s for session %s: %s", task_id, action, session_id, e)
+        _patch_session_metadata(session_id, task_status='error', task_error=str(e))
         raise
 
 
+def _get_session(lookup, create):
+    """
+    Return the AIWorkflowSession matching ``lookup``.
+
+    Model instances passed in ``lookup`` are attached to the returned session,
+    so dereferencing ``session.user`` and friends does not query them again.
+
+    Args:
+        lookup: Field values identifying the session (user, scope, profile, ...).
+        create: Whether to create the session when it does not exist yet.
+
+    Returns:
+        AIWorkflowSession, or None if it does not exist and ``create`` is False.
+    """
+    if create:
+        session, _ = AIWorkflowSession.objects.get_or_create(**lookup)
+    else:
+        session = AIWorkflowSession.objects.filter(**lookup).first()
+        if session is None:
+            return None
+
+    for name, value in lookup.items():
+        if isinstance(value, Model):
+            setattr(session, name, value)
+    return session
+
+
+def get_or_create_session(**lookup):
+    """
+    Return the AIWorkflowSession matching ``lookup``, creating it if needed.
+    """
+    return _get_session(lookup, create=True)
+
+
+def find_session(**lookup):
+    """
+    Return the AIWorkflowSession matching ``lookup``, or None if there is none.
+    """
+    return _get_session(lookup, create=False)
+
+
 class SessionBasedOrchestrator(BaseOrchestrator):
     """Orchestrator that provides session-based LLM responses."""
 
     def __init__(self, workflow, user, context):
 
         super().__init__(workflow, user, context)
-        self.session, _ = AIWorkflowSession.objects.get_or_create(
-            user=self.user,
-            scope=self.workflow,
-            profile=self.workflow.profile,
-            course_id=self.course_id,
-            location_id=self.location_id,
-        )
+        self._session = None
+
+    def _session_lookup(self):
+        """Return the field values identifying this orchestrator's session."""
+        return {
+            "user": self.user,
+            "scope": self.workflow,
+            "profile": self.workflow.profile,
+            "course_id": self.course_id,
+            "location_id": self.location_id,
+        }
+
+    @property
+    def session(self):
+        """
+        The AIWorkflowSession of this orchestrator, loaded or created on first use.
+
+        Actions that only read session state use ``_get_existing_session``
+        instead, so they never insert a row for a user who has not started
+        the workflow.
+        """
+        if self._session is None:
+            self._session = get_or_create_session(**self._session_lookup())
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+
+    def _get_existing_session(self):
+        """Return the session if it already exists, without creating it."""
+        if self._session is None:
+            self._session = find_session(**self._session_lookup())
+        return self._session
 
     def clear_session(self, _):
-        self.session.delete()
+        session = self._get_existing_session()
+        if session is not None:
+            session.delete()
         return {
             "response": "",
             "status": "session_cleared",
@@ -143,17 +277,24 @@ class SessionBasedOrchestrator(BaseOrchestrator):
         Write an intermediate status message to session metadata so pollers
         can surface step-level progress while the task is running.
         """
+        if self.session.metadata.get('task_status_message') == message:
+            return
         self.session.metadata['task_status_message'] = message
-        self.session.save(update_fields=['metadata'])
+        self._save_session_metadata()
 
-    def run_async(self, input_data):
+    def _save_session_metadata(self):
         """
-        Launch async task to execute the run method.
+        Persist ``self.session.metadata`` with a single UPDATE.
 
-        Args:
-            input_data: Input data to pass to the run method
+        Equivalent to ``save(update_fields=['metadata'])`` without the model
+        save pipeline; no signal receivers are attached to AIWorkflowSession.
         """
+        AIWorkflowSession.objects.filter(pk=self.session.pk).update(metadata=self.session.metadata)
 
+    def _start_async_run(self):
+        """
+        Mark the session as processing and clear the previous task's outcome.
+        """
         self.session.course_id = self.course_id
         self.session.location_id = self.location_id
         self.session.metadata = self.session.metadata or {}
@@ -163,6 +304,24 @@ class SessionBasedOrchestrator(BaseOrchestrator):
         self.session.metadata.pop('task_status_message', None)
         self.session.save()
 
+    @staticmethod
+    def _async_started_response(task_id):
+        """Build the result returned to the caller once the async task is queued."""
+        return {
+            'status': 'processing',
+            'task_id': task_id,
+            'message': 'AI workflow has started'
+        }
+
+    def run_async(self, input_data):
+        """
+        Launch async task to execute the run method.
+
+        Args:
+            input_data: Input data to pass to the run method
+        """
+        self._start_async_run()
+
         task = _execute_orchestrator_async.delay(
             session_id=self.session.id,
             action='run',
@@ -171,11 +330,7 @@ class SessionBasedOrchestrator(BaseOrchestrator):
             }
         )
 
-        return {
-            'status': 'processing',
-            'task_id': task.id,
-            'message': 'AI workflow has started'
-        }
+        return self._async_started_response(task.id)
 
     def get_run_status(self, input_data):  # pylint: disable=unused-argument
         """
@@ -184,7 +339,8 @@ class SessionBasedOrchestrator(BaseOrchestrator):
         Returns:
             dict: Status information including task result if completed
         """
-        metadata = self.session.metadata or {}
+        session = self._get_existing_session()
+        metadata = (session.metadata if session is not None else None) or {}
         task_status = metadata.get('task_status', 'idle')
 
         if task_status == 'completed':
@@ -218,23 +374,18 @@ class ScopedSessionOrchestrator(SessionBasedOrchestrator):  # pylint: disable=ab
     """
     Orchestrator that follows the scope's location specificity for sessions.
 
-    Intentionally skips ``SessionBasedOrchestrator.__init__`` to avoid creating
-    a location-specific session; instead creates a course-scoped session
-    shared across locations.
+    Its session is course-scoped and shared across locations, so the lookup
+    leaves out ``location_id``.
     """
 
-    def __init__(self, workflow, user, context):  # pylint: disable=super-init-not-called
-        BaseOrchestrator.__init__(self, workflow, user, context)  # pylint: disable=non-parent-init-called
-        self.session, _ = AIWorkflowSession.objects.get_or_create(
-            user=self.user,
-            scope=self.workflow,
-            profile=self.workflow.profile,
-            course_id=self.course_id,
-        )
+    def _session_lookup(self):
+        lookup = super()._session_lookup()
+        del lookup["location_id"]
+        return lookup
 
-    def run_async(self, input_data):
+    def _start_async_run(self):
         """
-        Launch async task for scoped sessions.
+        Mark the scoped session as processing.
 
         Unlike the parent implementation, this does **not** write
         ``location_id`` to the session row (which has no location_id in its
@@ -251,17 +402,3 @@ class ScopedSessionOrchestrator(SessionBasedOrchestrator):  # pylint: disable=ab
         self.session.metadata.pop('task_error', None)
         self.session.metadata.pop('task_status_message', None)
         self.session.save()
-
-        task = _execute_orchestrator_async.delay(
-            session_id=self.session.id,
-            action='run',
-            params={
-                "input_data": input_data,
-            }
-        )
-
-        return {
-            'status': 'processing',
-            'task_id': task.id,
-            'message': 'AI workflow has started'
-        }
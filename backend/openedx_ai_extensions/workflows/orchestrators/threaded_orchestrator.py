@@ -8,14 +8,41 @@ import re
 
 from openedx_ai_extensions.processors import LLMProcessor, OpenEdXProcessor
 from openedx_ai_extensions.processors.llm.providers import provider_supports
-from openedx_ai_extensions.utils import STREAMING_FAILED_MESSAGE, is_generator, normalize_input_to_text
+from openedx_ai_extensions.utils import (
+    STREAMING_FAILED_MESSAGE,
+    is_generator,
+    normalize_input_to_text,
+    serialize_context,
+)
 from openedx_ai_extensions.xapi.constants import EVENT_NAME_WORKFLOW_INITIALIZED, EVENT_NAME_WORKFLOW_INTERACTED
 
+from .base_orchestrator import completed_response
 from .session_based_orchestrator import SessionBasedOrchestrator
 
 logger = logging.getLogger(__name__)
 
 
+def _current_messages_from_json(raw):
+    """Return ``current_messages`` from a JSON payload, or 0 if it cannot be read."""
+    if not raw:
+        return 0
+    try:
+        parsed = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return 0
+    return parsed.get("current_messages", 0) if isinstance(parsed, dict) else 0
+
+
+# Maps the exact type of lazy_load_chat_history's input_data to a reader for the
+# number of messages the frontend already has loaded.
+_CURRENT_MESSAGES_PARSERS = {
+    dict: lambda data: data.get("current_messages", 0),
+    str: _current_messages_from_json,
+    bytes: _current_messages_from_json,
+    int: lambda data: data,
+}
+
+
 class ThreadedLLMResponse(SessionBasedOrchestrator):
     """
     Threaded orchestrator for conversational workflows.
@@ -29,17 +56,8 @@ class ThreadedLLMResponse(SessionBasedOrchestrator):
         """
 
         # Extract current_messages_count from input_data
-        current_messages_count = 0
-        if isinstance(input_data, dict):
-            current_messages_count = input_data.get("current_messages", 0)
-        elif isinstance(input_data, str):
-            try:
-                parsed_data = json.loads(input_data)
-                current_messages_count = parsed_data.get("current_messages", 0)
-            except (json.JSONDecodeError, AttributeError):
-                current_messages_count = 0
-        elif isinstance(input_data, int):
-            current_messages_count = input_data
+        parser = _CURRENT_MESSAGES_PARSERS.get(type(input_data))
+        current_messages_count = parser(input_data) if parser else 0
 
         submission_processor = self._get_submission_processor()
         result = submission_processor.get_previous_messages(current_messages_count)
@@ -50,34 +68,44 @@ class ThreadedLLMResponse(SessionBasedOrchestrator):
                 "status": "error",
             }
 
-        return {
-            "response": result.get("response") or "{}",
-            "status": "completed",
-        }
+        return completed_response(result.get("response") or "{}")
+
+    def _emit_interaction_event(self, is_first_interaction):
+        """
+        Emit the initialized event for a new conversation, or interacted for a follow-up.
+        """
+        self._emit_workflow_event(
+            EVENT_NAME_WORKFLOW_INITIALIZED if is_first_interaction else EVENT_NAME_WORKFLOW_INTERACTED
+        )
 
     def _stream_and_save_history(self, generator, input_data,  # pylint: disable=too-many-positional-arguments
-                                 submission_processor,
+                                 submission_processor, provider=None,
                                  initial_system_msgs=None, is_first_interaction=False):
         """
         Yields chunks to the view while accumulating text to save to DB
         once the stream finishes.
+
+        ``provider`` is resolved by the caller before streaming starts so the
+        post-stream phase does not need to reach back into the LLM processor.
         """
-        full_response_text = []
+        # Raw utf-8 bytes of the whole response, decoded once when the stream ends.
+        # This also keeps multi-byte characters split across chunks intact.
+        response_buffer = bytearray()
 
         try:
             # 1. Iterate and Yield (Streaming Phase)
             for chunk in generator:
-                # chunk is bytes (encoded utf-8) from processor
-                if isinstance(chunk, bytes):
-                    text_chunk = chunk.decode("utf-8", errors="ignore")
-                else:
-                    text_chunk = str(chunk)
+                # chunk is bytes (encoded utf-8) from processor; the try is free on
+                # that path, and anything else is encoded from its text form
+                try:
+                    response_buffer.extend(chunk)
+                except TypeError:
+                    response_buffer.extend(str(chunk).encode("utf-8"))
 
-                full_response_text.append(text_chunk)
                 yield chunk
 
         except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.error(f"Error in stream wrapper: {e}")
+            logger.error("Error in stream wrapper: %s", e)
             error_marker = json.dumps({
                 "error_in_stream": True,
                 "code": "streaming_failed",
@@ -88,7 +116,7 @@ class ThreadedLLMResponse(SessionBasedOrchestrator):
         finally:
             # 2. Save History (Post-Stream Phase)
             # This executes after the view has consumed the last chunk
-            final_response = "".join(full_response_text)
+            final_response = response_buffer.decode("utf-8", errors="ignore")
 
             if "||{\"error_in_stream\":" in final_response:
                 # Target specifically the error-in-stream JSON marker
@@ -102,22 +130,21 @@ class ThreadedLLMResponse(SessionBasedOrchestrator):
 
             messages = [{"role": "assistant", "content": final_response}]
             if user_text:
-                messages.insert(0, {"role": "user", "content": user_text})
+                messages = [{"role": "user", "content": user_text}] + messages
 
             # Re-inject system messages if this was a new thread (and not OpenAI)
-            provider = self.llm_processor.get_provider()
             if not provider_supports(provider, "server_side_thread_id") and initial_system_msgs:
-                for msg in initial_system_msgs:
-                    messages.insert(0, {"role": msg["role"], "content": msg["content"]})
+                messages = [
+                    {"role": msg["role"], "content": msg["content"]} for msg in initial_system_msgs
+                ] + messages
 
             try:
-                submission_processor.update_chat_submission(messages)
-                if is_first_interaction:
-                    self._emit_workflow_event(EVENT_NAME_WORKFLOW_INITIALIZED)
-                else:
-                    self._emit_workflow_event(EVENT_NAME_WORKFLOW_INTERACTED)
+                # Nothing was said on either side, so there is no turn to record
+                if user_text or final_response:
+                    submission_processor.update_chat_submission(messages)
+                self._emit_interaction_event(is_first_interaction)
             except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.error(f"Failed to save chat history after stream: {e}")
+                logger.error("Failed to save chat history after stream: %s", e)
 
     def run(self, input_data):
         context = {
@@ -133,34 +160,34 @@ class ThreadedLLMResponse(SessionBasedOrchestrator):
         # 1. get chat history if there is user session
         if has_previous_session and not input_data:
             history_result = submission_processor.process(context=context)
-            return {
-                "response": history_result.get("response") or "No response available",
-                "status": "completed",
-            }
+            return completed_response(history_result.get("response") or "No response available")
 
-        # 2. else process with OpenEdX processor
+        # 2. else process with OpenEdX processor; the fetch may overlap with step 3
         openedx_processor = OpenEdXProcessor(
             processor_config=self.profile.processor_config,
             location_id=self.location_id,
             course_id=self.course_id,
             user=self.user,
         )
-        content_result = openedx_processor.process()
+        content_future = self._prefetch(openedx_processor.process)
 
         # 3. Process with LLM processor
         self.llm_processor = LLMProcessor(self.profile.processor_config, self.session)
+        provider = self.llm_processor.get_provider()
 
-        # Only fetch history if we don't have a remote thread ID.
+        # Only fetch history if we don't have a remote thread ID and the
+        # configured processor function actually sends it to the LLM.
         # This reduces DB + JSON overhead on every request.
         # Fallback (self-healing) is handled via lazy-fetching or explicit retry if needed.
         has_remote_id = bool(self.session and self.session.remote_response_id)
         chat_history = []
-        if not has_remote_id:
+        if not has_remote_id and self.llm_processor.uses_chat_history():
             chat_history = submission_processor.get_full_message_history() or []
 
         # Call the processor
+        content_result = content_future.result()
         llm_result = self.llm_processor.process(
-            context=str(content_result), input_data=input_data, chat_history=chat_history
+            context=serialize_context(content_result), input_data=input_data, chat_history=chat_history
         )
 
         # --- BRANCH A: Handle Streaming (Generator) ---
@@ -169,34 +196,28 @@ class ThreadedLLMResponse(SessionBasedOrchestrator):
                 generator=llm_result,
                 input_data=input_data,
                 submission_processor=submission_processor,
+                provider=provider,
                 initial_system_msgs=None,
                 is_first_interaction=is_first_interaction,
             )
 
         # --- BRANCH B: Handle Non-Streaming (Standard) ---
+        # Save system messages (if present) so they are available in local history
+        # for fallback if remote threading is lost.
         messages = [
-            {"role": "assistant", "content": llm_result.get("response") or ""},
+            {"role": msg["role"], "content": msg["content"]}
+            for msg in llm_result.get("system_messages", [])
         ]
         user_text = normalize_input_to_text(input_data)
         if user_text:
-            messages.insert(0, {"role": "user", "content": user_text})
+            messages.append({"role": "user", "content": user_text})
+        response_text = llm_result.get("response") or ""
+        messages.append({"role": "assistant", "content": response_text})
 
-        # Save system messages (if present) so they are available in local history
-        # for fallback if remote threading is lost.
-        system_messages = llm_result.get("system_messages", [])
-        for msg in reversed(system_messages):
-            messages.insert(0, {"role": msg["role"], "content": msg["content"]})
-
-        submission_processor.update_chat_submission(messages)
-
-        # Emit appropriate event based on interaction state
-        if is_first_interaction:
-            self._emit_workflow_event(EVENT_NAME_WORKFLOW_INITIALIZED)
-        else:
-            self._emit_workflow_event(EVENT_NAME_WORKFLOW_INTERACTED)
+        # Nothing was said on either side, so there is no turn to record
+        if user_text or response_text:
+            submission_processor.update_chat_submission(messages)
+        self._emit_interaction_event(is_first_interaction)
 
         # 4. Return result
-        return {
-            "response": llm_result.get("response") or "No response available",
-            "status": "completed",
-        }
+        return completed_response(llm_result.get("response") or "No response available")
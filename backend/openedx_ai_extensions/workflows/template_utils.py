@@ -4,13 +4,18 @@ Utilities for discovering, loading, and validating workflow templates.
 Templates are read-only JSON5 files stored on disk (allowing comments).
 Security: Only load from configured directories to prevent path traversal.
 """
+import copy
+import functools
+import hashlib
+import json
 import logging
+import os
+import re
 from pathlib import Path
 from typing import Optional
 
 import json5
 from django.conf import settings
-from jsonmerge import merge
 from jsonschema import Draft7Validator
 
 from openedx_ai_extensions.models import PromptTemplate
@@ -68,6 +73,16 @@ WORKFLOW_SCHEMA = {
     "additionalProperties": True
 }
 
+# WORKFLOW_SCHEMA is a constant, so check and build its validator only once
+Draft7Validator.check_schema(WORKFLOW_SCHEMA)
+_WORKFLOW_VALIDATOR = Draft7Validator(WORKFLOW_SCHEMA)
+
+# Word characters and dots, e.g. "ThreadedLLMResponse" or "my_plugin.orchestrators.Custom"
+_ORCHESTRATOR_CLASS_PATTERN = re.compile(r"[\w.]+")
+
+# Top-level keys whose structure _validate_semantics checks
+_SEMANTIC_KEYS = ("orchestrator_class", "processor_config", "actuator_config")
+
 
 def get_template_directories() -> list[Path]:
     """
@@ -92,23 +107,23 @@ def get_template_directories() -> list[Path]:
     return paths
 
 
-def is_safe_template_path(template_path: str) -> bool:
+def find_template_file(template_path: str) -> Optional[Path]:
     """
-    Verify that a template path is safe (no path traversal attacks).
+    Resolve a relative template path to a file inside an allowed directory.
 
     Args:
         template_path: Relative path to template file
 
     Returns:
-        True if path is safe, False otherwise
+        Absolute Path of the template file, or None if unsafe or not found
     """
     if not template_path:
-        return False
+        return None
 
     # Check for path traversal attempts
     if ".." in template_path or template_path.startswith("/"):
         logger.warning(f"Rejected unsafe template path: {template_path}")
-        return False
+        return None
 
     # Verify the file exists in one of the allowed directories
     template_dirs = get_template_directories()
@@ -119,49 +134,129 @@ def is_safe_template_path(template_path: str) -> bool:
         try:
             full_path.relative_to(base_dir)
             if full_path.exists() and full_path.is_file():
-                return True
+                return full_path
         except ValueError:
             # Path is outside the base directory
             continue
 
-    return False
+    return None
+
+
+def is_safe_template_path(template_path: str) -> bool:
+    """
+    Verify that a template path is safe (no path traversal attacks).
+
+    Args:
+        template_path: Relative path to template file
+
+    Returns:
+        True if path is safe, False otherwise
+    """
+    return find_template_file(template_path) is not None
+
+
+# Last discovery result per set of template directories, stored together with
+# the (path, mtime_ns) of every directory that was walked to produce it
+_discovered_templates = {}
+
+
+def _directory_mtimes(directories) -> Optional[tuple]:
+    """
+    Return the current (path, mtime_ns) of each directory, or None if one is gone.
+    """
+    try:
+        return tuple((directory, os.stat(directory).st_mtime_ns) for directory, _ in directories)
+    except OSError:
+        return None
+
+
+def _scan_template_dir(directory: str, prefix: str, templates: list, walked: list) -> None:
+    """
+    Recursively collect .json templates below ``directory``.
+
+    Uses ``os.scandir`` so file/directory checks come from the directory
+    listing itself instead of a separate stat per entry.
+    """
+    try:
+        walked.append((directory, os.stat(directory).st_mtime_ns))
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    _scan_template_dir(entry.path, f"{prefix}{entry.name}/", templates, walked)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    rel_path = f"{prefix}{entry.name}"
+                    # Create display name (remove .json, replace slashes with dots)
+                    templates.append((rel_path, rel_path[:-len(".json")].replace("/", ".")))
+    except OSError as e:
+        logger.warning(f"Error scanning template directory {directory}: {e}")
 
 
 def discover_templates() -> list[tuple[str, str]]:
     """
     Discover all available workflow templates.
 
+    The result is cached until the modification time of any walked directory
+    changes, i.e. until a template file or subdirectory is added or removed.
+
     Returns:
         List of (relative_path, display_name) tuples for Django choices
     """
-    templates = []
-    template_dirs = get_template_directories()
-
-    for base_dir in template_dirs:
-        # Find all .json files recursively
-        for json_file in base_dir.rglob("*.json"):
-            try:
-                # Get relative path from base directory
-                rel_path = json_file.relative_to(base_dir)
+    template_dirs = tuple(str(base_dir) for base_dir in get_template_directories())
 
-                # Create display name (remove .json, replace slashes with dots)
-                display_name = str(rel_path.with_suffix("")).replace("/", ".")
+    cached = _discovered_templates.get(template_dirs)
+    if cached is not None:
+        walked, templates = cached
+        if _directory_mtimes(walked) == walked:
+            return list(templates)
 
-                templates.append((str(rel_path), display_name))
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.warning(f"Error processing template {json_file}: {e}")
+    templates = []
+    walked = []
+    for base_dir in template_dirs:
+        _scan_template_dir(base_dir, "", templates, walked)
 
     # Sort by display name
     templates.sort(key=lambda x: x[1])
 
+    _discovered_templates[template_dirs] = (tuple(walked), tuple(templates))
     return templates
 
 
+def _parse_json5(text: str):
+    """
+    Parse JSON5 text, trying the C-accelerated stdlib ``json`` parser first.
+
+    Most templates and patches are plain JSON, so the pure-Python ``json5``
+    parser is only used when the text relies on JSON5 extensions.
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json5.loads(text)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_template_cached(full_path: str, mtime_ns: int) -> dict:  # pylint: disable=unused-argument
+    """
+    Read and parse a template file.
+
+    ``mtime_ns`` is only part of the cache key: editing the file on disk
+    changes it and forces a fresh parse. Parsing errors propagate and are
+    therefore never cached.
+    """
+    with open(full_path, "r", encoding="utf-8") as f:
+        data = _parse_json5(f.read())
+
+    logger.info(f"Loaded template: {full_path}")
+    return data
+
+
 def load_template(template_path: str) -> Optional[dict]:
     """
     Load a workflow template from disk.
 
     Supports JSON5 format (allows comments, trailing commas, etc).
+    Parsed templates are cached until the file's modification time changes;
+    callers receive their own copy and may mutate it freely.
 
     Args:
         template_path: Relative path to template file
@@ -169,31 +264,21 @@ def load_template(template_path: str) -> Optional[dict]:
     Returns:
         Template data as dict, or None if not found/invalid
     """
-    if not is_safe_template_path(template_path):
-        logger.error(f"Attempted to load unsafe template path: {template_path}")
+    full_path = find_template_file(template_path)
+    if full_path is None:
+        logger.error(f"Template not found or unsafe path: {template_path}")
         return None
 
-    template_dirs = get_template_directories()
-
-    for base_dir in template_dirs:
-        full_path = base_dir / template_path
-        if full_path.exists():
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    data = json5.load(f)
-
-                logger.info(f"Loaded template: {template_path}")
-                return data
-            except ValueError as e:
-                # json5 raises ValueError for invalid JSON5
-                logger.error(f"Invalid JSON5 in template {template_path}: {e}")
-                return None
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.error(f"Error loading template {template_path}: {e}")
-                return None
-
-    logger.error(f"Template not found: {template_path}")
-    return None
+    try:
+        mtime_ns = os.stat(full_path).st_mtime_ns
+        return copy.deepcopy(_load_template_cached(str(full_path), mtime_ns))
+    except ValueError as e:
+        # json5 raises ValueError for invalid JSON5
+        logger.error(f"Invalid JSON5 in template {template_path}: {e}")
+        return None
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.error(f"Error loading template {template_path}: {e}")
+        return None
 
 
 def parse_json5_string(json5_string: str) -> dict:
@@ -214,14 +299,34 @@ def parse_json5_string(json5_string: str) -> dict:
     if not json5_string or not json5_string.strip():
         return {}
 
-    return json5.loads(json5_string)
+    return _parse_json5(json5_string)
+
+
+def _deep_merge(base, patch):
+    """
+    Recursively merge ``patch`` into ``base`` without mutating either.
+
+    Objects are merged key by key; any other patch value (scalars, lists,
+    null) replaces the base value. New dicts are built only for the levels
+    the patch touches: subtrees it leaves alone are shared with ``base``,
+    and replaced values are shared with ``patch``. Callers that mutate the
+    result should pass a base they own, as ``load_template`` returns.
+    """
+    if not isinstance(base, dict) or not isinstance(patch, dict):
+        return patch
+
+    merged = base.copy()
+    for key, value in patch.items():
+        merged[key] = _deep_merge(merged[key], value) if key in merged else value
+    return merged
 
 
 def merge_template_with_patch(base_template: dict, patch: dict) -> dict:
     """
     Merge a base template with a JSON patch.
 
-    Uses RFC 7386 JSON Merge Patch via jsonmerge library.
+    Objects are merged recursively and every other value in the patch
+    replaces the base value, matching jsonmerge's default strategies.
 
     Args:
         base_template: Base template configuration
@@ -233,14 +338,7 @@ def merge_template_with_patch(base_template: dict, patch: dict) -> dict:
     if not patch:
         return base_template.copy()
 
-    try:
-        # Use jsonmerge for RFC 7386 merge patch
-        merged = merge(base_template, patch)
-        return merged
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        logger.error(f"Error merging template with patch: {e}")
-        # Return base template on error
-        return base_template.copy()
+    return _deep_merge(base_template, patch)
 
 
 def validate_workflow_config(config: dict) -> tuple[bool, list[str]]:
@@ -264,16 +362,19 @@ def validate_workflow_config(config: dict) -> tuple[bool, list[str]]:
         return False, [f"config must be an object/dict, got {type(config).__name__}"]
 
     # JSON Schema validation (schema version 1.0)
-    validator = Draft7Validator(WORKFLOW_SCHEMA)
-    schema_errors = list(validator.iter_errors(config))
+    # Keys that are missing or of the wrong type already have a schema error,
+    # so their semantic checks are skipped instead of reporting them twice
+    skip_keys = {key for key in _SEMANTIC_KEYS if key not in config}
 
-    for error in schema_errors:
+    for error in _WORKFLOW_VALIDATOR.iter_errors(config):
         # Format error message with path
         path = ".".join(str(p) for p in error.path) if error.path else "root"
         errors.append(f"{path}: {error.message}")
+        if error.validator == "type" and len(error.path) == 1:
+            skip_keys.add(error.path[0])
 
     # Semantic validation
-    semantic_errors = _validate_semantics(config)
+    semantic_errors = _validate_semantics(config, skip_keys)
     errors.extend(semantic_errors)
 
     is_valid = len(errors) == 0
@@ -281,7 +382,7 @@ def validate_workflow_config(config: dict) -> tuple[bool, list[str]]:
     return is_valid, errors
 
 
-def _validate_semantics(config: dict) -> list[str]:
+def _validate_semantics(config: dict, skip_keys=frozenset()) -> list[str]:
     """
     Perform semantic validation beyond JSON schema.
 
@@ -290,6 +391,8 @@ def _validate_semantics(config: dict) -> list[str]:
 
     Args:
         config: Configuration to validate
+        skip_keys: Top-level keys whose checks are skipped because schema
+            validation already rejected them
 
     Returns:
         List of error messages
@@ -297,45 +400,48 @@ def _validate_semantics(config: dict) -> list[str]:
     errors = []
 
     # Check orchestrator_class is a valid Python identifier
-    orchestrator_class = config.get("orchestrator_class", "")
-    if not orchestrator_class:
-        errors.append("orchestrator_class cannot be empty")
-    elif not orchestrator_class.replace("_", "").replace(".", "").isalnum():
-        errors.append(f"orchestrator_class '{orchestrator_class}' is not a valid Python identifier")
+    if "orchestrator_class" not in skip_keys:
+        orchestrator_class = config.get("orchestrator_class", "")
+        if not orchestrator_class:
+            errors.append("orchestrator_class cannot be empty")
+        elif not _ORCHESTRATOR_CLASS_PATTERN.fullmatch(orchestrator_class):
+            errors.append(f"orchestrator_class '{orchestrator_class}' is not a valid Python identifier")
 
     # Check processor_config structure (required by schema 1.0)
-    processor_config = config.get("processor_config", {})
-    if not isinstance(processor_config, dict):
-        errors.append("processor_config must be an object")
-    elif len(processor_config) == 0:
-        errors.append("processor_config must contain at least one processor")
-    else:
-        # Validate that all processor values are objects
-        for processor_name, processor_value in processor_config.items():
-            if not isinstance(processor_value, dict):
-                errors.append(f"processor_config.{processor_name} must be an object")
-
-        # Validate that prompt_template references exist in the database
-        errors.extend(_validate_prompt_templates(processor_config))
+    if "processor_config" not in skip_keys:
+        processor_config = config.get("processor_config", {})
+        if not isinstance(processor_config, dict):
+            errors.append("processor_config must be an object")
+        elif len(processor_config) == 0:
+            errors.append("processor_config must contain at least one processor")
+        else:
+            # Validate that all processor values are objects
+            for processor_name, processor_value in processor_config.items():
+                if not isinstance(processor_value, dict):
+                    errors.append(f"processor_config.{processor_name} must be an object")
+
+            # Validate that prompt_template references exist in the database
+            errors.extend(_validate_prompt_templates(processor_config))
 
     # Check actuator_config structure (required by schema 1.0)
-    actuator_config = config.get("actuator_config", {})
-    if not isinstance(actuator_config, dict):
-        errors.append("actuator_config must be an object")
-    else:
-        ui_components = actuator_config.get("UIComponents")
-        if ui_components is not None:
-            if not isinstance(ui_components, dict):
-                errors.append("actuator_config.UIComponents must be an object")
-            else:
-                # Check request and response structures
-                request = ui_components.get("request")
-                if request is not None and not isinstance(request, dict):
-                    errors.append("actuator_config.UIComponents.request must be an object")
-
-                response = ui_components.get("response")
-                if response is not None and not isinstance(response, dict):
-                    errors.append("actuator_config.UIComponents.response must be an object")
+    if "actuator_config" not in skip_keys:
+        actuator_config = config.get("actuator_config", {})
+        if not isinstance(actuator_config, dict):
+            errors.append("actuator_config must be an object")
+        else:
+            ui_components = actuator_config.get("UIComponents")
+            if ui_components is not None:
+                if not isinstance(ui_components, dict):
+                    errors.append("actuator_config.UIComponents must be an object")
+                else:
+                    # Check request and response structures
+                    request = ui_components.get("request")
+                    if request is not None and not isinstance(request, dict):
+                        errors.append("actuator_config.UIComponents.request must be an object")
+
+                    response = ui_components.get("response")
+                    if response is not None and not isinstance(response, dict):
+                        errors.append("actuator_config.UIComponents.response must be an object")
 
     return errors
 
@@ -392,3 +498,39 @@ def get_effective_config(base_filepath: str, content_patch: dict) -> Optional[di
         return None
 
     return merge_template_with_patch(base_template, content_patch)
+
+
+@functools.lru_cache(maxsize=256)
+def _template_content_hash(full_path: str, mtime_ns: int) -> str:  # pylint: disable=unused-argument
+    """
+    Return the hex SHA-1 of a template file's contents.
+
+    Cached like ``_load_template_cached``: ``mtime_ns`` is only part of the
+    cache key, so the file is re-read only after it changes on disk.
+    """
+    with open(full_path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def get_config_fingerprint(base_filepath: str, content_patch: str) -> str:
+    """
+    Compute a fingerprint of the inputs that produce an effective configuration.
+
+    Combines the template path, the raw content patch and a hash of the
+    template file's contents. The content hash is cached per modification
+    time, so checking a stored merged config for staleness costs a single
+    ``stat``, and deploys that only rewrite mtimes do not make it stale.
+
+    Args:
+        base_filepath: Relative path to base template
+        content_patch: Raw JSON5 content patch string
+
+    Returns:
+        Hex SHA-1 digest
+    """
+    template_file = find_template_file(base_filepath)
+    content_hash = None
+    if template_file is not None:
+        content_hash = _template_content_hash(str(template_file), template_file.stat().st_mtime_ns)
+    fingerprint = f"{base_filepath}\0{content_patch or ''}\0{content_hash}"
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
@@ -29,9 +29,10 @@ EVENT_NAME_WORKFLOW_INITIALIZED = "openedx.ai.workflow.initialized"
 EVENT_NAME_WORKFLOW_INTERACTED = "openedx.ai.workflow.interacted"
 EVENT_NAME_WORKFLOW_COMPLETED = "openedx.ai.workflow.completed"
 
-# All events list - useful for iteration in settings and configuration
-ALL_EVENTS = [
+# All events - useful for iteration in settings and configuration.
+# A tuple so it cannot be mutated by consumers and keeps a stable order.
+ALL_EVENTS = (
     EVENT_NAME_WORKFLOW_INITIALIZED,
     EVENT_NAME_WORKFLOW_INTERACTED,
     EVENT_NAME_WORKFLOW_COMPLETED,
-]
+)
@@ -1,5 +1,6 @@
 """xAPI transformers for AI workflow events."""
 
+import functools
 from typing import Optional
 
 from event_routing_backends.processors.xapi.registry import XApiTransformersRegistry
@@ -8,6 +9,27 @@ from tincan import Activity, ActivityDefinition, Extensions, LanguageMap, Verb
 
 from openedx_ai_extensions.xapi import constants
 
+# Activity language maps are identical for every event (or every profile),
+# so they are built once instead of per emitted event
+_DESCRIPTION_MAP = LanguageMap({constants.EN: "AI-powered educational workflow"})
+
+# Shared Verb instances, keyed by display name, so transformers emitting the
+# same verb reuse one object
+_VERBS = {
+    display: Verb(id=verb_id, display=LanguageMap({constants.EN: display}))
+    for verb_id, display in (
+        (constants.XAPI_VERB_INITIALIZED, constants.INITIALIZED),
+        (constants.XAPI_VERB_INTERACTED, constants.INTERACTED),
+        (constants.XAPI_VERB_COMPLETED, constants.COMPLETED),
+    )
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _name_map(profile_name: str) -> LanguageMap:
+    """Return the activity name LanguageMap for ``profile_name``."""
+    return LanguageMap({constants.EN: profile_name})
+
 
 class BaseAIWorkflowTransformer(XApiTransformer):
     """
@@ -62,10 +84,8 @@ class BaseAIWorkflowTransformer(XApiTransformer):
             id=self.get_object_iri("ai_workflow", "__".join([profile_name, action])),
             definition=ActivityDefinition(
                 type=constants.XAPI_ACTIVITY_AI_WORKFLOW,
-                name=LanguageMap({constants.EN: profile_name}),
-                description=LanguageMap({
-                    constants.EN: "AI-powered educational workflow"
-                }),
+                name=_name_map(profile_name),
+                description=_DESCRIPTION_MAP,
                 extensions=Extensions(extensions),
             ),
         )
@@ -79,10 +99,7 @@ class AIWorkflowInitializedTransformer(BaseAIWorkflowTransformer):
     Emitted when a conversational/threaded workflow is started for the first time.
     """
 
-    _verb = Verb(
-        id=constants.XAPI_VERB_INITIALIZED,
-        display=LanguageMap({constants.EN: constants.INITIALIZED}),
-    )
+    _verb = _VERBS[constants.INITIALIZED]
 
 
 @XApiTransformersRegistry.register("openedx.ai.workflow.interacted")
@@ -94,10 +111,7 @@ class AIWorkflowInteractedTransformer(BaseAIWorkflowTransformer):
     (after initialization).
     """
 
-    _verb = Verb(
-        id=constants.XAPI_VERB_INTERACTED,
-        display=LanguageMap({constants.EN: constants.INTERACTED}),
-    )
+    _verb = _VERBS[constants.INTERACTED]
 
 
 @XApiTransformersRegistry.register("openedx.ai.workflow.completed")
@@ -109,7 +123,4 @@ class AIWorkflowCompletedTransformer(BaseAIWorkflowTransformer):
     These workflows don't have back-and-forth interactions - they're single request/response.
     """
 
-    _verb = Verb(
-        id=constants.XAPI_VERB_COMPLETED,
-        display=LanguageMap({constants.EN: constants.COMPLETED}),
-    )
+    _verb = _VERBS[constants.COMPLETED]
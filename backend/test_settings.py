@@ -63,6 +63,9 @@ ROOT_URLCONF = "tests.urls"
 
 SECRET_KEY = "insecure-secret-key"
 
+# Tests create many users; the default PBKDF2 hasher makes each one slow.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 MIDDLEWARE = (
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -9,6 +9,10 @@ fake package structure here so imports succeed without requiring the full app.
 import sys
 from types import ModuleType
 
+import pytest
+from django.core.cache import cache
+from opaque_keys.edx.keys import CourseKey
+
 # Create fake root package
 fake_submissions = ModuleType("submissions")
 
@@ -24,3 +28,23 @@ fake_submissions.api = fake_api
 sys.modules["submissions"] = fake_submissions
 sys.modules["submissions.models"] = fake_models
 sys.modules["submissions.api"] = fake_api
+
+
+@pytest.fixture(autouse=True)
+def clear_django_cache():
+    """
+    Start every test with an empty cache.
+
+    The locmem cache outlives the per-test database rollback, so entries keyed
+    on rows created by one test must not leak into the next.
+    """
+    cache.clear()
+    yield
+
+
+@pytest.fixture(scope="session")
+def course_key():
+    """
+    Return the test course key, parsed once and shared across the session.
+    """
+    return CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
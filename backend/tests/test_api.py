@@ -3,46 +3,37 @@ Tests for the `openedx-ai-extensions` API endpoints.
 """
 
 import json
-import sys
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.urls import reverse
-from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import BlockUsageLocator
 from rest_framework.exceptions import ParseError
 from rest_framework.test import APIClient, APIRequestFactory
 
-# Mock the submissions module before any imports that depend on it
-sys.modules["submissions"] = MagicMock()
-sys.modules["submissions.api"] = MagicMock()
-
-from openedx_ai_extensions.api.v1.workflows.permissions import (  # noqa: E402 pylint: disable=wrong-import-position
-    CourseStaffPermission,
-    get_context_from_request,
-)
-from openedx_ai_extensions.api.v1.workflows.serializers import (  # noqa: E402 pylint: disable=wrong-import-position
+from openedx_ai_extensions.api.v1.workflows.permissions import CourseStaffPermission, get_context_from_request
+from openedx_ai_extensions.api.v1.workflows.serializers import (
     AIWorkflowProfileListSerializer,
-    AIWorkflowProfileSerializer,
     AIWorkflowScopeSerializer,
     PromptTemplateSerializer,
     redact_sensitive_config,
+    serialize_profile,
 )
-from openedx_ai_extensions.api.v1.workflows.views import (  # noqa: E402 pylint: disable=wrong-import-position
-    AIWorkflowProfilesListView,
-    AIWorkflowProfileView,
-)
-from openedx_ai_extensions.decorators import handle_ai_errors  # noqa: E402 pylint: disable=wrong-import-position
-from openedx_ai_extensions.models import PromptTemplate  # noqa: E402 pylint: disable=wrong-import-position
-from openedx_ai_extensions.workflows.models import (  # noqa: E402 pylint: disable=wrong-import-position
-    AIWorkflowProfile,
-    AIWorkflowScope,
-)
+from openedx_ai_extensions.api.v1.workflows.views import AIWorkflowProfilesListView, AIWorkflowProfileView
+from openedx_ai_extensions.decorators import handle_ai_errors
+from openedx_ai_extensions.models import PromptTemplate
+from openedx_ai_extensions.workflows.models import AIWorkflowProfile, AIWorkflowScope
 
 User = get_user_model()
 
+# Endpoint URLs, resolved once for the whole module
+WORKFLOWS_URL = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+UI_CONFIG_URL = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+PROFILES_LIST_URL = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+
 
 @pytest.fixture
 def api_client():
@@ -75,14 +66,6 @@ def staff_user():
     )
 
 
-@pytest.fixture
-def course_key():
-    """
-    Create and return a test course key.
-    """
-    return CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
-
-
 @pytest.fixture
 def workflow_profile(db):  # pylint: disable=unused-argument
     """
@@ -118,7 +101,6 @@ def workflow_scope(workflow_profile, course_key):  # pylint: disable=redefined-o
 # ============================================================================
 
 
-@pytest.mark.django_db
 def test_api_urls_are_registered():
     """
     Test that the API URLs are properly registered and accessible.
@@ -137,7 +119,7 @@ def test_workflows_endpoint_requires_authentication(api_client):  # pylint: disa
     """
     Test that the workflows endpoint requires authentication.
     """
-    url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+    url = WORKFLOWS_URL
 
     # DRF IsAuthenticated with SessionAuthentication returns 403 (no WWW-Authenticate challenge)
     response = api_client.post(url, {}, format="json")
@@ -145,91 +127,67 @@ def test_workflows_endpoint_requires_authentication(api_client):  # pylint: disa
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user")
-def test_workflows_post_with_authentication(api_client, course_key):  # pylint: disable=redefined-outer-name
+@pytest.mark.parametrize("user_fixture,action,text", [
+    ("user", "summarize", "Explain quantum physics"),
+    ("staff_user", "analyze", "Analyze student performance"),
+])
+@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile", new_callable=Mock)
+def test_workflows_post_with_authentication(  # pylint: disable=redefined-outer-name,too-many-positional-arguments
+    mock_get_profile, request, api_client, course_key, user_fixture, action, text,
+):
     """
-    Test POST request to workflows endpoint with authentication.
+    Test POST request to workflows endpoint with regular and staff user authentication.
     """
-    api_client.login(username="testuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+    mock_get_profile.return_value.execute.return_value = {"response": "Workflow result", "status": "completed"}
+    test_user = request.getfixturevalue(user_fixture)
+    api_client.force_login(test_user)
+    url = WORKFLOWS_URL
 
     # Create a proper BlockUsageLocator for the locationId
     location = BlockUsageLocator(course_key, block_type="vertical", block_id="unit-123")
 
     payload = {
-        "action": "summarize",
+        "action": action,
         "courseId": str(course_key),
         "context": {"locationId": str(location)},
-        "user_input": {"text": "Explain quantum physics"},
+        "user_input": {"text": text},
         "requestId": "test-request-123",
     }
 
     response = api_client.post(url, payload, format="json")
 
-    # Should return 200 or 500 depending on workflow execution
-    assert response.status_code in [200, 400, 500]
-
-    # Response should be JSON
+    assert response.status_code == 200
     assert response["Content-Type"] == "application/json"
+    assert response.json() == {"response": "Workflow result", "status": "completed"}
 
-    # Check for expected fields in response
-    data = response.json()
-    assert "timestamp" in data
-    # requestId and workflow_created may not be present if config not found
+    execute_kwargs = mock_get_profile.return_value.execute.call_args.kwargs
+    assert execute_kwargs["action"] == action
+    assert execute_kwargs["user_input"] == {"text": text}
+    assert execute_kwargs["user"] == test_user
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user", "course_key")
-def test_workflows_get_with_authentication(api_client):  # pylint: disable=redefined-outer-name
+@pytest.mark.usefixtures("course_key")
+def test_workflows_get_with_authentication(api_client, user):  # pylint: disable=redefined-outer-name
     """
     Test GET request to workflows endpoint with authentication.
     """
-    api_client.login(username="testuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+    api_client.force_login(user)
+    url = WORKFLOWS_URL
 
     response = api_client.get(url)
 
-    # Should return 405 (Method Not Allowed) since workflow view might not support GET
-    assert response.status_code in [200, 400, 405, 500]
+    # The workflow view only supports POST
+    assert response.status_code == 405
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_workflows_post_with_staff_user(api_client, course_key):  # pylint: disable=redefined-outer-name
-    """
-    Test POST request to workflows endpoint with staff user authentication.
-    """
-    api_client.login(username="staffuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
-
-    # Create a proper BlockUsageLocator for the locationId
-    location = BlockUsageLocator(course_key, block_type="vertical", block_id="unit-456")
-
-    payload = {
-        "action": "analyze",
-        "courseId": str(course_key),
-        "context": {"locationId": str(location)},
-        "user_input": {"text": "Analyze student performance"},
-        "requestId": "staff-request-789",
-    }
-
-    response = api_client.post(url, payload, format="json")
-
-    # Should return 200 or 500 depending on workflow execution
-    assert response.status_code in [200, 400, 500]
-
-    # Response should be JSON
-    assert response["Content-Type"] == "application/json"
-
-
-@pytest.mark.django_db
-@pytest.mark.usefixtures("user")
-def test_config_endpoint_get_with_action(api_client):  # pylint: disable=redefined-outer-name
+def test_config_endpoint_get_with_action(api_client, user):  # pylint: disable=redefined-outer-name
     """
     Test GET request to config endpoint with required action parameter.
     """
-    api_client.login(username="testuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+    api_client.force_login(user)
+    url = UI_CONFIG_URL
 
     # Test with action parameter and minimal context
     # Use dummy course key that won't match any config
@@ -238,28 +196,20 @@ def test_config_endpoint_get_with_action(api_client):  # pylint: disable=redefin
     context = json.dumps({"courseId": dummy_course, "locationId": dummy_location})
     response = api_client.get(url, {"action": "summarize", "context": context})
 
-    assert response.status_code in [200, 404]
+    assert response.status_code == 200
     assert response["Content-Type"] == "application/json"
-
-    data = response.json()
-    # Config might not exist, so check for either valid response or no_config status
-    if "status" in data and data["status"] == "no_config":
-        # Expected when no config exists
-        assert True
-    elif response.status_code == 200 and "course_id" in data:
-        # Check response structure if config exists
-        assert "course_id" in data
-        assert "ui_components" in data
+    assert response.json()["status"] == "no_config"
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user")
-def test_config_endpoint_get_with_action_and_course(api_client, course_key):  # pylint: disable=redefined-outer-name
+def test_config_endpoint_get_with_action_and_course(  # pylint: disable=redefined-outer-name
+    api_client, user, course_key,
+):
     """
     Test GET request to config endpoint with action and courseId parameters.
     """
-    api_client.login(username="testuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+    api_client.force_login(user)
+    url = UI_CONFIG_URL
 
     # Put both course_id and location_id in the context JSON
     dummy_location = f"block-v1:{course_key}+type@vertical+block@test"
@@ -269,50 +219,51 @@ def test_config_endpoint_get_with_action_and_course(api_client, course_key):  #
         {"action": "explain_like_five", "context": context},
     )
 
-    assert response.status_code in [200, 404]
-
-    data = response.json()
-    # Config might not exist, so check for either valid response or no_config status
-    if "status" in data and data["status"] == "no_config":
-        # Expected when no config exists
-        assert True
-    elif response.status_code == 200 and "course_id" in data:
-        assert data["course_id"] == str(course_key)
-        assert "ui_components" in data
+    # No scope is configured for this course, and no uiSlotSelectorId is sent
+    assert response.status_code == 200
+    assert response.json()["status"] == "no_config"
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user")
-def test_config_endpoint_ui_components_structure(api_client):  # pylint: disable=redefined-outer-name
+def test_config_endpoint_ui_components_structure(  # pylint: disable=redefined-outer-name
+    api_client, user, course_key,
+):
     """
     Test that ui_components has the expected structure.
     """
-    api_client.login(username="testuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+    api_client.force_login(user)
+    url = UI_CONFIG_URL
 
-    dummy_course = "course-v1:TestOrg+Test+Run"
-    dummy_location = "block-v1:TestOrg+Test+Run+type@vertical+block@test"
-    context = json.dumps({"courseId": dummy_course, "locationId": dummy_location})
-    response = api_client.get(url, {"action": "explain_like_five", "context": context})
-    assert response.status_code in [200, 404]
+    profile = AIWorkflowProfile.objects.create(
+        slug="api-ui-components-structure",
+        description="Summary",
+        base_filepath="base/summary.json",
+        content_patch="{}",
+    )
+    AIWorkflowScope.objects.create(
+        course_id=course_key,
+        service_variant="lms",
+        profile=profile,
+        enabled=True,
+        ui_slot_selector_id="slot-structure",
+    )
 
-    data = response.json()
-    if response.status_code == 200 and "ui_components" in data:
-        ui_components = data["ui_components"]
+    context = json.dumps({"courseId": str(course_key), "uiSlotSelectorId": "slot-structure"})
+    response = api_client.get(url, {"action": "explain_like_five", "context": context})
+    assert response.status_code == 200
 
-        # Check for request component
-        assert "request" in ui_components
-        assert "component" in ui_components["request"]
-        assert "config" in ui_components["request"]
+    ui_components = response.json()["ui_components"]
+    assert "request" in ui_components
+    assert "component" in ui_components["request"]
+    assert "config" in ui_components["request"]
 
-        # Verify component type
-        assert ui_components["request"]["component"] == "AIRequestComponent"
+    # Verify component type
+    assert ui_components["request"]["component"] == "AIRequestComponent"
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user")
 def test_config_endpoint_multi_scope_requires_ui_slot_selector_id(  # pylint: disable=redefined-outer-name
-    api_client, course_key,
+    api_client, user, course_key,
 ):
     """When no uiSlotSelectorId is sent, return no_config.
 
@@ -320,8 +271,8 @@ def test_config_endpoint_multi_scope_requires_ui_slot_selector_id(  # pylint: di
     returns None immediately and the profile endpoint responds HTTP 200
     with status='no_config'.
     """
-    api_client.login(username="testuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+    api_client.force_login(user)
+    url = UI_CONFIG_URL
 
     location = BlockUsageLocator(course_key, block_type="vertical", block_id="unit-ambiguous")
 
@@ -365,13 +316,12 @@ def test_config_endpoint_multi_scope_requires_ui_slot_selector_id(  # pylint: di
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user")
 def test_config_endpoint_multi_scope_with_selector_returns_200(  # pylint: disable=redefined-outer-name
-    api_client, course_key,
+    api_client, user, course_key,
 ):
     """When uiSlotSelectorId is provided, the matching selector scope is returned."""
-    api_client.login(username="testuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+    api_client.force_login(user)
+    url = UI_CONFIG_URL
 
     location = BlockUsageLocator(course_key, block_type="vertical", block_id="unit-choose")
 
@@ -419,13 +369,12 @@ def test_config_endpoint_multi_scope_with_selector_returns_200(  # pylint: disab
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user")
-def test_workflows_post_with_invalid_json(api_client):  # pylint: disable=redefined-outer-name
+def test_workflows_post_with_invalid_json(api_client, user):  # pylint: disable=redefined-outer-name
     """
     Test POST request to workflows endpoint with invalid JSON.
     """
-    api_client.login(username="testuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+    api_client.force_login(user)
+    url = WORKFLOWS_URL
 
     # Send invalid JSON
     response = api_client.post(
@@ -439,28 +388,36 @@ def test_workflows_post_with_invalid_json(api_client):  # pylint: disable=redefi
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user")
-def test_workflows_post_with_empty_body(api_client):  # pylint: disable=redefined-outer-name
+@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile", new_callable=Mock)
+def test_workflows_post_with_empty_body(mock_get_profile, api_client, user):  # pylint: disable=redefined-outer-name
     """
     Test POST request to workflows endpoint with empty body.
     """
-    api_client.login(username="testuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+    mock_get_profile.return_value.execute.return_value = {"response": "", "status": "completed"}
+    api_client.force_login(user)
+    url = WORKFLOWS_URL
 
     response = api_client.post(url, {}, format="json")
 
-    # Should handle empty body gracefully
-    assert response.status_code in [200, 400, 500]
+    # An empty body reaches the workflow with an empty action and input
+    assert response.status_code == 200
+    execute_kwargs = mock_get_profile.return_value.execute.call_args.kwargs
+    assert execute_kwargs["action"] == ""
+    assert execute_kwargs["user_input"] == {}
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user")
-def test_workflows_post_without_action(api_client, course_key):  # pylint: disable=redefined-outer-name
+@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile", new_callable=Mock)
+def test_workflows_post_without_action(  # pylint: disable=redefined-outer-name
+    mock_get_profile, api_client, user, course_key,
+):
     """
     Test POST request to workflows endpoint without action field.
     """
-    api_client.login(username="testuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+    # AIWorkflowScope.execute raises this when the orchestrator has no such action
+    mock_get_profile.return_value.execute.side_effect = NotImplementedError("no action ''")
+    api_client.force_login(user)
+    url = WORKFLOWS_URL
 
     payload = {
         "courseId": str(course_key),
@@ -471,7 +428,9 @@ def test_workflows_post_without_action(api_client, course_key):  # pylint: disab
     response = api_client.post(url, payload, format="json")
 
     # Should handle missing action
-    assert response.status_code in [400, 500]
+    assert response.status_code == 500
+    assert response.json()["error"]["code"] == "internal_error"
+    assert mock_get_profile.return_value.execute.call_args.kwargs["action"] == ""
 
 
 @pytest.mark.django_db
@@ -480,7 +439,7 @@ def test_config_endpoint_without_authentication(api_client):  # pylint: disable=
     """
     Test that config endpoint requires authentication.
     """
-    url = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+    url = UI_CONFIG_URL
 
     response = api_client.get(url, {"action": "summarize", "context": "{}"})
 
@@ -488,108 +447,53 @@ def test_config_endpoint_without_authentication(api_client):  # pylint: disable=
     assert response.status_code in [401, 403]
 
 
-# ============================================================================
-# Unit Tests - Serializers
-# ============================================================================
-
-
 @pytest.mark.django_db
-def test_serializer_serialize_config(course_key):  # pylint: disable=redefined-outer-name
-    """
-    Test AIWorkflowProfileSerializer serializes config correctly.
+@pytest.mark.usefixtures("user")
+def test_config_endpoint_with_password_login(api_client):  # pylint: disable=redefined-outer-name
     """
-    # Create a mock AIWorkflowScope with profile
-    mock_profile = Mock()
-    mock_profile.get_ui_components = Mock(return_value={"request": {"component": "TestComponent"}})
-
-    mock_scope = Mock()
-    mock_scope.profile = mock_profile
-    mock_scope.course_id = course_key
-
-    serializer = AIWorkflowProfileSerializer(mock_scope)
-    data = serializer.data
+    Test that a session from a real username/password login is accepted.
 
-    assert "course_id" in data
-    assert "ui_components" in data
-
-
-@pytest.mark.django_db
-def test_serializer_get_ui_components():
-    """
-    Test serializer extracts ui_components from profile.
+    Other tests use force_login; this one keeps the credential path covered.
     """
-    # Create a mock profile with ui components
-    mock_profile = Mock()
-    mock_profile.get_ui_components = Mock(return_value={"request": {"component": "TestComponent"}})
-
-    # Create a mock AIWorkflowScope with profile
-    mock_scope = Mock()
-    mock_scope.profile = mock_profile
+    assert api_client.login(username="testuser", password="password123")
 
-    serializer = AIWorkflowProfileSerializer(mock_scope)
-    ui_components = serializer.get_ui_components(mock_scope)
+    response = api_client.get(UI_CONFIG_URL, {"action": "summarize", "context": "{}"})
 
-    # UI components come from the profile's config
-    assert isinstance(ui_components, dict)
-    assert "request" in ui_components
-
-
-@pytest.mark.django_db
-def test_serializer_get_ui_components_empty_config():
-    """
-    Test serializer handles empty profile config.
-    """
-    # Create a mock profile with empty ui components
-    mock_profile = Mock()
-    mock_profile.get_ui_components = Mock(return_value={})
-
-    # Create a mock AIWorkflowScope with profile
-    mock_scope = Mock()
-    mock_scope.profile = mock_profile
+    assert response.status_code == 200
 
-    serializer = AIWorkflowProfileSerializer(mock_scope)
-    ui_components = serializer.get_ui_components(mock_scope)
 
-    assert isinstance(ui_components, dict)
-    assert ui_components == {}
+# ============================================================================
+# Unit Tests - Serializers
+# ============================================================================
 
 
-@pytest.mark.django_db
-def test_serializer_create_not_implemented():
+def test_serialize_profile(course_key):
     """
-    Test that serializer.create raises NotImplementedError.
+    Test serialize_profile returns the course id and the profile's ui_components.
     """
-    # Create a mock AIWorkflowScope with profile
-    mock_scope = Mock()
-    mock_scope.profile = Mock()
-    mock_scope.profile.get_ui_components = Mock(return_value={})
-    mock_scope.course_id = "test"
+    # Plain stand-ins for an AIWorkflowScope and its profile; no call tracking needed
+    profile = SimpleNamespace(get_ui_components=lambda: {"request": {"component": "TestComponent"}})
+    scope = SimpleNamespace(profile=profile, course_id=course_key)
 
-    serializer = AIWorkflowProfileSerializer(mock_scope)
+    data = serialize_profile(scope)
 
-    with pytest.raises(NotImplementedError) as exc_info:
-        serializer.create({})
-
-    assert "read-only" in str(exc_info.value)
+    assert data == {
+        "course_id": str(course_key),
+        "ui_components": {"request": {"component": "TestComponent"}},
+    }
 
 
-@pytest.mark.django_db
-def test_serializer_update_not_implemented():
+def test_serialize_profile_empty_config():
     """
-    Test that serializer.update raises NotImplementedError.
+    Test serialize_profile handles empty ui components and a scope without a course.
     """
-    # Create a mock AIWorkflowScope with profile
-    mock_scope = Mock()
-    mock_scope.profile = Mock()
-    mock_scope.profile.get_ui_components = Mock(return_value={})
-    mock_scope.course_id = "test"
-
-    serializer = AIWorkflowProfileSerializer(mock_scope)
+    profile = SimpleNamespace(get_ui_components=lambda: {})
+    scope = SimpleNamespace(profile=profile, course_id=None)
 
-    with pytest.raises(NotImplementedError) as exc_info:
-        serializer.update(mock_scope, {})
+    data = serialize_profile(scope)
 
-    assert "read-only" in str(exc_info.value)
+    assert data["course_id"] is None
+    assert data["ui_components"] == {}
 
 
 # ============================================================================
@@ -597,7 +501,6 @@ def test_serializer_update_not_implemented():
 # ============================================================================
 
 
-@pytest.mark.django_db
 def test_generic_workflow_view_post_validation_error_unit():
     """
     Test AIGenericWorkflowView handles ValidationError (unit test).
@@ -606,7 +509,6 @@ def test_generic_workflow_view_post_validation_error_unit():
     pytest.skip("find_workflow_for_context method no longer exists in new model structure")
 
 
-@pytest.mark.django_db
 def test_generic_workflow_view_post_general_exception_unit():
     """
     Test AIGenericWorkflowView handles general exceptions (unit test).
@@ -616,7 +518,7 @@ def test_generic_workflow_view_post_general_exception_unit():
 
 
 @pytest.mark.django_db
-@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile")
+@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile", new_callable=Mock)
 def test_workflow_config_view_get_not_found_unit(
     mock_get_profile, user  # pylint: disable=redefined-outer-name
 ):
@@ -643,7 +545,7 @@ def test_workflow_config_view_get_not_found_unit(
 
 
 @pytest.mark.django_db
-@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile")
+@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile", new_callable=Mock)
 def test_workflow_config_view_get_with_location_id_unit(
     mock_get_profile, user, course_key  # pylint: disable=redefined-outer-name
 ):
@@ -687,7 +589,7 @@ def test_workflow_config_view_get_with_location_id_unit(
 
 
 @pytest.mark.django_db
-@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile")
+@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile", new_callable=Mock)
 def test_workflow_config_view_invalid_context_json_unit(
     mock_get_profile, user  # pylint: disable=redefined-outer-name
 ):
@@ -717,17 +619,107 @@ def test_workflow_config_view_invalid_context_json_unit(
     assert response.status_code == 400
 
 
+@pytest.mark.django_db
+@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile", new_callable=Mock)
+def test_workflow_config_view_get_serves_repeat_requests_from_cache(
+    mock_get_profile, user  # pylint: disable=redefined-outer-name
+):
+    """
+    Test AIWorkflowProfileView resolves a context once and serves repeats from the cache.
+    """
+    mock_scope = Mock()
+    mock_scope.profile.get_ui_components.return_value = {"request": {"component": "TestComponent"}}
+    mock_scope.course_id = None
+    mock_get_profile.return_value = mock_scope
+
+    factory = APIRequestFactory()
+    view = AIWorkflowProfileView.as_view()
+    responses = []
+    for _ in range(2):
+        request = factory.get(
+            "/openedx-ai-extensions/v1/profile/",
+            {"action": "summarize", "context": json.dumps({"uiSlotSelectorId": "test-slot"})},
+        )
+        request.user = user
+        responses.append(view(request))
+
+    mock_get_profile.assert_called_once()
+    assert responses[0].data["ui_components"] == responses[1].data["ui_components"]
+    assert "timestamp" in responses[1].data
+
+
+@pytest.mark.django_db
+@patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.get_profile", new_callable=Mock)
+def test_workflow_config_view_get_honours_if_none_match(
+    mock_get_profile, user  # pylint: disable=redefined-outer-name
+):
+    """
+    Test AIWorkflowProfileView returns an ETag and answers a matching If-None-Match with 304.
+    """
+    mock_scope = Mock()
+    mock_scope.profile.get_ui_components.return_value = {"request": {"component": "TestComponent"}}
+    mock_scope.course_id = None
+    mock_get_profile.return_value = mock_scope
+
+    factory = APIRequestFactory()
+    view = AIWorkflowProfileView.as_view()
+    params = {"action": "summarize", "context": json.dumps({"uiSlotSelectorId": "test-slot"})}
+
+    request = factory.get("/openedx-ai-extensions/v1/profile/", params)
+    request.user = user
+    response = view(request)
+    etag = response["ETag"]
+
+    request = factory.get("/openedx-ai-extensions/v1/profile/", params, HTTP_IF_NONE_MATCH=etag)
+    request.user = user
+    not_modified = view(request)
+
+    request = factory.get("/openedx-ai-extensions/v1/profile/", params, HTTP_IF_NONE_MATCH='"stale"')
+    request.user = user
+    modified = view(request)
+
+    assert response.status_code == 200
+    assert not_modified.status_code == 304
+    assert not_modified["ETag"] == etag
+    assert modified.status_code == 200
+    assert modified["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_config_endpoint_cache_invalidated_on_scope_save(
+    api_client, user, workflow_scope, course_key  # pylint: disable=redefined-outer-name
+):
+    """
+    Test that saving a scope drops the cached UI config for its context.
+    """
+    api_client.force_login(user)
+    location = BlockUsageLocator(course_key, block_type="vertical", block_id="test_unit")
+    context = json.dumps({
+        "courseId": str(course_key),
+        "locationId": str(location),
+        "uiSlotSelectorId": "test-slot",
+    })
+
+    response = api_client.get(UI_CONFIG_URL, {"action": "summarize", "context": context})
+    assert "ui_components" in response.json()
+
+    workflow_scope.enabled = False
+    workflow_scope.save()
+
+    response = api_client.get(UI_CONFIG_URL, {"action": "summarize", "context": context})
+    assert response.json()["status"] == "no_config"
+
+
 # ============================================================================
 # Tests - Profiles List Endpoint (GET /v1/profiles/)
 # ============================================================================
 
 
-@pytest.mark.django_db
 def test_profiles_list_url_is_registered():
     """
     Test that the profiles list URL is properly registered and accessible.
     """
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    url = PROFILES_LIST_URL
     assert url == "/openedx-ai-extensions/v1/profiles/"
 
 
@@ -736,19 +728,18 @@ def test_profiles_list_requires_authentication(api_client):  # pylint: disable=r
     """
     Test that the profiles list endpoint requires authentication.
     """
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    url = PROFILES_LIST_URL
     response = api_client.get(url)
     assert response.status_code in [401, 403]
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_profiles_list_happy_path(api_client, course_key):  # pylint: disable=redefined-outer-name
+def test_profiles_list_happy_path(api_client, staff_user, course_key):  # pylint: disable=redefined-outer-name
     """
     Two scopes with different slots pointing to two distinct profiles are both returned.
     """
-    api_client.login(username="staffuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    api_client.force_login(staff_user)
+    url = PROFILES_LIST_URL
 
     profile_a = AIWorkflowProfile.objects.create(
         slug="pl-happy-a", description="A", base_filepath="base/default.json", content_patch="{}"
@@ -792,13 +783,12 @@ def test_profiles_list_happy_path(api_client, course_key):  # pylint: disable=re
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_profiles_list_no_matches(api_client):  # pylint: disable=redefined-outer-name
+def test_profiles_list_no_matches(api_client, staff_user):  # pylint: disable=redefined-outer-name
     """
     Unknown course returns an empty list without errors.
     """
-    api_client.login(username="staffuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    api_client.force_login(staff_user)
+    url = PROFILES_LIST_URL
 
     context = json.dumps({"courseId": "course-v1:Unknown+X+NoSuchCourse"})
     response = api_client.get(url, {"context": context})
@@ -810,10 +800,9 @@ def test_profiles_list_no_matches(api_client):  # pylint: disable=redefined-oute
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
 @patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.list_profiles_for_context")
 def test_profiles_list_api_keys_are_redacted(  # pylint: disable=redefined-outer-name
-    mock_list, api_client, course_key
+    mock_list, api_client, staff_user, course_key
 ):
     """
     API keys present in the effective config must not appear in the response.
@@ -832,8 +821,8 @@ def test_profiles_list_api_keys_are_redacted(  # pylint: disable=redefined-outer
     mock_profile.aiworkflowscope_set.count.return_value = 0
     mock_list.return_value = [mock_profile]
 
-    api_client.login(username="staffuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    api_client.force_login(staff_user)
+    url = PROFILES_LIST_URL
     context = json.dumps({"courseId": str(course_key), "uiSlotSelectorId": "slot-redact"})
     response = api_client.get(url, {"context": context})
 
@@ -847,13 +836,12 @@ def test_profiles_list_api_keys_are_redacted(  # pylint: disable=redefined-outer
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_profiles_list_deduplication(api_client, course_key):  # pylint: disable=redefined-outer-name
+def test_profiles_list_deduplication(api_client, staff_user, course_key):  # pylint: disable=redefined-outer-name
     """
     Two scopes pointing to the same profile return only one profile entry.
     """
-    api_client.login(username="staffuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    api_client.force_login(staff_user)
+    url = PROFILES_LIST_URL
 
     profile = AIWorkflowProfile.objects.create(
         slug="pl-dedup", description="Dedup test", base_filepath="base/default.json", content_patch="{}"
@@ -881,13 +869,12 @@ def test_profiles_list_deduplication(api_client, course_key):  # pylint: disable
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_profiles_list_filtered_by_ui_slot(api_client, course_key):  # pylint: disable=redefined-outer-name
+def test_profiles_list_filtered_by_ui_slot(api_client, staff_user, course_key):  # pylint: disable=redefined-outer-name
     """
     When uiSlotSelectorId is provided, only profiles for that slot are returned.
     """
-    api_client.login(username="staffuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    api_client.force_login(staff_user)
+    url = PROFILES_LIST_URL
 
     profile_a = AIWorkflowProfile.objects.create(
         slug="pl-slot-a", description="A", base_filepath="base/default.json", content_patch="{}"
@@ -914,15 +901,14 @@ def test_profiles_list_filtered_by_ui_slot(api_client, course_key):  # pylint: d
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_profiles_list_no_slot_returns_all(api_client, course_key):  # pylint: disable=redefined-outer-name
+def test_profiles_list_no_slot_returns_all(api_client, staff_user, course_key):  # pylint: disable=redefined-outer-name
     """
     When no uiSlotSelectorId is provided, all profiles for the course are returned
     regardless of their individual slot assignments. This is the intended call
     pattern for the Studio settings panel.
     """
-    api_client.login(username="staffuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    api_client.force_login(staff_user)
+    url = PROFILES_LIST_URL
 
     profile_a = AIWorkflowProfile.objects.create(
         slug="pl-noslot-a", description="A", base_filepath="base/default.json", content_patch="{}"
@@ -950,13 +936,12 @@ def test_profiles_list_no_slot_returns_all(api_client, course_key):  # pylint: d
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_profiles_list_invalid_course_id(api_client):  # pylint: disable=redefined-outer-name
+def test_profiles_list_invalid_course_id(api_client, staff_user):  # pylint: disable=redefined-outer-name
     """
     Malformed courseId returns HTTP 400 with an error key.
     """
-    api_client.login(username="staffuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    api_client.force_login(staff_user)
+    url = PROFILES_LIST_URL
 
     context = json.dumps({"courseId": "not-a-valid-course-key"})
     response = api_client.get(url, {"context": context})
@@ -967,13 +952,12 @@ def test_profiles_list_invalid_course_id(api_client):  # pylint: disable=redefin
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_profiles_list_no_context_param(api_client):  # pylint: disable=redefined-outer-name
+def test_profiles_list_no_context_param(api_client, staff_user):  # pylint: disable=redefined-outer-name
     """
     Missing context param is treated as empty context — no crash, returns empty list.
     """
-    api_client.login(username="staffuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    api_client.force_login(staff_user)
+    url = PROFILES_LIST_URL
 
     response = api_client.get(url)
 
@@ -1155,10 +1139,9 @@ def test_prompt_detail_requires_authentication(api_client, prompt_template):  #
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user")
-def test_prompt_detail_requires_staff(api_client, prompt_template):  # pylint: disable=redefined-outer-name
+def test_prompt_detail_requires_staff(api_client, user, prompt_template):  # pylint: disable=redefined-outer-name
     """Non-staff authenticated users are rejected."""
-    api_client.login(username="testuser", password="password123")
+    api_client.force_login(user)
     url = reverse(
         "openedx_ai_extensions:api:v1:aiext_prompt_detail",
         kwargs={"identifier": prompt_template.slug},
@@ -1168,10 +1151,9 @@ def test_prompt_detail_requires_staff(api_client, prompt_template):  # pylint: d
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_prompt_detail_by_slug(api_client, prompt_template):  # pylint: disable=redefined-outer-name
+def test_prompt_detail_by_slug(api_client, staff_user, prompt_template):  # pylint: disable=redefined-outer-name
     """Fetching a prompt by slug returns 200 with all fields."""
-    api_client.login(username="staffuser", password="password123")
+    api_client.force_login(staff_user)
     url = reverse(
         "openedx_ai_extensions:api:v1:aiext_prompt_detail",
         kwargs={"identifier": prompt_template.slug},
@@ -1188,10 +1170,9 @@ def test_prompt_detail_by_slug(api_client, prompt_template):  # pylint: disable=
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_prompt_detail_by_uuid(api_client, prompt_template):  # pylint: disable=redefined-outer-name
+def test_prompt_detail_by_uuid(api_client, staff_user, prompt_template):  # pylint: disable=redefined-outer-name
     """Fetching a prompt by UUID returns the same template."""
-    api_client.login(username="staffuser", password="password123")
+    api_client.force_login(staff_user)
     url = reverse(
         "openedx_ai_extensions:api:v1:aiext_prompt_detail",
         kwargs={"identifier": str(prompt_template.id)},
@@ -1205,10 +1186,9 @@ def test_prompt_detail_by_uuid(api_client, prompt_template):  # pylint: disable=
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_prompt_detail_not_found(api_client):  # pylint: disable=redefined-outer-name
+def test_prompt_detail_not_found(api_client, staff_user):  # pylint: disable=redefined-outer-name
     """Unknown identifier returns 404 with a meaningful error."""
-    api_client.login(username="staffuser", password="password123")
+    api_client.force_login(staff_user)
     url = reverse(
         "openedx_ai_extensions:api:v1:aiext_prompt_detail",
         kwargs={"identifier": "does-not-exist"},
@@ -1222,10 +1202,9 @@ def test_prompt_detail_not_found(api_client):  # pylint: disable=redefined-outer
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_prompt_detail_unknown_uuid(api_client):  # pylint: disable=redefined-outer-name
+def test_prompt_detail_unknown_uuid(api_client, staff_user):  # pylint: disable=redefined-outer-name
     """A well-formed UUID that matches no record returns 404."""
-    api_client.login(username="staffuser", password="password123")
+    api_client.force_login(staff_user)
     url = reverse(
         "openedx_ai_extensions:api:v1:aiext_prompt_detail",
         kwargs={"identifier": "00000000-0000-0000-0000-000000000000"},
@@ -1236,10 +1215,9 @@ def test_prompt_detail_unknown_uuid(api_client):  # pylint: disable=redefined-ou
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_prompt_patch_updates_body(api_client, prompt_template):  # pylint: disable=redefined-outer-name
+def test_prompt_patch_updates_body(api_client, staff_user, prompt_template):  # pylint: disable=redefined-outer-name
     """PATCH with only body updates the template and returns the full representation."""
-    api_client.login(username="staffuser", password="password123")
+    api_client.force_login(staff_user)
     url = reverse(
         "openedx_ai_extensions:api:v1:aiext_prompt_detail",
         kwargs={"identifier": prompt_template.slug},
@@ -1254,10 +1232,11 @@ def test_prompt_patch_updates_body(api_client, prompt_template):  # pylint: disa
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_prompt_patch_rejects_extra_fields(api_client, prompt_template):  # pylint: disable=redefined-outer-name
+def test_prompt_patch_rejects_extra_fields(  # pylint: disable=redefined-outer-name
+    api_client, staff_user, prompt_template,
+):
     """PATCH with any field besides body is rejected with 400."""
-    api_client.login(username="staffuser", password="password123")
+    api_client.force_login(staff_user)
     url = reverse(
         "openedx_ai_extensions:api:v1:aiext_prompt_detail",
         kwargs={"identifier": prompt_template.slug},
@@ -1271,10 +1250,11 @@ def test_prompt_patch_rejects_extra_fields(api_client, prompt_template):  # pyli
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_prompt_patch_rejects_id_change(api_client, prompt_template):  # pylint: disable=redefined-outer-name
+def test_prompt_patch_rejects_id_change(  # pylint: disable=redefined-outer-name
+    api_client, staff_user, prompt_template,
+):
     """PATCH attempting to change the id is rejected."""
-    api_client.login(username="staffuser", password="password123")
+    api_client.force_login(staff_user)
     url = reverse(
         "openedx_ai_extensions:api:v1:aiext_prompt_detail",
         kwargs={"identifier": prompt_template.slug},
@@ -1287,10 +1267,9 @@ def test_prompt_patch_rejects_id_change(api_client, prompt_template):  # pylint:
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
-def test_prompt_patch_not_found(api_client):  # pylint: disable=redefined-outer-name
+def test_prompt_patch_not_found(api_client, staff_user):  # pylint: disable=redefined-outer-name
     """PATCH on a non-existent identifier returns 404."""
-    api_client.login(username="staffuser", password="password123")
+    api_client.force_login(staff_user)
     url = reverse(
         "openedx_ai_extensions:api:v1:aiext_prompt_detail",
         kwargs={"identifier": "no-such-template"},
@@ -1301,10 +1280,9 @@ def test_prompt_patch_not_found(api_client):  # pylint: disable=redefined-outer-
 
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("user")
-def test_prompt_patch_requires_staff(api_client, prompt_template):  # pylint: disable=redefined-outer-name
+def test_prompt_patch_requires_staff(api_client, user, prompt_template):  # pylint: disable=redefined-outer-name
     """Non-staff users cannot PATCH."""
-    api_client.login(username="testuser", password="password123")
+    api_client.force_login(user)
     url = reverse(
         "openedx_ai_extensions:api:v1:aiext_prompt_detail",
         kwargs={"identifier": prompt_template.slug},
@@ -1394,13 +1372,14 @@ def test_course_staff_permission_delegates_to_backend(user, course_key):  # pyli
 # ============================================================================
 
 @pytest.mark.django_db
-@pytest.mark.usefixtures("staff_user")
 @patch("openedx_ai_extensions.api.v1.workflows.views.AIWorkflowScope.list_profiles_for_context")
-def test_profiles_list_view_unexpected_error(mock_list, api_client, course_key):  # pylint: disable=redefined-outer-name
+def test_profiles_list_view_unexpected_error(  # pylint: disable=redefined-outer-name
+    mock_list, api_client, staff_user, course_key,
+):
     """Unhandled exception inside the view returns 500 with status='error'."""
     mock_list.side_effect = RuntimeError("unexpected boom")
-    api_client.login(username="staffuser", password="password123")
-    url = reverse("openedx_ai_extensions:api:v1:aiext_profiles_list")
+    api_client.force_login(staff_user)
+    url = PROFILES_LIST_URL
     context = json.dumps({"courseId": str(course_key)})
     response = api_client.get(url, {"context": context})
     assert response.status_code == 500
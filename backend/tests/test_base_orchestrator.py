@@ -3,12 +3,15 @@ Tests for the BaseOrchestrator class in openedx-ai-extensions workflows module.
 """
 # pylint: disable=import-outside-toplevel
 
+import importlib
 from unittest.mock import MagicMock, patch
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.test import override_settings
 
 from openedx_ai_extensions.workflows.orchestrators import BaseOrchestrator
+from openedx_ai_extensions.workflows.orchestrators.base_orchestrator import _resolve_orchestrator_class, error_response
 
 User = get_user_model()
 
@@ -104,6 +107,31 @@ def test_emit_workflow_event(mock_tracker, mock_workflow, mock_user):  # pylint:
     })
 
 
+@pytest.mark.django_db
+@override_settings(AI_EXTENSIONS_ASYNC_EVENT_EMISSION=True)
+@patch("openedx_ai_extensions.workflows.orchestrators.base_orchestrator.tracker")
+def test_emit_workflow_event_async(mock_tracker, mock_workflow, mock_user):  # pylint: disable=redefined-outer-name
+    """
+    Test that with async emission enabled the event is emitted from the worker
+    thread, carrying the request thread's tracker context.
+    """
+    from openedx_ai_extensions.workflows.orchestrators import base_orchestrator
+
+    mock_tracker.get_tracker.return_value.resolve_context.return_value = {"user_id": 7}
+    context = {"location_id": "loc-1", "course_id": "course-1"}
+    orchestrator = BaseOrchestrator(workflow=mock_workflow, user=mock_user, context=context)
+
+    orchestrator._emit_workflow_event("TEST_EVENT")  # pylint: disable=protected-access
+    base_orchestrator._stop_event_worker()  # pylint: disable=protected-access
+
+    mock_tracker.get_tracker.return_value.context.assert_called_once_with(
+        "ai_workflow", {"user_id": 7, "course_id": "course-1"}
+    )
+    mock_tracker.emit.assert_called_once()
+    assert mock_tracker.emit.call_args[0][0] == "TEST_EVENT"
+    assert mock_tracker.emit.call_args[0][1]["course_id"] == "course-1"
+
+
 @pytest.mark.django_db
 @patch("openedx_ai_extensions.workflows.orchestrators.base_orchestrator.tracker")
 def test_emit_workflow_event_with_usage(
@@ -453,3 +481,37 @@ def test_get_orchestrator_success(mock_workflow, mock_user):  # pylint: disable=
     assert isinstance(orchestrator, DirectLLMResponse)
     assert orchestrator.user == mock_user
     assert orchestrator.location_id == "loc-1"
+
+
+@pytest.mark.django_db
+def test_get_orchestrator_caches_class_resolution(mock_workflow, mock_user):  # pylint: disable=redefined-outer-name
+    """
+    Test get_orchestrator resolves each orchestrator name only once.
+    """
+    _resolve_orchestrator_class.cache_clear()
+    mock_workflow.profile.orchestrator_class = "DirectLLMResponse"
+    context = {"location_id": None, "course_id": None}
+
+    with patch(
+        "openedx_ai_extensions.workflows.orchestrators.base_orchestrator.importlib.import_module",
+        wraps=importlib.import_module,
+    ) as mock_import:
+        first = BaseOrchestrator.get_orchestrator(workflow=mock_workflow, user=mock_user, context=context)
+        second = BaseOrchestrator.get_orchestrator(workflow=mock_workflow, user=mock_user, context=context)
+
+    mock_import.assert_called_once()
+    assert type(first) is type(second)
+    assert first is not second
+
+
+@pytest.mark.parametrize("result,expected", [
+    ({"error": "boom"}, {"error": "boom", "status": "LLMProcessor error"}),
+    ({"error": None}, {"error": None, "status": "LLMProcessor error"}),
+    ({"response": "ok"}, None),
+    (None, None),
+])
+def test_error_response(result, expected):
+    """
+    Test error_response builds the error result only for failed processor calls.
+    """
+    assert error_response(result, "LLMProcessor") == expected
@@ -449,6 +449,37 @@ def test_create_collection_and_add_items_with_empty_items(
     assert mock_api.update_library_collection_items.call_count == 0
 
 
+@pytest.mark.django_db
+@patch("openedx_ai_extensions.processors.openedx.content_libraries_processor.get_content_libraries")
+def test_create_collection_and_add_items_skips_failed_blocks(
+    mock_get_content_libraries, content_library_processor
+):  # pylint: disable=redefined-outer-name
+    """
+    Test create_collection_and_add_items keeps going when the first block fails
+    to be created and only adds the created blocks to the collection.
+    """
+    mock_api = MagicMock()
+    mock_api.IncompatibleTypesError = ValueError
+    mock_collection = MagicMock()
+    mock_collection.key = "collection-789"
+    mock_api.create_library_collection.return_value = mock_collection
+    mock_block = MagicMock()
+    mock_block.usage_key = "block-v1:org+lib+branch+type@problem+block@ok"
+    mock_api.create_library_block.side_effect = [RuntimeError("boom"), mock_block]
+
+    mock_content_libraries = MagicMock()
+    mock_content_libraries.api = mock_api
+    mock_get_content_libraries.return_value = mock_content_libraries
+
+    items = [{"category": "problem", "data": "<problem/>"}, {"category": "problem", "data": "<problem/>"}]
+    result = content_library_processor.create_collection_and_add_items(items=items, title="Partial")
+
+    assert result == "collection-789"
+    assert mock_api.set_library_block_olx.call_count == 1
+    update_call = mock_api.update_library_collection_items.call_args[1]
+    assert list(update_call["opaque_keys"]) == [mock_block.usage_key]
+
+
 @pytest.mark.django_db
 @patch("openedx_ai_extensions.processors.openedx.content_libraries_processor.get_content_libraries")
 def test_modify_block_olx_with_special_characters(
@@ -2,14 +2,16 @@
 Tests for direct_orchestrator.
 """
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
 from django.contrib.auth import get_user_model
-from opaque_keys.edx.keys import CourseKey
 
 from openedx_ai_extensions.workflows.models import AIWorkflowProfile, AIWorkflowScope
+from openedx_ai_extensions.workflows.orchestrators import direct_orchestrator
 from openedx_ai_extensions.workflows.orchestrators.direct_orchestrator import EducatorAssistantOrchestrator, json_to_olx
+from openedx_ai_extensions.xapi.constants import EVENT_NAME_WORKFLOW_COMPLETED
 
 User = get_user_model()
 
@@ -28,11 +30,6 @@ def user(db):  # pylint: disable=unused-argument
     )
 
 
-@pytest.fixture
-def course_key():
-    return CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
-
-
 @pytest.fixture
 def workflow_profile(db):  # pylint: disable=unused-argument
     return AIWorkflowProfile.objects.create(
@@ -638,12 +635,13 @@ def test_run_with_library_id_stores_metadata_and_emits_event(
     }
     mock_llm_class.return_value = mock_llm
 
-    with patch.object(educator_orchestrator, "_emit_workflow_event") as _:
+    with patch.object(educator_orchestrator, "_emit_workflow_event") as mock_emit:
         result = educator_orchestrator.run({"library_id": "lib:org:mylib", "num_questions": 1})
 
     assert result["status"] == "completed"
     assert result["response"]["collection_name"] == "Legacy Quiz"
     assert len(result["response"]["question_slots"]) == 1
+    mock_emit.assert_called_once_with(EVENT_NAME_WORKFLOW_COMPLETED)
 
     # Session metadata stores question_slots and collection_name
     meta = educator_orchestrator.session.metadata
@@ -651,6 +649,10 @@ def test_run_with_library_id_stores_metadata_and_emits_event(
     assert len(meta["question_slots"]) == 1
     assert meta["question_slots"][0]["versions"][0]["display_name"] == "Q1"
 
+    # ...and is persisted to the database
+    educator_orchestrator.session.refresh_from_db()
+    assert educator_orchestrator.session.metadata["collection_name"] == "Legacy Quiz"
+
 
 @pytest.mark.django_db
 @patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.OpenEdXProcessor")
@@ -801,13 +803,16 @@ def test_save_skips_bad_questions(
     with patch(
         "openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.json_to_olx",
         side_effect=ValueError("bad"),
-    ), patch.object(educator_orchestrator, "_emit_workflow_event"):
+    ), patch.object(educator_orchestrator, "_emit_workflow_event"), patch(
+        "openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.logger"
+    ) as mock_logger:
         result = educator_orchestrator.save({
             "library_id": "lib:test:lib",
             "questions": [{"problem_type": "unknown"}],
         })
 
     assert result["status"] == "completed"
+    mock_logger.exception.assert_called_once_with("Error converting problem to OLX")
     mock_library.create_collection_and_add_items.assert_called_once_with(
         title="Quiz",
         description="AI-generated quiz questions",
@@ -815,6 +820,23 @@ def test_save_skips_bad_questions(
     )
 
 
+def test_quiz_response_format_is_loaded_once():
+    """
+    The quiz schema is parsed once per process and each caller gets its own copy.
+    """
+    direct_orchestrator._load_quiz_response_format.cache_clear()  # pylint: disable=protected-access
+    with patch(
+        "openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.json.load",
+        wraps=json.load,
+    ) as mock_load:
+        first = direct_orchestrator._quiz_response_format()  # pylint: disable=protected-access
+        second = direct_orchestrator._quiz_response_format()  # pylint: disable=protected-access
+
+    assert mock_load.call_count == 1
+    assert first == second
+    assert first is not second
+
+
 # ===========================================================================
 # json_to_olx  (lines 186-244)
 # ===========================================================================
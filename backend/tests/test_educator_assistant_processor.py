@@ -2,7 +2,7 @@
 Tests for EducatorAssistantProcessor — generate_quiz_questions and refine_quiz_question.
 """
 import json
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from django.contrib.auth import get_user_model
@@ -116,8 +116,8 @@ def test_refine_quiz_question_substitutes_placeholders(processor):  # pylint: di
 
     captured_prompts = []
 
-    def fake_call(prompt):
-        captured_prompts.append(prompt)
+    def fake_call(instructions, request=None):
+        captured_prompts.append(instructions + (request or ""))
         return {
             "response": llm_response,
         }
@@ -179,3 +179,54 @@ def test_generate_quiz_questions_success(processor):  # pylint: disable=redefine
     assert "error" not in result
     assert result["response"]["collection_name"] == "Python Basics"
     assert len(result["response"]["problems"]) == 1
+
+
+@pytest.mark.django_db
+def test_generate_quiz_questions_sends_static_instructions_as_system(processor):  # pylint: disable=redefined-outer-name
+    """
+    The template instructions go in the system message unchanged, so the prefix
+    is byte-identical across calls; content and author input go in the user message.
+    """
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = json.dumps({"collection_name": "Q", "problems": []})
+    mock_response.usage = None
+
+    with patch(
+        "openedx_ai_extensions.processors.llm.educator_assistant_processor.completion",
+        return_value=mock_response,
+    ) as mock_completion:
+        processor.generate_quiz_questions(input_data={"num_questions": 2, "extra_instructions": "Be brief"})
+        processor.generate_quiz_questions(input_data={"num_questions": 5, "extra_instructions": "Be long"})
+
+    first, second = (call.kwargs["messages"] for call in mock_completion.call_args_list)
+    assert [m["role"] for m in first] == ["system", "user"]
+    assert first[0] == second[0]
+    assert "{{" not in first[0]["content"]
+    assert "Course unit content about Python programming." in first[1]["content"]
+    assert "Be brief" in first[1]["content"]
+    assert "Be long" in second[1]["content"]
+
+
+@pytest.mark.django_db
+def test_render_prompt_without_sections_keeps_single_prompt(processor):  # pylint: disable=redefined-outer-name
+    """
+    Templates without a section before the first placeholder are rendered whole.
+    """
+    instructions, request = processor._render_prompt(  # pylint: disable=protected-access
+        "Quiz on {{CONTEXT}} with {{NUM_QUESTIONS}} questions", {"num_questions": 3},
+    )
+
+    assert instructions == "Quiz on Course unit content about Python programming. with 3 questions"
+    assert request == ""
+
+
+@pytest.mark.django_db
+def test_render_prompt_serializes_context_as_json(processor):  # pylint: disable=redefined-outer-name
+    """
+    Fetched course content is rendered as compact JSON rather than a Python repr.
+    """
+    processor.context = {"display_name": "Unit 1", "blocks": [{"text": "Café"}]}
+
+    instructions, _ = processor._render_prompt("Use {{CONTEXT}}", {})  # pylint: disable=protected-access
+
+    assert instructions == 'Use {"display_name":"Unit 1","blocks":[{"text":"Café"}]}'
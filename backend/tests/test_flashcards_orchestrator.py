@@ -3,14 +3,18 @@ Tests for flashcards_orchestrator.
 """
 # pylint: disable=protected-access
 
+import json
 from unittest.mock import Mock, mock_open, patch
 
 import pytest
 from django.contrib.auth import get_user_model
-from opaque_keys.edx.keys import CourseKey
 
 from openedx_ai_extensions.workflows.models import AIWorkflowProfile, AIWorkflowScope
 from openedx_ai_extensions.workflows.orchestrators.flashcards_orchestrator import FlashCardsOrchestrator
+from openedx_ai_extensions.workflows.orchestrators.session_based_orchestrator import (
+    _execute_orchestrator_async,
+    _patch_session_metadata,
+)
 
 User = get_user_model()
 
@@ -29,11 +33,6 @@ def user(db):  # pylint: disable=unused-argument
     )
 
 
-@pytest.fixture
-def course_key():
-    return CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
-
-
 @pytest.fixture
 def workflow_profile(db):  # pylint: disable=unused-argument
     return AIWorkflowProfile.objects.create(
@@ -713,7 +712,7 @@ def test_run_passes_content_and_input_data_to_llm(
         flashcards_orchestrator.run(input_data)
 
     call_kwargs = mock_llm.process.call_args[1]
-    assert call_kwargs["context"] == str(content_data)
+    assert json.loads(call_kwargs["context"]) == content_data
     assert call_kwargs["input_data"] == input_data
 
 
@@ -864,7 +863,7 @@ def test_scoped_run_async_stores_location_in_metadata(
     mock_task,
     workflow_scope,  # pylint: disable=redefined-outer-name
     user,  # pylint: disable=redefined-outer-name
-    course_key,  # pylint: disable=redefined-outer-name
+    course_key,
 ):
     """
     ScopedSessionOrchestrator.run_async persists the current location_id in
@@ -895,3 +894,45 @@ def test_scoped_run_async_stores_location_in_metadata(
     # location_id must be stored in metadata for the async task
     assert orchestrator.session.metadata["location_id"] == location
     assert orchestrator.session.metadata["task_status"] == "processing"
+
+
+@pytest.mark.django_db
+def test_patch_session_metadata_keeps_other_keys(
+    flashcards_orchestrator,  # pylint: disable=redefined-outer-name
+):
+    """
+    _patch_session_metadata replaces only the given keys, server-side.
+    """
+    session = flashcards_orchestrator.session
+    session.metadata = {"cards": [{"id": 1}], "task_status": "processing"}
+    session.save()
+
+    _patch_session_metadata(session.id, task_status="completed", task_result={"status": "completed"})
+
+    session.refresh_from_db()
+    assert session.metadata == {
+        "cards": [{"id": 1}],
+        "task_status": "completed",
+        "task_result": {"status": "completed"},
+    }
+
+
+@pytest.mark.django_db
+def test_execute_orchestrator_async_rejects_disallowed_action(
+    flashcards_orchestrator,  # pylint: disable=redefined-outer-name
+    django_assert_num_queries,
+):
+    """
+    Actions outside the async allow-list are rejected before the session is
+    loaded, and the session metadata is left untouched.
+    """
+    session = flashcards_orchestrator.session
+    session.metadata = {"task_status": "processing"}
+    session.save()
+
+    with django_assert_num_queries(0):
+        result = _execute_orchestrator_async.run(session.id, "clear_session")
+
+    assert result is None
+    session.refresh_from_db()
+    assert session.metadata == {"task_status": "processing"}
@@ -15,7 +15,6 @@ import pytest
 import settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import BlockUsageLocator
 from rest_framework.test import APIClient
 
@@ -37,6 +36,9 @@ User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
+UI_CONFIG_URL = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+WORKFLOWS_URL = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+
 
 @pytest.fixture
 def api_client():
@@ -55,13 +57,7 @@ def user(db):  # pylint: disable=unused-argument
 
 
 @pytest.fixture
-def course_key():
-    """Create and return a test course key."""
-    return CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
-
-
-@pytest.fixture
-def location_id(course_key):  # pylint: disable=redefined-outer-name
+def location_id(course_key):
     """Create and return a test location."""
     return BlockUsageLocator(course_key, block_type="vertical", block_id="test_unit_123")
 
@@ -73,7 +69,7 @@ def location_id(course_key):  # pylint: disable=redefined-outer-name
 
 @pytest.mark.django_db
 def test_summary_profile_integration(
-    api_client, user, course_key, location_id  # pylint: disable=redefined-outer-name,unused-argument
+    api_client, user, course_key, location_id  # pylint: disable=redefined-outer-name
 ):
     """
     Test complete flow for summary.json profile.
@@ -97,10 +93,10 @@ def test_summary_profile_integration(
     )
 
     # Authenticate
-    api_client.login(username="testuser", password="password123")
+    api_client.force_login(user)
 
     # Step 1: GET /config to retrieve configuration
-    config_url = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+    config_url = UI_CONFIG_URL
     context = json.dumps({
         "courseId": str(course_key),
         "locationId": str(location_id),
@@ -116,7 +112,7 @@ def test_summary_profile_integration(
     assert config_data["ui_components"]["request"]["component"] == "AIRequestComponent"
 
     # Step 2: POST /workflows to execute the workflow
-    workflows_url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+    workflows_url = WORKFLOWS_URL
 
     # Mock the actual AI and content fetching calls for streaming
     def mock_streaming_response():
@@ -172,7 +168,7 @@ def test_summary_profile_integration(
 
 @pytest.mark.django_db
 def test_mocked_completion_profile_integration(
-    api_client, user, course_key, location_id  # pylint: disable=redefined-outer-name,unused-argument
+    api_client, user, course_key, location_id  # pylint: disable=redefined-outer-name
 ):
     """
     Test complete flow for mocked_llm_completion.json profile.
@@ -196,10 +192,10 @@ def test_mocked_completion_profile_integration(
     )
 
     # Authenticate
-    api_client.login(username="testuser", password="password123")
+    api_client.force_login(user)
 
     # Step 1: GET /config
-    config_url = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+    config_url = UI_CONFIG_URL
     context = json.dumps({
         "courseId": str(course_key),
         "locationId": str(location_id),
@@ -215,7 +211,7 @@ def test_mocked_completion_profile_integration(
     assert config_data["ui_components"]["response"]["component"] == "AISidebarResponse"
 
     # Step 2: POST /workflows - MockResponse doesn't need any mocking
-    workflows_url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+    workflows_url = WORKFLOWS_URL
 
     workflow_payload = {
         "action": "run",
@@ -244,7 +240,7 @@ def test_mocked_completion_profile_integration(
 
 @pytest.mark.django_db
 def test_mocked_streaming_profile_integration(
-    api_client, user, course_key, location_id  # pylint: disable=redefined-outer-name,unused-argument
+    api_client, user, course_key, location_id  # pylint: disable=redefined-outer-name
 ):
     """
     Test complete flow for mocked_llm_streaming.json profile.
@@ -268,10 +264,10 @@ def test_mocked_streaming_profile_integration(
     )
 
     # Authenticate
-    api_client.login(username="testuser", password="password123")
+    api_client.force_login(user)
 
     # Step 1: GET /config
-    config_url = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+    config_url = UI_CONFIG_URL
     context = json.dumps({
         "courseId": str(course_key),
         "locationId": str(location_id),
@@ -286,7 +282,7 @@ def test_mocked_streaming_profile_integration(
     assert config_data["ui_components"]["response"]["component"] == "AISidebarResponse"
 
     # Step 2: POST /workflows - MockStreamResponse doesn't need any mocking
-    workflows_url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+    workflows_url = WORKFLOWS_URL
 
     workflow_payload = {
         "action": "run",
@@ -317,7 +313,7 @@ def test_mocked_streaming_profile_integration(
 
 @pytest.mark.django_db
 def test_library_questions_creator_profile_integration(
-    api_client, user, course_key, location_id  # pylint: disable=redefined-outer-name,unused-argument
+    api_client, user, course_key, location_id  # pylint: disable=redefined-outer-name
 ):
     """
     Test the two-phase iterative flow for library_questions_creator.json:
@@ -340,9 +336,9 @@ def test_library_questions_creator_profile_integration(
         ui_slot_selector_id="test-creator-slot",
     )
 
-    api_client.login(username="testuser", password="password123")
+    api_client.force_login(user)
 
-    config_url = reverse("openedx_ai_extensions:api:v1:aiext_ui_config")
+    config_url = UI_CONFIG_URL
     context = json.dumps({
         "courseId": str(course_key),
         "locationId": str(location_id),
@@ -358,7 +354,7 @@ def test_library_questions_creator_profile_integration(
     assert config_data["ui_components"]["request"]["component"] == "LibraryProblemCreator"
     assert config_data["ui_components"]["response"]["component"] == "LibraryProblemCreatorResponse"
 
-    workflows_url = reverse("openedx_ai_extensions:api:v1:aiext_workflows")
+    workflows_url = WORKFLOWS_URL
     query_string = urlencode({"context": context})
 
     problems = [
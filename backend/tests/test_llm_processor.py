@@ -10,7 +10,6 @@ from unittest.mock import Mock, mock_open, patch
 import pytest
 from django.contrib.auth import get_user_model
 from litellm.exceptions import BadRequestError
-from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import BlockUsageLocator
 
 from openedx_ai_extensions.functions.decorators import AVAILABLE_TOOLS
@@ -26,12 +25,6 @@ def user(db):  # pylint: disable=unused-argument
     return User.objects.create_user(username="testuser", email="test@example.com")
 
 
-@pytest.fixture
-def course_key():
-    """Create and return a test course key."""
-    return CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
-
-
 @pytest.fixture
 def workflow_profile(db):  # pylint: disable=unused-argument
     """Create and return a test workflow profile."""
@@ -612,6 +605,23 @@ def test_call_with_custom_prompt_function(
     assert messages[0]["content"] == custom_prompt_text
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize("function_name,expected", [
+    ("chat_with_context", True),
+    ("summarize_content", False),
+    (None, False),
+])
+def test_uses_chat_history(user_session, settings, function_name, expected):  # pylint: disable=redefined-outer-name
+    """
+    Test that only functions which send the conversation to the LLM report using chat history.
+    """
+    settings.AI_EXTENSIONS = {"default": {"MODEL": "openai/gpt-3.5-turbo", "API_KEY": "test-key"}}
+    config = {"LLMProcessor": {"function": function_name}}
+    processor = LLMProcessor(config=config, user_session=user_session)
+
+    assert processor.uses_chat_history() is expected
+
+
 @pytest.mark.django_db
 @patch("openedx_ai_extensions.processors.llm.llm_processor.completion")
 def test_call_with_custom_prompt_when_function_not_specified(
@@ -4,15 +4,23 @@ Tests for the `openedx-ai-extensions` models module.
 """
 
 import time
+from io import StringIO
 from unittest.mock import Mock, patch
 
 import pytest
+from django.apps import apps
 from django.contrib.auth import get_user_model
-from opaque_keys.edx.keys import CourseKey
+from django.core.management import call_command
 from opaque_keys.edx.locator import BlockUsageLocator
 
 from openedx_ai_extensions.models import PromptTemplate
-from openedx_ai_extensions.workflows.models import AIWorkflowProfile, AIWorkflowScope, AIWorkflowSession
+from openedx_ai_extensions.receivers import handle_post_migrate
+from openedx_ai_extensions.workflows.models import (
+    AIWorkflowProfile,
+    AIWorkflowProfileCompiled,
+    AIWorkflowScope,
+    AIWorkflowSession,
+)
 
 User = get_user_model()
 
@@ -40,14 +48,6 @@ def staff_user():
     )
 
 
-@pytest.fixture
-def course_key():
-    """
-    Create and return a test course key.
-    """
-    return CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
-
-
 @pytest.fixture
 def prompt_template():
     """
@@ -122,6 +122,27 @@ class TestPromptTemplate:
         result = PromptTemplate.load_prompt("not-a-real-slug-or-uuid-12345")
         assert result is None
 
+    def test_load_prompt_is_cached(self, prompt_template, django_assert_num_queries):
+        """Test a loaded prompt is served from the cache, for slug and UUID alike."""
+        PromptTemplate.load_prompt(prompt_template.slug)
+        PromptTemplate.load_prompt(str(prompt_template.id).replace('-', ''))
+
+        with django_assert_num_queries(0):
+            assert PromptTemplate.load_prompt(prompt_template.slug) == prompt_template.body
+            assert PromptTemplate.load_prompt(str(prompt_template.id)) == prompt_template.body
+
+    def test_load_prompt_cache_invalidated_on_save_and_delete(self, prompt_template):
+        """Test saving or deleting a template drops its cached body."""
+        assert PromptTemplate.load_prompt(prompt_template.slug) == prompt_template.body
+
+        prompt_template.body = "Updated body"
+        prompt_template.save()
+        assert PromptTemplate.load_prompt(prompt_template.slug) == "Updated body"
+        assert PromptTemplate.load_prompt(str(prompt_template.id)) == "Updated body"
+
+        prompt_template.delete()
+        assert PromptTemplate.load_prompt("test-prompt") is None
+
     def test_prompt_template_ordering(self):
         """Test that prompt templates are ordered by slug."""
         PromptTemplate.objects.create(slug="zebra", body="Z prompt")
@@ -193,6 +214,106 @@ class TestPromptTemplate:
         assert result == prompt_template.body
 
 
+# ============================================================================
+# AIWorkflowProfileCompiled Tests
+# ============================================================================
+
+
+@pytest.mark.django_db
+class TestAIWorkflowProfileCompiled:
+    """Tests for the precomputed effective configuration side table."""
+
+    def test_compiled_on_save(self):
+        """Saving a profile stores the merged configuration."""
+        profile = AIWorkflowProfile.objects.create(
+            slug="compiled-on-save",
+            base_filepath="base/summary.json",
+            content_patch='{"description": "patched"}',
+        )
+        compiled = AIWorkflowProfileCompiled.objects.get(profile=profile)
+        assert compiled.merged_json["description"] == "patched"
+        assert compiled.merged_json["orchestrator_class"] == "DirectLLMResponse"
+
+    def test_config_served_without_template_read(self):
+        """A fresh instance reads the stored config instead of the template file."""
+        profile = AIWorkflowProfile.objects.create(
+            slug="compiled-no-read",
+            base_filepath="base/summary.json",
+        )
+        fresh = AIWorkflowProfile.objects.get(pk=profile.pk)
+        with patch("openedx_ai_extensions.workflows.models.get_effective_config") as mock_effective:
+            config = fresh.config
+        mock_effective.assert_not_called()
+        assert config["orchestrator_class"] == "DirectLLMResponse"
+
+    def test_stale_compiled_config_is_recomputed(self):
+        """Changes that bypass save() are detected through the fingerprint, without writing on read."""
+        profile = AIWorkflowProfile.objects.create(
+            slug="compiled-stale",
+            base_filepath="base/summary.json",
+        )
+        stored_sha1 = AIWorkflowProfileCompiled.objects.get(profile=profile).sha1
+        AIWorkflowProfile.objects.filter(pk=profile.pk).update(content_patch='{"description": "bulk"}')
+
+        fresh = AIWorkflowProfile.objects.get(pk=profile.pk)
+        assert fresh.config["description"] == "bulk"
+        assert AIWorkflowProfileCompiled.objects.get(profile=profile).sha1 == stored_sha1
+
+    def test_compile_command_refreshes_stale_profiles(self):
+        """compile_workflow_profiles recompiles only profiles whose fingerprint changed."""
+        stale = AIWorkflowProfile.objects.create(slug="compiled-cmd-stale", base_filepath="base/summary.json")
+        AIWorkflowProfile.objects.create(slug="compiled-cmd-fresh", base_filepath="base/summary.json")
+        AIWorkflowProfile.objects.filter(pk=stale.pk).update(content_patch='{"description": "bulk"}')
+
+        out = StringIO()
+        call_command("compile_workflow_profiles", stdout=out)
+
+        assert AIWorkflowProfileCompiled.objects.get(profile=stale).merged_json["description"] == "bulk"
+        assert "Compiled 1 of 2 workflow profiles." in out.getvalue()
+
+    def test_post_migrate_compiles_missing_profiles(self):
+        """Profiles without a compiled row, e.g. created before the side table, are compiled after migrate."""
+        profile = AIWorkflowProfile.objects.create(slug="compiled-migrate", base_filepath="base/summary.json")
+        AIWorkflowProfileCompiled.objects.filter(profile=profile).delete()
+
+        handle_post_migrate(sender=apps.get_app_config("openedx_ai_extensions"), apps=apps)
+
+        assert AIWorkflowProfileCompiled.objects.get(profile=profile).merged_json["orchestrator_class"] == (
+            "DirectLLMResponse"
+        )
+
+    def test_resolved_scope_config_takes_one_query(self, course_key, django_assert_num_queries):
+        """get_profile joins the profile and its compiled row, so reading the config needs no extra queries."""
+        profile = AIWorkflowProfile.objects.create(slug="compiled-joined", base_filepath="base/summary.json")
+        AIWorkflowScope.objects.create(
+            course_id=course_key,
+            service_variant="lms",
+            profile=profile,
+            enabled=True,
+            ui_slot_selector_id="slot-compiled",
+        )
+
+        with django_assert_num_queries(1):
+            scope = AIWorkflowScope.get_profile(course_key, None, ui_slot_selector_id="slot-compiled")
+            config = scope.profile.config
+
+        assert config["orchestrator_class"] == "DirectLLMResponse"
+
+    def test_missing_template_compiles_to_none(self):
+        """Profiles pointing to a missing template keep a None config."""
+        profile = AIWorkflowProfile.objects.create(
+            slug="compiled-missing",
+            base_filepath="base/default.json",
+        )
+        assert AIWorkflowProfile.objects.get(pk=profile.pk).config is None
+
+    def test_unsaved_profile_does_not_compile(self):
+        """Unsaved profiles compute the config without touching the side table."""
+        profile = AIWorkflowProfile(slug="compiled-unsaved", base_filepath="base/summary.json")
+        assert profile.config["orchestrator_class"] == "DirectLLMResponse"
+        assert not AIWorkflowProfileCompiled.objects.exists()
+
+
 # ============================================================================
 # AIWorkflowSession Thread Tests
 # ============================================================================
@@ -569,8 +690,6 @@ class TestAIWorkflowSessionDebugThreads:
 class TestAIWorkflowScopeResolution:
     """Tests for AIWorkflowScope.get_profile resolution logic."""
 
-    # pylint: disable=redefined-outer-name
-
     @staticmethod
     def _create_profile(slug: str) -> AIWorkflowProfile:
         return AIWorkflowProfile.objects.create(
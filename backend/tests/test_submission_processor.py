@@ -3,26 +3,14 @@ Tests for the SubmissionProcessor module.
 """
 
 import json
-import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from opaque_keys.edx.keys import CourseKey
 
-# Mock the submissions module before any imports that depend on it
-sys.modules["submissions"] = MagicMock()
-sys.modules["submissions.api"] = MagicMock()
-
-from openedx_ai_extensions.processors.openedx.submission_processor import (  # noqa: E402 pylint: disable=wrong-import-position
-    SubmissionProcessor,
-)
-from openedx_ai_extensions.workflows.models import (  # noqa: E402 pylint: disable=wrong-import-position
-    AIWorkflowProfile,
-    AIWorkflowScope,
-    AIWorkflowSession,
-)
+from openedx_ai_extensions.processors.openedx.submission_processor import SubmissionProcessor
+from openedx_ai_extensions.workflows.models import AIWorkflowProfile, AIWorkflowScope, AIWorkflowSession
 
 User = get_user_model()
 
@@ -37,14 +25,6 @@ def user(db):  # pylint: disable=unused-argument
     )
 
 
-@pytest.fixture
-def course_key():
-    """
-    Create and return a test course key.
-    """
-    return CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
-
-
 @pytest.fixture
 def workflow_profile(db):  # pylint: disable=unused-argument
     """
@@ -495,6 +475,37 @@ def test_get_previous_messages_no_more_messages(
     assert metadata["new_count"] == 0
 
 
+@pytest.mark.django_db
+@patch("openedx_ai_extensions.processors.openedx.submission_processor.submissions_api")
+def test_get_previous_messages_stops_parsing_past_window(
+    mock_submissions_api, submission_processor  # pylint: disable=redefined-outer-name
+):
+    """
+    Test that submissions older than the requested window are never decoded.
+    """
+    submission_processor.max_context_messages = 2
+    mock_submissions = [
+        {
+            "uuid": f"submission-{i}",
+            "answer": json.dumps([{"role": "user", "content": f"Message {i}"}]),
+            "created_at": f"2025-01-01T00:{i:02d}:00Z",
+        }
+        for i in range(10, 2, -1)
+    ]
+    # The oldest submissions are unreadable; touching them would raise
+    mock_submissions += [
+        {"uuid": "submission-2", "answer": "not json", "created_at": ""},
+        {"uuid": "submission-1", "answer": "not json", "created_at": ""},
+    ]
+    mock_submissions_api.get_submissions.return_value = mock_submissions
+
+    result = submission_processor.get_previous_messages(current_messages_count=2)
+
+    response_data = json.loads(result["response"])
+    assert [m["content"] for m in response_data["messages"]] == ["Message 7", "Message 8"]
+    assert response_data["metadata"]["has_more"] is True
+
+
 # ============================================================================
 # SubmissionProcessor.update_chat_submission() Tests
 # ============================================================================
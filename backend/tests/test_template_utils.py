@@ -1,18 +1,22 @@
 """
 Tests for openedx_ai_extensions.workflows.template_utils module.
 """
+import os
 import shutil
 import tempfile
 from pathlib import Path
+from unittest import mock
 
 from django.test import TestCase, override_settings
 
 from openedx_ai_extensions.models import PromptTemplate
 from openedx_ai_extensions.workflows.template_utils import (
     WORKFLOW_SCHEMA,
+    _parse_json5,
     _validate_prompt_templates,
     _validate_semantics,
     discover_templates,
+    get_config_fingerprint,
     get_effective_config,
     get_template_directories,
     is_safe_template_path,
@@ -191,6 +195,22 @@ class TestDiscoverTemplates(TestCase):
             nested = [t for t in templates if 'category' in t[0]]
             self.assertGreater(len(nested), 0)
 
+    def test_discovery_is_cached_until_directory_changes(self):
+        """Test that discovery is reused until a walked directory changes."""
+        with override_settings(WORKFLOW_TEMPLATE_DIRS=[self.tmpdir]):
+            first = discover_templates()
+
+            with mock.patch("openedx_ai_extensions.workflows.template_utils.os.scandir") as mock_scandir:
+                self.assertEqual(discover_templates(), first)
+                mock_scandir.assert_not_called()
+
+            nested_dir = self.temp_path / "category"
+            stat = nested_dir.stat()
+            (nested_dir / "template4.json").write_text('{}')
+            os.utime(nested_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+            self.assertEqual(len(discover_templates()), 4)
+
 
 class TestLoadTemplate(TestCase):
     """Tests for load_template function."""
@@ -255,6 +275,28 @@ class TestLoadTemplate(TestCase):
             self.assertIsNotNone(data)
             self.assertIn("orchestrator_class", data)
 
+    def test_load_template_is_cached_until_file_changes(self):
+        """Test that templates are parsed once per mtime and returned as copies."""
+        with override_settings(WORKFLOW_TEMPLATE_DIRS=[self.tmpdir]):
+            with mock.patch(
+                "openedx_ai_extensions.workflows.template_utils._parse_json5",
+                wraps=_parse_json5,
+            ) as mock_load:
+                first = load_template("valid.json")
+                first["orchestrator_class"] = "Mutated"
+                second = load_template("valid.json")
+
+                self.assertEqual(mock_load.call_count, 1)
+                self.assertEqual(second["orchestrator_class"], "TestOrchestrator")
+
+                stat = self.valid_template.stat()
+                self.valid_template.write_text('{"orchestrator_class": "Changed"}')
+                os.utime(self.valid_template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+                third = load_template("valid.json")
+
+                self.assertEqual(mock_load.call_count, 2)
+                self.assertEqual(third["orchestrator_class"], "Changed")
+
 
 class TestParseJson5String(TestCase):
     """Tests for parse_json5_string function."""
@@ -292,6 +334,14 @@ class TestParseJson5String(TestCase):
         self.assertEqual(result["key"], "value")
         self.assertEqual(result["list"], [1, 2, 3])
 
+    def test_parse_standard_json_skips_json5(self):
+        """Test that plain JSON is parsed without falling back to json5."""
+        with mock.patch("openedx_ai_extensions.workflows.template_utils.json5.loads") as mock_loads:
+            result = parse_json5_string('{"key": "value"}')
+
+        self.assertEqual(result, {"key": "value"})
+        mock_loads.assert_not_called()
+
 
 class TestMergeTemplateWithPatch(TestCase):
     """Tests for merge_template_with_patch function."""
@@ -349,11 +399,22 @@ class TestMergeTemplateWithPatch(TestCase):
         patch = {"b": None}
         result = merge_template_with_patch(base, patch)
 
-        # jsonmerge preserves None values by default
+        # None values in the patch are preserved, not treated as deletions
         self.assertEqual(result["a"], 1)
         self.assertEqual(result["b"], None)
         self.assertEqual(result["c"], 3)
 
+    def test_merge_does_not_mutate_base(self):
+        """Test that nested levels of the base template are left untouched."""
+        base = {"processor_config": {"LLMProcessor": {"model": "gpt-4"}}, "list": [1, 2]}
+        patch = {"processor_config": {"LLMProcessor": {"model": "gpt-5"}}, "list": [3]}
+        result = merge_template_with_patch(base, patch)
+
+        self.assertEqual(result["processor_config"]["LLMProcessor"]["model"], "gpt-5")
+        self.assertEqual(result["list"], [3])
+        self.assertEqual(base["processor_config"]["LLMProcessor"]["model"], "gpt-4")
+        self.assertEqual(base["list"], [1, 2])
+
 
 class TestValidateWorkflowConfig(TestCase):
     """Tests for validate_workflow_config function."""
@@ -559,6 +620,20 @@ class TestValidateWorkflowConfig(TestCase):
         self.assertFalse(is_valid)
         self.assertTrue(any("actuator_config" in err for err in errors))
 
+    def test_validate_wrong_type_reported_once(self):
+        """Test that a wrongly typed key gets only its schema error."""
+        config = {
+            "schema_version": "1.0",
+            "orchestrator_class": 42,
+            "processor_config": {"LLMProcessor": {}},
+            "actuator_config": {"UIComponents": {"request": {}, "response": {}}}
+        }
+        is_valid, errors = validate_workflow_config(config)
+
+        self.assertFalse(is_valid)
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(errors[0].startswith("orchestrator_class:"))
+
     def test_validate_ui_components_not_dict(self):
         """Test that non-dict UIComponents is invalid."""
         config = {
@@ -839,6 +914,19 @@ class TestGetEffectiveConfig(TestCase):
             self.assertIsNotNone(config)
             self.assertEqual(config["orchestrator_class"], "BaseOrchestrator")
 
+    def test_config_fingerprint_follows_template_contents(self):
+        """Test the fingerprint ignores mtime-only changes but not content changes."""
+        with override_settings(WORKFLOW_TEMPLATE_DIRS=[self.tmpdir]):
+            original = get_config_fingerprint("base.json", "{}")
+
+            stat = self.base_template.stat()
+            os.utime(self.base_template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            self.assertEqual(get_config_fingerprint("base.json", "{}"), original)
+
+            self.base_template.write_text('{"orchestrator_class": "Changed"}')
+            os.utime(self.base_template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2))
+            self.assertNotEqual(get_config_fingerprint("base.json", "{}"), original)
+
 
 class TestValidateAllProfiles(TestCase):
     """Tests to validate all profile templates in the codebase."""
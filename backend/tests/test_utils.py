@@ -2,7 +2,9 @@
 Tests for utility functions in openedx_ai_extensions.
 """
 
-from openedx_ai_extensions.utils import is_generator, normalize_input_to_text
+from opaque_keys.edx.keys import CourseKey
+
+from openedx_ai_extensions.utils import is_generator, normalize_input_to_text, serialize_context
 
 
 def test_normalize_input_to_text_with_string():
@@ -34,3 +36,13 @@ def test_is_generator():
     assert is_generator(gen) is True
     assert is_generator([1, 2, 3]) is False
     assert is_generator(123) is False
+
+
+def test_serialize_context_with_string():
+    assert serialize_context("plain text") == "plain text"
+
+
+def test_serialize_context_with_dict():
+    course_key = CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
+    result = serialize_context({"course_id": course_key, "content": "Olá"})
+    assert result == '{"course_id":"course-v1:edX+DemoX+Demo_Course","content":"Olá"}'
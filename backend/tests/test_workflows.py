@@ -3,26 +3,23 @@ Tests for the `openedx-ai-extensions` workflows module.
 """
 
 import inspect
-import sys
-from unittest.mock import MagicMock, Mock, patch
+import threading
+from unittest.mock import Mock, patch
 
 import pytest
 from django.contrib.auth import get_user_model
-from opaque_keys.edx.keys import CourseKey
+from django.core.cache import cache
+from django.test import override_settings
 from opaque_keys.edx.locator import BlockUsageLocator
 
 from openedx_ai_extensions.workflows.models import AIWorkflowProfile, AIWorkflowScope, AIWorkflowSession
-from openedx_ai_extensions.workflows.orchestrators import BaseOrchestrator
+from openedx_ai_extensions.workflows.orchestrators import BaseOrchestrator, direct_orchestrator
 from openedx_ai_extensions.workflows.orchestrators.direct_orchestrator import DirectLLMResponse
 from openedx_ai_extensions.workflows.orchestrators.mock_orchestrator import MockResponse, MockStreamResponse
 from openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator import ThreadedLLMResponse
 
 User = get_user_model()
 
-# Mock the submissions module before any imports that depend on it
-sys.modules["submissions"] = MagicMock()
-sys.modules["submissions.api"] = MagicMock()
-
 
 @pytest.fixture
 def user(db):  # pylint: disable=unused-argument
@@ -34,14 +31,6 @@ def user(db):  # pylint: disable=unused-argument
     )
 
 
-@pytest.fixture
-def course_key():
-    """
-    Create and return a test course key.
-    """
-    return CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
-
-
 @pytest.fixture
 def workflow_profile(db):  # pylint: disable=unused-argument
     """
@@ -131,7 +120,7 @@ def test_workflow_scope_str(workflow_scope, course_key):  # pylint: disable=rede
 
 
 @pytest.mark.django_db
-def test_workflow_scope_get_profile(course_key):  # pylint: disable=redefined-outer-name
+def test_workflow_scope_get_profile(course_key):
     """
     Test AIWorkflowScope.get_profile class method.
     """
@@ -344,6 +333,28 @@ def test_mock_stream_response_orchestrator(workflow_scope, user):  # pylint: dis
     assert "real-time consumption" in full_response
 
 
+@pytest.mark.django_db
+@override_settings(AI_EXTENSIONS_MOCK_STREAM_DELAY=0)
+@patch("openedx_ai_extensions.workflows.orchestrators.mock_orchestrator.time.sleep")
+def test_mock_stream_response_orchestrator_without_delay(
+    mock_sleep,
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+):
+    """
+    Test MockStreamResponse streams without sleeping when the delay is disabled.
+    """
+    workflow_scope.action = "test_action"
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+
+    chunks = list(MockStreamResponse(workflow=workflow_scope, user=user, context=context).run({}))
+
+    mock_sleep.assert_not_called()
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 15 for chunk in chunks)
+    assert b"".join(chunks).startswith(b"This streaming function")
+
+
 @pytest.mark.django_db
 @patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.OpenEdXProcessor")
 @patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.LLMProcessor")
@@ -384,6 +395,141 @@ def test_direct_llm_response_orchestrator_success(
     assert result["response"] == "This is a summary"
 
 
+@pytest.mark.django_db
+@patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.OpenEdXProcessor")
+@patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.LLMProcessor")
+def test_direct_llm_response_orchestrator_response_cache(
+    mock_llm_processor_class,
+    mock_openedx_processor_class,
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+):
+    """
+    Test DirectLLMResponse serves identical requests from the response cache.
+    """
+    workflow_scope.profile.content_patch = (
+        '{"processor_config": {"LLMProcessor": {"stream": false, "response_cache_ttl": 60}}}'
+    )
+    workflow_scope.profile.save()
+
+    mock_openedx = Mock()
+    mock_openedx.process.return_value = {"location_id": "unit-123", "blocks": []}
+    mock_openedx_processor_class.return_value = mock_openedx
+
+    mock_llm = Mock()
+    mock_llm.process.return_value = {"response": "Cached summary"}
+    mock_llm.get_usage.return_value = None
+    mock_llm_processor_class.return_value = mock_llm
+
+    workflow_scope.action = "run"
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+
+    first = DirectLLMResponse(workflow=workflow_scope, user=user, context=context).run({"text": "hi"})
+    second = DirectLLMResponse(workflow=workflow_scope, user=user, context=context).run({"text": "hi"})
+    padded = DirectLLMResponse(workflow=workflow_scope, user=user, context=context).run({"text": "  hi \n"})
+    other = DirectLLMResponse(workflow=workflow_scope, user=user, context=context).run({"text": "bye"})
+
+    assert first == second == padded == {"response": "Cached summary", "status": "completed"}
+    assert other["response"] == "Cached summary"
+    # Repeats differing only in surrounding whitespace are cache hits; a different user input is a miss.
+    assert mock_llm.process.call_count == 2
+
+
+def test_direct_llm_cache_key_is_case_sensitive():
+    """
+    Test inputs that differ only in letter case or inner spacing get separate cache keys.
+    """
+    config = {"LLMProcessor": {"response_cache_ttl": 60}}
+    key = direct_orchestrator._llm_cache_key  # pylint: disable=protected-access
+
+    assert key(config, "[]", {"text": "Foo"}) != key(config, "[]", {"text": "foo"})
+    assert key(config, "[]", {"text": "a  b"}) != key(config, "[]", {"text": "a b"})
+    assert key(config, "[]", {"text": " Foo\n"}) == key(config, "[]", {"text": "Foo"})
+
+
+@pytest.mark.django_db
+@patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.time.sleep")
+@patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.OpenEdXProcessor")
+@patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.LLMProcessor")
+def test_direct_llm_response_orchestrator_coalesces_concurrent_requests(
+    mock_llm_processor_class,
+    mock_openedx_processor_class,
+    mock_sleep,
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+):
+    """
+    Test a request that finds an identical one in flight waits for its cached
+    result instead of calling the LLM, and that the leader releases its lock.
+    """
+    workflow_scope.profile.content_patch = (
+        '{"processor_config": {"LLMProcessor": {"stream": false, "response_cache_ttl": 60}}}'
+    )
+    workflow_scope.profile.save()
+    mock_openedx_processor_class.return_value.process.return_value = {"blocks": []}
+    mock_llm = Mock()
+    mock_llm.process.return_value = {"response": "Shared summary"}
+    mock_llm.get_usage.return_value = None
+    mock_llm_processor_class.return_value = mock_llm
+
+    workflow_scope.action = "run"
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+    cache_key = direct_orchestrator._llm_cache_key(  # pylint: disable=protected-access
+        workflow_scope.profile.processor_config, '{"blocks":[]}', {"text": "hi"}
+    )
+
+    # Another request holds the lock and stores its result while we wait
+    direct_orchestrator._acquire_coalesce_lock(cache_key)  # pylint: disable=protected-access
+    mock_sleep.side_effect = lambda _: cache.set(
+        cache_key, {"response": "Leader summary", "status": "completed"}
+    )
+    follower = DirectLLMResponse(workflow=workflow_scope, user=user, context=context).run({"text": "hi"})
+
+    assert follower == {"response": "Leader summary", "status": "completed"}
+    mock_llm.process.assert_not_called()
+
+    # As the leader, the lock is released once the response is cached
+    leader = DirectLLMResponse(workflow=workflow_scope, user=user, context=context).run({"text": "bye"})
+    assert leader["response"] == "Shared summary"
+    leader_key = direct_orchestrator._llm_cache_key(  # pylint: disable=protected-access
+        workflow_scope.profile.processor_config, '{"blocks":[]}', {"text": "bye"}
+    )
+    assert cache.get(direct_orchestrator._coalesce_lock_key(leader_key)) is None  # pylint: disable=protected-access
+
+
+@pytest.mark.django_db
+@patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.OpenEdXProcessor")
+@patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.LLMProcessor")
+def test_direct_llm_response_orchestrator_streaming_not_cached(
+    mock_llm_processor_class,
+    mock_openedx_processor_class,
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+):
+    """
+    Test DirectLLMResponse never caches streaming profiles.
+    """
+    workflow_scope.profile.content_patch = '{"processor_config": {"LLMProcessor": {"response_cache_ttl": 60}}}'
+    workflow_scope.profile.save()
+
+    mock_openedx = Mock()
+    mock_openedx.process.return_value = {"location_id": "unit-123", "blocks": []}
+    mock_openedx_processor_class.return_value = mock_openedx
+
+    mock_llm = Mock()
+    mock_llm.process.return_value = {"response": "Fresh summary"}
+    mock_llm.get_usage.return_value = None
+    mock_llm_processor_class.return_value = mock_llm
+
+    workflow_scope.action = "run"
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+
+    DirectLLMResponse(workflow=workflow_scope, user=user, context=context).run({})
+    DirectLLMResponse(workflow=workflow_scope, user=user, context=context).run({})
+
+    assert mock_llm.process.call_count == 2
+
+
 @pytest.mark.django_db
 @patch("openedx_ai_extensions.workflows.orchestrators.direct_orchestrator.OpenEdXProcessor")
 def test_direct_llm_response_orchestrator_openedx_error(
@@ -568,6 +714,183 @@ def test_threaded_llm_response_orchestrator_new_session(
     assert mock_submission.update_chat_submission.called
 
 
+@pytest.mark.django_db
+@patch("openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator.OpenEdXProcessor")
+@patch("openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator.LLMProcessor")
+@patch("openedx_ai_extensions.workflows.orchestrators.session_based_orchestrator.SubmissionProcessor")
+def test_threaded_llm_response_saves_messages_in_order(
+    mock_submission_processor_class,
+    mock_responses_processor_class,
+    mock_openedx_processor_class,
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+):
+    """
+    Test system messages are saved first and in order, followed by the user and assistant turns.
+    """
+    mock_openedx_processor_class.return_value.process.return_value = {"location_id": "unit-123"}
+    mock_responses = Mock()
+    mock_responses.process.return_value = {
+        "response": "Answer",
+        "system_messages": [
+            {"role": "system", "content": "first"},
+            {"role": "system", "content": "second"},
+        ],
+    }
+    mock_responses.get_usage.return_value = None
+    mock_responses.uses_chat_history.return_value = False
+    mock_responses_processor_class.return_value = mock_responses
+    mock_submission = Mock()
+    mock_submission_processor_class.return_value = mock_submission
+
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+    orchestrator = ThreadedLLMResponse(workflow=workflow_scope, user=user, context=context)
+    orchestrator.run("Question")
+
+    # The configured function ignores history, so it is never loaded
+    mock_submission.get_full_message_history.assert_not_called()
+    assert mock_responses.process.call_args[1]["chat_history"] == []
+    mock_submission.update_chat_submission.assert_called_once_with([
+        {"role": "system", "content": "first"},
+        {"role": "system", "content": "second"},
+        {"role": "user", "content": "Question"},
+        {"role": "assistant", "content": "Answer"},
+    ])
+
+
+@pytest.mark.django_db
+@override_settings(AI_EXTENSIONS_PREFETCH_CONTENT=True)
+@patch("openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator.OpenEdXProcessor")
+@patch("openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator.LLMProcessor")
+@patch("openedx_ai_extensions.workflows.orchestrators.session_based_orchestrator.SubmissionProcessor")
+def test_threaded_llm_response_prefetches_content(
+    mock_submission_processor_class,
+    mock_responses_processor_class,
+    mock_openedx_processor_class,
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+):
+    """
+    Test that with prefetching enabled the OpenEdX content is fetched on a pool thread
+    and still handed to the LLM processor.
+    """
+    fetch_threads = []
+
+    def fetch_content():
+        fetch_threads.append(threading.current_thread())
+        return {"display_name": "Unit"}
+
+    mock_openedx_processor_class.return_value.process.side_effect = fetch_content
+    mock_responses = Mock()
+    mock_responses.process.return_value = {"response": "Answer"}
+    mock_responses.get_usage.return_value = None
+    mock_responses_processor_class.return_value = mock_responses
+    mock_submission_processor_class.return_value = Mock()
+
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+    orchestrator = ThreadedLLMResponse(workflow=workflow_scope, user=user, context=context)
+    result = orchestrator.run("Question")
+
+    assert result["response"] == "Answer"
+    assert fetch_threads and fetch_threads[0] is not threading.current_thread()
+    assert mock_responses.process.call_args[1]["context"] == '{"display_name":"Unit"}'
+
+
+@pytest.mark.django_db
+@patch("openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator.OpenEdXProcessor")
+@patch("openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator.LLMProcessor")
+@patch("openedx_ai_extensions.workflows.orchestrators.session_based_orchestrator.SubmissionProcessor")
+def test_threaded_llm_response_skips_empty_turn(
+    mock_submission_processor_class,
+    mock_responses_processor_class,
+    mock_openedx_processor_class,
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+):
+    """
+    Test that a turn with neither user input nor an LLM response is not written to submissions.
+    """
+    mock_openedx_processor_class.return_value.process.return_value = {}
+    mock_responses = Mock()
+    mock_responses.process.return_value = {"response": ""}
+    mock_responses.get_usage.return_value = None
+    mock_responses_processor_class.return_value = mock_responses
+    mock_submission = Mock()
+    mock_submission_processor_class.return_value = mock_submission
+
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+    orchestrator = ThreadedLLMResponse(workflow=workflow_scope, user=user, context=context)
+    result = orchestrator.run("")
+
+    mock_submission.update_chat_submission.assert_not_called()
+    assert result == {"response": "No response available", "status": "completed"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("input_data,expected_count", [
+    ({"current_messages": 4}, 4),
+    ('{"current_messages": 6}', 6),
+    (b'{"current_messages": 8}', 8),
+    (10, 10),
+    ("not json", 0),
+    ("[1, 2]", 0),
+    ("", 0),
+    (None, 0),
+])
+@patch("openedx_ai_extensions.workflows.orchestrators.session_based_orchestrator.SubmissionProcessor")
+def test_threaded_llm_response_lazy_load_chat_history(
+    mock_submission_processor_class,
+    input_data,
+    expected_count,
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+):
+    """
+    Test lazy_load_chat_history reads the loaded message count from each supported input shape.
+    """
+    mock_submission = Mock()
+    mock_submission.get_previous_messages.return_value = {"response": '{"messages": []}'}
+    mock_submission_processor_class.return_value = mock_submission
+
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+    orchestrator = ThreadedLLMResponse(workflow=workflow_scope, user=user, context=context)
+    result = orchestrator.lazy_load_chat_history(input_data)
+
+    mock_submission.get_previous_messages.assert_called_once_with(expected_count)
+    assert result == {"response": '{"messages": []}', "status": "completed"}
+
+
+@pytest.mark.django_db
+@patch("openedx_ai_extensions.workflows.orchestrators.session_based_orchestrator.SubmissionProcessor")
+def test_threaded_llm_response_stream_saves_history(
+    mock_submission_processor_class,
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+):
+    """
+    Test streamed chunks are saved as one decoded response, even when a
+    multi-byte character is split across chunks.
+    """
+    mock_submission = Mock()
+    mock_submission_processor_class.return_value = mock_submission
+
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+    orchestrator = ThreadedLLMResponse(workflow=workflow_scope, user=user, context=context)
+
+    encoded = "Olá, ".encode("utf-8")
+    chunks = [encoded[:3], encoded[3:], "mundo"]
+    stream = orchestrator._stream_and_save_history(  # pylint: disable=protected-access
+        generator=iter(chunks),
+        input_data="Hi",
+        submission_processor=mock_submission,
+        provider="openai",
+    )
+
+    assert list(stream) == chunks
+    saved = mock_submission.update_chat_submission.call_args[0][0]
+    assert saved[-1] == {"role": "assistant", "content": "Olá, mundo"}
+
+
 @pytest.mark.django_db
 @patch("openedx_ai_extensions.workflows.orchestrators.session_based_orchestrator.SubmissionProcessor")
 @patch("openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator.LLMProcessor")
@@ -606,6 +929,70 @@ def test_threaded_llm_response_orchestrator_clear_session(
     assert not AIWorkflowSession.objects.filter(id=session.id).exists()
 
 
+@pytest.mark.django_db
+def test_session_based_orchestrator_attaches_lookup_instances(
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+    django_assert_num_queries,
+):
+    """
+    Test the session reuses the orchestrator's user, scope and profile instead of re-querying them.
+    """
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+    # The first orchestrator creates the session, the second one loads it
+    _ = ThreadedLLMResponse(workflow=workflow_scope, user=user, context=context).session
+    session = ThreadedLLMResponse(workflow=workflow_scope, user=user, context=context).session
+
+    with django_assert_num_queries(0):
+        assert session.user.id == user.id
+        assert session.scope is workflow_scope
+        assert session.profile is workflow_scope.profile
+
+
+@pytest.mark.django_db
+def test_session_based_orchestrator_status_message_single_update(
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+    django_assert_num_queries,
+):
+    """
+    Test status messages are persisted with one UPDATE and unchanged messages are not rewritten.
+    """
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+    orchestrator = ThreadedLLMResponse(workflow=workflow_scope, user=user, context=context)
+    session = orchestrator.session
+
+    with django_assert_num_queries(1):
+        orchestrator._set_status_message("Fetching content...")  # pylint: disable=protected-access
+    with django_assert_num_queries(0):
+        orchestrator._set_status_message("Fetching content...")  # pylint: disable=protected-access
+
+    session.refresh_from_db()
+    assert session.metadata["task_status_message"] == "Fetching content..."
+
+
+@pytest.mark.django_db
+def test_session_based_orchestrator_loads_session_lazily(
+    workflow_scope,  # pylint: disable=redefined-outer-name
+    user,  # pylint: disable=redefined-outer-name
+    django_assert_num_queries,
+):
+    """
+    Test the session is not queried on construction and read-only actions never create it.
+    """
+    context = {"location_id": None, "course_id": workflow_scope.course_id}
+
+    with django_assert_num_queries(0):
+        orchestrator = ThreadedLLMResponse(workflow=workflow_scope, user=user, context=context)
+
+    assert orchestrator.get_run_status({}) == {"status": "idle"}
+    assert orchestrator.clear_session({})["status"] == "session_cleared"
+    assert not AIWorkflowSession.objects.filter(user=user).exists()
+
+    session = orchestrator.session
+    assert AIWorkflowSession.objects.filter(pk=session.pk).exists()
+
+
 @pytest.mark.django_db
 @patch("openedx_ai_extensions.workflows.orchestrators.threaded_orchestrator.LLMProcessor")
 @patch("openedx_ai_extensions.workflows.orchestrators.session_based_orchestrator.SubmissionProcessor")
@@ -614,7 +1001,7 @@ def test_threaded_llm_response_orchestrator_get_history(
     mock_responses_processor_class,
     workflow_scope,  # pylint: disable=redefined-outer-name
     user,  # pylint: disable=redefined-outer-name
-    course_key,  # pylint: disable=redefined-outer-name
+    course_key,
 ):
     """
     Test ThreadedLLMResponse orchestrator retrieving chat history.
@@ -658,7 +1045,7 @@ def test_threaded_llm_response_orchestrator_history_error(
     mock_responses_processor_class,
     workflow_scope,  # pylint: disable=redefined-outer-name
     user,  # pylint: disable=redefined-outer-name
-    course_key,  # pylint: disable=redefined-outer-name
+    course_key,
 ):
     """
     Test ThreadedLLMResponse orchestrator with error retrieving history.